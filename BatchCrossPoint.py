@@ -0,0 +1,139 @@
+"""線分の交点の一括計算モジュール
+
+線分の組のリストに対して、交点と交点の状態を NumPy のベクトル演算で一括して求める
+格子状のバケットの候補の組や検証用の総当たりなど、組が明示的に与えられる場合に用いる
+
+交点の状態・座標は、組ごとに LineSegment.getCrossPoint を呼び出した場合と同じになる
+向きの判定は Predicates と同じ前進誤差限界で行い、符号が確定しない組のみ Predicates で厳密に求め直す
+
+numpy が必要
+"""
+
+import numpy as np
+from LineSegment import AnyLineSegment, CrossPointStatus, LineSegment, _lineCrossPoint
+from Point import Point
+from Predicates import _CROSS_ERR_BOUND, _crossSign
+
+# 交点の状態のコード（CrossPointStatus の値）
+_PARALLEL: int = CrossPointStatus.PARALLEL.value
+_ON_LINE: int = CrossPointStatus.ON_LINE.value
+_ON_LINE_OVERLAP: int = CrossPointStatus.ON_LINE_OVERLAP.value
+_ON_LINE_INCLUDED: int = CrossPointStatus.ON_LINE_INCLUDED.value
+_EXIST: int = CrossPointStatus.EXIST.value
+_OUT_OF_LINESEGMENT: int = CrossPointStatus.OUT_OF_LINESEGMENT.value
+
+def segmentArray(lses: list[AnyLineSegment]) -> np.ndarray:
+    """線分のリストを座標の配列に変換する
+
+    Args:
+        lses: 線分のリスト
+
+    Returns:
+        (線分数, 4) の配列, 各行は 端点１の x, y, 端点２の x, y
+    """
+    return np.array([(ls.pt1.x, ls.pt1.y, ls.pt2.x, ls.pt2.y) for ls in lses], dtype=np.float64).reshape(-1, 4)
+
+def _crossSigns(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                x3: np.ndarray, y3: np.ndarray, x4: np.ndarray, y4: np.ndarray) -> np.ndarray:
+    """ベクトル (x2 - x1, y2 - y1) と (x4 - x3, y4 - y3) の外積の符号
+
+    Predicates._crossSign のベクトル版, 誤差限界内の要素のみ Predicates._crossSign で求め直す
+
+    Returns:
+        外積の符号（1, -1, 0）の配列
+    """
+    left: np.ndarray = (x2 - x1) * (y4 - y3)
+    right: np.ndarray = (y2 - y1) * (x4 - x3)
+    det: np.ndarray = left - right
+    signs: np.ndarray = np.sign(det).astype(np.int8)
+
+    uncertain: np.ndarray = np.flatnonzero(~(np.abs(det) > _CROSS_ERR_BOUND * (np.abs(left) + np.abs(right))))
+    if len(uncertain) > 0:
+        # numpy のスカラーより演算が速いため、Python の float として渡す
+        args = zip(*(v[uncertain].tolist() for v in (x1, y1, x2, y2, x3, y3, x4, y4)))
+        signs[uncertain] = [_crossSign(*a) for a in args]
+    return signs
+
+def _inside(x: np.ndarray, y: np.ndarray,
+            minx: np.ndarray, maxx: np.ndarray, miny: np.ndarray, maxy: np.ndarray) -> np.ndarray:
+    """点が外接矩形内にあるか否か（LineSegment.isInsideRectangle のベクトル版）
+    """
+    return (minx <= x) & (x <= maxx) & (miny <= y) & (y <= maxy)
+
+def calcCrossPoints(segs1: np.ndarray, segs2: np.ndarray,
+                    idx1: np.ndarray, idx2: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """線分の組の交点を一括して求める
+
+    i 番目の組は segs1[idx1[i]] と segs2[idx2[i]] で、
+    LineSegment(segs1[idx1[i]]).getCrossPoint(LineSegment(segs2[idx2[i]])) と同じ結果を返す
+
+    Args:
+        segs1: 一方の線分の集合, (線分数, 4) の配列（segmentArray を参照）
+        segs2: もう一方の線分の集合, (線分数, 4) の配列
+        idx1: 組ごとの segs1 の添字の配列
+        idx2: 組ごとの segs2 の添字の配列, idx1 と同じ長さ
+
+    Returns:
+        交点の x 座標の配列, y 座標の配列, 交点の状態（CrossPointStatus の値）の配列
+        交点がない組の座標は nan
+    """
+    s1: np.ndarray = np.asarray(segs1, dtype=np.float64)[np.asarray(idx1)]
+    s2: np.ndarray = np.asarray(segs2, dtype=np.float64)[np.asarray(idx2)]
+    px1, py1, px2, py2 = s1.T
+    qx1, qy1, qx2, qy2 = s2.T
+    n: int = len(s1)
+
+    minx1, maxx1 = np.minimum(px1, px2), np.maximum(px1, px2)
+    miny1, maxy1 = np.minimum(py1, py2), np.maximum(py1, py2)
+    minx2, maxx2 = np.minimum(qx1, qx2), np.maximum(qx1, qx2)
+    miny2, maxy2 = np.minimum(qy1, qy2), np.maximum(qy1, qy2)
+
+    # 一方の線分を含む直線に対する、他方の線分の端点の向き
+    o1: np.ndarray = _crossSigns(px1, py1, px2, py2, px1, py1, qx1, qy1)
+    o2: np.ndarray = _crossSigns(px1, py1, px2, py2, px1, py1, qx2, qy2)
+    o3: np.ndarray = _crossSigns(qx1, qy1, qx2, qy2, qx1, qy1, px1, py1)
+    o4: np.ndarray = _crossSigns(qx1, qy1, qx2, qy2, qx1, qy1, px2, py2)
+
+    parallel: np.ndarray = _crossSigns(px1, py1, px2, py2, qx1, qy1, qx2, qy2) == 0
+    status: np.ndarray = np.full(n, _OUT_OF_LINESEGMENT, dtype=np.int8)
+
+    # 平行な組（LineSegment._calcCrossPoint と同じ順に判定する）
+    q1In1: np.ndarray = (o1 == 0) & _inside(qx1, qy1, minx1, maxx1, miny1, maxy1)
+    q2In1: np.ndarray = (o2 == 0) & _inside(qx2, qy2, minx1, maxx1, miny1, maxy1)
+    p1In2: np.ndarray = (o3 == 0) & _inside(px1, py1, minx2, maxx2, miny2, maxy2)
+    p2In2: np.ndarray = (o4 == 0) & _inside(px2, py2, minx2, maxx2, miny2, maxy2)
+    onLine: np.ndarray = parallel & ((o1 == 0) | (o2 == 0))
+    overlap: np.ndarray = onLine & (q1In1 | q2In1 | p1In2 | p2In2)
+    included: np.ndarray = overlap & ((q1In1 & q2In1) | (p1In2 & p2In2))
+    status[parallel] = _PARALLEL
+    status[onLine] = _ON_LINE
+    status[overlap] = _ON_LINE_OVERLAP
+    status[included] = _ON_LINE_INCLUDED
+
+    # 平行でない組は、外接矩形と向きで交差を判定する
+    separated: np.ndarray = ((maxx1 < minx2) | (maxx2 < minx1) | (maxy1 < miny2) | (maxy2 < miny1)
+                             | (o1 * o2 > 0) | (o3 * o4 > 0))
+    exist: np.ndarray = ~parallel & ~separated
+    status[exist] = _EXIST
+
+    # 交差する組のみ交点を求め、両線分の外接矩形の共通部分に収める
+    xs: np.ndarray = np.full(n, np.nan)
+    ys: np.ndarray = np.full(n, np.nan)
+    e: np.ndarray = np.flatnonzero(exist)
+    if len(e) > 0:
+        a1, b1, c1 = py2[e] - py1[e], px1[e] - px2[e], px1[e] * py2[e] - py1[e] * px2[e]
+        a2, b2, c2 = qy2[e] - qy1[e], qx1[e] - qx2[e], qx1[e] * qy2[e] - qy1[e] * qx2[e]
+        d: np.ndarray = a2 * b1 - a1 * b2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x: np.ndarray = (c2 * b1 - c1 * b2) / d
+            y: np.ndarray = (c1 * a2 - c2 * a1) / d
+        singular: np.ndarray = np.flatnonzero(d == 0)
+        if len(singular) > 0:
+            # 係数から求めた行列式が丸め誤差で 0 となる組は、LineSegment と同じく分数で求める
+            for j in singular.tolist():
+                i: int = int(e[j])
+                x[j], y[j] = _lineCrossPoint(LineSegment(Point(*s1[i, :2].tolist()), Point(*s1[i, 2:].tolist())),
+                                             LineSegment(Point(*s2[i, :2].tolist()), Point(*s2[i, 2:].tolist())))
+        xs[e] = np.minimum(np.maximum(np.maximum(x, minx1[e]), minx2[e]), np.minimum(maxx1[e], maxx2[e]))
+        ys[e] = np.minimum(np.maximum(np.maximum(y, miny1[e]), miny2[e]), np.minimum(maxy1[e], maxy2[e]))
+    return xs, ys, status
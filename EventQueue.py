@@ -0,0 +1,616 @@
+"""イベント管理モジュール
+
+平面走査法のイベント（端点・交点）を x 座標の順に取り出すためのキュー
+"""
+
+import bisect
+import heapq
+import math
+import operator
+from abc import ABC, abstractmethod
+from enum import Enum, auto, unique
+from dataclasses import dataclass
+from MemoryReport import TreeMemoryReport, deepSizeOf, shallowSizeOf
+from Point import Point
+from PointIndex import PointIndex
+from LineSegment import AnyLineSegment
+from TwoThreeTree import Leaf, Node, TwoThreeTree
+
+@unique
+class EventType(Enum):
+    """イベント種類の enum
+
+    平面走査法のイベント種類を表す
+    """
+    LEFT  = auto()  # 左端点
+    CROSS = auto()  # 交点
+    RIGHT = auto()  # 右端点
+
+
+@dataclass(slots=True)
+class BNode:
+    """平面走査法で用いるイベント管理するための Node 要素
+    """
+    eventType: EventType     # イベント種類
+    pt: Point                # イベントに対する Point, この X 座標がメインのキー
+    ls: AnyLineSegment       # Point が存在する線分
+    ls2: AnyLineSegment | None  # イベントが交点の場合の２つ目の線分
+    lnId: int | None         # 線分 ID, 端点追加時のみ割り当てる
+    crossLnIds: tuple[int, int] | None = None  # イベントが交点の場合の (ls, ls2) の線分 ID, 順序の比較には用いない
+
+class LeafB(Leaf[BNode]):
+    # 座標の一致の判定
+    _same = staticmethod(math.isclose)
+
+    def __init__(self, val: BNode, parent: Node[BNode] | None):
+        super().__init__(val, parent, self._get_leafb_key, self._comp_leafb_key)
+
+    def _get_leafb_key(self, v: BNode) -> str:
+        return f"({v.pt.x}, {v.pt.y}), {v.eventType}"
+    
+    def _comp_leafb_key(self, v1: BNode, v2: BNode) -> int:
+        '''イベント要素の比較関数
+
+        走査線上に端点および交点が複数存在する場合に対応できるように、
+        x および y 座標を用いて同一 Node であるか判定する（x 座標が優先）
+        
+        そのうえで、イベントとしては交点を優先的に処理する
+        （走査線上に交点と端点がある場合、先に交点を処理して線分を入れ替えて
+        おかないと、端点追加に伴う上下の線分が正しく判定できなくなる）
+
+        また、線分の端点が重なっている場合へ対応するため、以下のようにする
+        ・イベント種類が異なる場合は、左端点を優先する（走査線上に線分を追加するのを優先する）
+        ・線分 ID により、同一 Node であるかを判定する（一方の線分 ID がないような場合は同じとみなす）
+
+        上記を踏まえると下記の優先順位で比較を行うこととする
+            x 座標の大小
+            イベントタイプ（交点、その他の順）、交点のほうが小さい（先に処理される）
+            y 座標の大小
+            端点が異なる場合は、イベントタイプ（左端点、右端点の順）、左端点を持つ方が小さい（先に処理される）
+            線分 ID（交点同士以外の場合）、線分 ID が小さい（先に処理される）
+        
+        Args:
+            v1: 比較要素1
+            v2: 比較要素2
+
+        Returns:
+            0: 一致,  負の値: v1 < v2,  正の値: v1 > v2
+        '''
+        if self._same(v1.pt.x, v2.pt.x):
+            if v1.eventType == EventType.CROSS and v2.eventType != EventType.CROSS:
+                return -1
+            elif v1.eventType != EventType.CROSS and v2.eventType == EventType.CROSS:
+                return 1
+            else:
+                #イベントタイプが同種類（交点同士または交点以外同士）の場合は y 座標を用いて判定する
+                if self._same(v1.pt.y, v2.pt.y):
+                    # y 座標が同じ場合は、交点同士かそれ以外かで判定方法を切り替える
+
+                    # 交点同士の場合
+                    if v1.eventType == EventType.CROSS and v2.eventType == EventType.CROSS:
+                        return 0
+                    
+                    # 交点同士の比較以外は 線分ID で同一か否かを判定
+                    #   線分の端点に該当するため ID が異なっていれば、異なる点として扱う
+                    if v1.lnId is None or v2.lnId is None:
+                        return 0
+                    else:
+                        # 線分 ID がある場合は、先に、イベントタイプで判定
+                        #   イベントタイプ異なる場合は、左端点を優先する(走査線上に追加する処理を優先する）
+                        if v1.eventType == EventType.LEFT and v2.eventType == EventType.RIGHT:
+                            return -1
+                        elif v1.eventType == EventType.RIGHT and v2.eventType == EventType.LEFT:
+                            return 1
+                    
+                        if v1.lnId > v2.lnId:
+                            return 1
+                        elif v1.lnId < v2.lnId:
+                            return -1
+                        else:
+                            return 0
+                if v1.pt.y < v2.pt.y:
+                    return -1
+                else:
+                    return 1
+        if v1.pt.x < v2.pt.x:
+            return -1
+        else:
+            return 1    
+
+def leafb_ctor(v: BNode, parent: Node[BNode]):
+    return LeafB(v, parent)
+
+
+class ExactLeafB(LeafB):
+    """厳密な座標（int, Fraction）のイベントの葉
+
+    座標の一致を許容誤差なしで判定する
+    """
+    _same = staticmethod(operator.eq)
+
+
+def exactleafb_ctor(v: BNode, parent: Node[BNode]):
+    return ExactLeafB(v, parent)
+
+
+@unique
+class EventQueueType(Enum):
+    """イベントキューの種類の enum
+    """
+    TREE   = auto()  # 2-3木
+    HEAP   = auto()  # 二分ヒープ
+    BUCKET = auto()  # x 座標の順位によるバケット
+
+
+class EventQueue(ABC):
+    """イベントキューのインターフェース
+
+    SweepLineMethod はこのインターフェースを通してイベントを管理する
+    イベントの順序は LeafB._comp_leafb_key に従う
+    """
+
+    @abstractmethod
+    def insert(self, bn: BNode):
+        """イベントを追加する
+
+        Args:
+            bn: 追加するイベント
+        """
+        pass
+
+    @abstractmethod
+    def minimum(self) -> BNode | None:
+        """最初に処理するイベントを取得する（キューからは削除しない）
+
+        Returns:
+            最小のイベント, イベントがない場合は None
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, bn: BNode):
+        """イベントを削除する
+
+        Args:
+            bn: 削除するイベント
+        """
+        pass
+
+    @abstractmethod
+    def hasEndpoint(self, pt: Point) -> bool:
+        """未処理の端点のイベントが pt にあるか否か
+
+        Args:
+            pt: 対象の点
+
+        Returns:
+            端点のイベントがあれば True
+        """
+        pass
+
+    @abstractmethod
+    def removeAll(self):
+        """全イベントを削除する
+        """
+        pass
+
+    def reset(self, lses: list[AnyLineSegment]):
+        """全イベントを削除し、別の線分のリストのイベントの管理に再利用する
+
+        Args:
+            lses: 線分のリスト, BUCKET の場合に x 座標の一覧を求めるために用いる
+        """
+        self.removeAll()
+
+    @abstractmethod
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        Args:
+            sample_rate: バイト数を求める要素の割合 (0, 1]
+            seed: サンプリングに用いる乱数のシード
+            seen: 数え済みのオブジェクトの id の集合
+
+        Returns:
+            メモリ使用量
+        """
+        pass
+
+
+def createEventQueue(eventQueueType: EventQueueType, lses: list[AnyLineSegment], exact: bool = False) -> EventQueue:
+    """イベントキューを生成する
+
+    Args:
+        eventQueueType: イベントキューの種類
+        lses: 線分のリスト, BUCKET の場合に x 座標の一覧を求めるために用いる
+        exact: 座標が厳密な値（int, Fraction）か否か, True の場合は座標の一致を許容誤差なしで判定する
+
+    Returns:
+        イベントキュー
+    """
+    if eventQueueType == EventQueueType.HEAP:
+        return HeapEventQueue()
+    elif eventQueueType == EventQueueType.BUCKET:
+        return BucketEventQueue(lses, exact)
+    return TreeEventQueue(exact)
+
+
+class TreeEventQueue(EventQueue):
+    """2-3木によるイベントキュー
+
+    イベントの順序は LeafB._comp_leafb_key に従う
+    """
+
+    def __init__(self, exact: bool = False):
+        """コンストラクタ
+
+        Args:
+            exact: 座標が厳密な値か否か, True の場合は ExactLeafB を用いる
+        """
+        self._tree: TwoThreeTree[LeafB, BNode] = TwoThreeTree[LeafB, BNode](exactleafb_ctor if exact else leafb_ctor)
+
+    def insert(self, bn: BNode):
+        """イベントを追加する
+
+        Args:
+            bn: 追加するイベント
+        """
+        self._tree.insert(bn)
+
+    def minimum(self) -> BNode | None:
+        """最初に処理するイベントを取得する（キューからは削除しない）
+
+        Returns:
+            最小のイベント, イベントがない場合は None
+        """
+        lfb: Leaf[BNode] | None = self._tree.minimum()
+        if lfb is None:
+            return None
+        return lfb.cargo
+
+    def delete(self, bn: BNode):
+        """イベントを削除する
+
+        Args:
+            bn: 削除するイベント
+        """
+        self._tree.delete(bn)
+
+    def hasEndpoint(self, pt: Point) -> bool:
+        """未処理の端点のイベントが pt にあるか否か
+
+        Args:
+            pt: 対象の点
+
+        Returns:
+            端点のイベントがあれば True
+        """
+        # CROSS 以外, 線分 ID なしで検索すると、同じ座標の端点と一致する
+        return self._tree.search(BNode(EventType.RIGHT, pt, None, None, None)) is not None
+
+    def removeAll(self):
+        self._tree.removeAll()
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        return self._tree.memory_report(sample_rate, seed, seen)
+
+
+def _eventKey(bn: BNode) -> tuple[float, int, float, int, int]:
+    """イベントの順序を表すタプル
+
+    LeafB._comp_leafb_key と同じ優先順位
+        x 座標, イベントタイプ（交点, その他の順）, y 座標, イベントタイプ（左端点, 右端点の順）, 線分 ID
+    ただし、座標は許容誤差を用いずにそのまま比較する
+
+    Args:
+        bn: イベント
+
+    Returns:
+        順序を表すタプル
+    """
+    return (
+        bn.pt.x,
+        0 if bn.eventType == EventType.CROSS else 1,
+        bn.pt.y,
+        1 if bn.eventType == EventType.RIGHT else 0,
+        -1 if bn.lnId is None else bn.lnId)
+
+
+class HeapEventQueue(EventQueue):
+    """二分ヒープ (heapq) によるイベントキュー
+
+    イベントの順序はあらかじめ求めたタプル（_eventKey）で比較する
+    キューの先頭以外のイベントの削除は、削除済みとして記録しておき、
+    先頭に来た時点で取り除く（遅延削除）
+
+    端点の有無の判定は、未処理の端点の座標の索引を用いる
+
+    Note:
+        2-3木と異なり、同じ順序のイベントを重複して追加できる
+        （平面走査法では、交点の重複は発見済みの交点の判定により除かれる）
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, float, int, int, int, BNode]] = []
+        self._seq: int = 0                   # 追加順の連番, 同じ順序のイベントを比較しないようにする
+        self._deleted: set[int] = set()      # 遅延削除するイベントの id
+        self._endpoints: PointIndex = PointIndex()
+
+    def __len__(self) -> int:
+        return len(self._heap) - len(self._deleted)
+
+    def insert(self, bn: BNode):
+        """イベントを追加する
+
+        Args:
+            bn: 追加するイベント
+        """
+        heapq.heappush(self._heap, (*_eventKey(bn), self._seq, bn))
+        self._seq += 1
+        if bn.eventType != EventType.CROSS:
+            self._endpoints.add(bn.pt)
+
+    def minimum(self) -> BNode | None:
+        """最初に処理するイベントを取得する（キューからは削除しない）
+
+        Returns:
+            最小のイベント, イベントがない場合は None
+        """
+        self._purge()
+        if len(self._heap) == 0:
+            return None
+        return self._heap[0][-1]
+
+    def delete(self, bn: BNode):
+        """イベントを削除する
+
+        キューの先頭であればすぐに取り除き、それ以外は遅延削除とする
+
+        Args:
+            bn: 削除するイベント
+        """
+        if bn.eventType != EventType.CROSS:
+            self._endpoints.remove(bn.pt)
+
+        if len(self._heap) > 0 and self._heap[0][-1] is bn:
+            heapq.heappop(self._heap)
+        else:
+            self._deleted.add(id(bn))
+
+    def hasEndpoint(self, pt: Point) -> bool:
+        """未処理の端点のイベントが pt にあるか否か
+
+        Args:
+            pt: 対象の点
+
+        Returns:
+            端点のイベントがあれば True
+        """
+        return pt in self._endpoints
+
+    def _purge(self):
+        """先頭にある遅延削除済みのイベントを取り除く
+        """
+        while len(self._heap) > 0 and id(self._heap[0][-1]) in self._deleted:
+            self._deleted.discard(id(heapq.heappop(self._heap)[-1]))
+
+    def removeAll(self):
+        self._heap.clear()
+        self._deleted.clear()
+        self._endpoints.clear()
+        self._seq = 0
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        ヒープの要素（タプル）を葉として扱い、内部節点は 0 個とする
+        ヒープのリスト自体および索引は 1 要素あたりのバイト数に按分する
+        サンプリングは行わない
+
+        Args:
+            sample_rate: 未使用（TreeEventQueue と引数を合わせるため）
+            seed: 未使用
+            seen: 数え済みのオブジェクトの id の集合
+
+        Returns:
+            メモリ使用量
+        """
+        return _entriesMemoryReport(self._heap, [self._heap, self._deleted, self._endpoints], seen)
+
+
+def _entriesMemoryReport(entries: list[tuple], containers: list[object], seen: set[int] | None) -> TreeMemoryReport:
+    """末尾にイベントを持つタプルの列のメモリ使用量
+
+    タプルを葉として扱い、内部節点は 0 個とする
+    containers のバイト数は 1 要素あたりのバイト数に按分する
+
+    Args:
+        entries: (キー, ..., イベント) のタプルの列
+        containers: タプルを保持するコンテナ, 索引など
+        seen: 数え済みのオブジェクトの id の集合
+
+    Returns:
+        メモリ使用量
+    """
+    if seen is None:
+        seen = set()
+    count: int = len(entries)
+    entry_bytes: int = 0
+    cargo_bytes: int = 0
+    for entry in entries:
+        seen.add(id(entry))
+        entry_bytes += shallowSizeOf(entry) + sum(deepSizeOf(v, seen) for v in entry[:-1])
+        cargo_bytes += deepSizeOf(entry[-1], seen)
+    # タプルは数え済み (seen に含まれる) なので、コンテナ自体と索引などのみ数えられる
+    container_bytes: int = sum(deepSizeOf(c, seen) for c in containers)
+    per_leaf: float = (entry_bytes + container_bytes) / count if count > 0 else 0.0
+    per_cargo: float = cargo_bytes / count if count > 0 else 0.0
+    return TreeMemoryReport(
+        count,
+        0,
+        0,
+        per_leaf,
+        0.0,
+        per_cargo,
+        entry_bytes + container_bytes + cargo_bytes,
+        1.0)
+
+
+class BucketEventQueue(EventQueue):
+    """x 座標の順位によるバケットキュー
+
+    線分の端点の x 座標（格子点）を昇順に並べて番号を付け、x 座標の順位ごとにバケットを設ける
+        奇数番目のバケット 2i+1 : x 座標が i 番目の格子点に一致するイベント
+        偶数番目のバケット 2i   : x 座標が i-1 番目と i 番目の格子点の間にあるイベント（交点）
+    各バケットは小さな二分ヒープとし、現在のバケットの位置は前方にのみ進む
+    整数座標などで格子点の数が少ない場合、イベントの追加と取り出しは償却 O(1) に近くなる
+
+    格子点に一致するイベントは、x 座標を格子点の値とみなして順序を決める
+    （LeafB._comp_leafb_key が math.isclose で x 座標を比較するのと同様, 厳密な座標の場合は一致する場合のみ）
+    削除は HeapEventQueue と同様に遅延削除とする
+    """
+
+    def __init__(self, lses: list[AnyLineSegment], exact: bool = False):
+        """コンストラクタ
+
+        Args:
+            lses: 線分のリスト, 端点の x 座標を格子点とする
+            exact: 座標が厳密な値か否か, True の場合は格子点に近いイベントを格子点上とみなさない
+        """
+        self._exact: bool = exact
+        self._xs: list[float]
+        self._xrank: dict[float, int]
+        self._buckets: list[list[tuple]] = []
+        self._setGrid(lses)
+        self._cur: int = 0                   # 現在のバケット, これより前のバケットは空
+        self._size: int = 0                  # 遅延削除されたイベントを含む要素数
+        self._seq: int = 0
+        self._deleted: set[int] = set()
+        self._endpoints: PointIndex = PointIndex()
+
+    def __len__(self) -> int:
+        return self._size - len(self._deleted)
+
+    def _setGrid(self, lses: list[AnyLineSegment]):
+        """端点の x 座標を格子点とし、バケットを用意する
+
+        既存のバケット（空のリスト）は再利用する
+
+        Args:
+            lses: 線分のリスト
+        """
+        self._xs = sorted({x for ls in lses for x in (ls.minxPt.x, ls.maxxPt.x)})
+        self._xrank = {x: i for i, x in enumerate(self._xs)}
+        n: int = 2 * len(self._xs) + 1
+        if len(self._buckets) < n:
+            self._buckets.extend([] for _ in range(n - len(self._buckets)))
+        else:
+            del self._buckets[n:]
+
+    def _bucketIndex(self, x: float) -> int:
+        """x 座標に対するバケットの番号
+
+        Args:
+            x: x 座標
+
+        Returns:
+            バケットの番号
+        """
+        i: int | None = self._xrank.get(x)
+        if i is not None:
+            return 2 * i + 1
+        i = bisect.bisect_left(self._xs, x)
+        if self._exact:
+            return 2 * i
+        if i < len(self._xs) and math.isclose(x, self._xs[i]):
+            return 2 * i + 1
+        if 0 < i and math.isclose(x, self._xs[i - 1]):
+            return 2 * i - 1
+        return 2 * i
+
+    def insert(self, bn: BNode):
+        b: int = self._bucketIndex(bn.pt.x)
+        key: tuple = _eventKey(bn)
+        if b % 2 == 1:
+            # 格子点上のイベントは x 座標を格子点の値にそろえる
+            key = (self._xs[b // 2],) + key[1:]
+        heapq.heappush(self._buckets[b], (*key, self._seq, bn))
+        self._seq += 1
+        self._size += 1
+        if b < self._cur:
+            self._cur = b
+        if bn.eventType != EventType.CROSS:
+            self._endpoints.add(bn.pt)
+
+    def minimum(self) -> BNode | None:
+        bucket: list[tuple] | None = self._purge()
+        if bucket is None:
+            return None
+        return bucket[0][-1]
+
+    def delete(self, bn: BNode):
+        if bn.eventType != EventType.CROSS:
+            self._endpoints.remove(bn.pt)
+
+        bucket: list[tuple] | None = self._purge()
+        if bucket is not None and bucket[0][-1] is bn:
+            heapq.heappop(bucket)
+            self._size -= 1
+        else:
+            self._deleted.add(id(bn))
+
+    def hasEndpoint(self, pt: Point) -> bool:
+        return pt in self._endpoints
+
+    def _purge(self) -> list[tuple] | None:
+        """遅延削除済みのイベントを取り除きつつ、空でない先頭のバケットまで進める
+
+        Returns:
+            先頭のバケット, イベントがない場合は None
+        """
+        while self._cur < len(self._buckets):
+            bucket: list[tuple] = self._buckets[self._cur]
+            while len(bucket) > 0 and id(bucket[0][-1]) in self._deleted:
+                self._deleted.discard(id(heapq.heappop(bucket)[-1]))
+                self._size -= 1
+            if len(bucket) > 0:
+                return bucket
+            self._cur += 1
+        return None
+
+    def removeAll(self):
+        for bucket in self._buckets:
+            bucket.clear()
+        self._cur = 0
+        self._size = 0
+        self._seq = 0
+        self._deleted.clear()
+        self._endpoints.clear()
+
+    def reset(self, lses: list[AnyLineSegment]):
+        """全イベントを削除し、別の線分のリストのイベントの管理に再利用する
+
+        格子点は新しい線分のリストの端点の x 座標とする
+
+        Args:
+            lses: 線分のリスト
+        """
+        self.removeAll()
+        self._setGrid(lses)
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        HeapEventQueue と同様に、バケット内の要素（タプル）を葉として扱う
+        バケットのリスト, 格子点の一覧および索引は 1 要素あたりのバイト数に按分する
+
+        Args:
+            sample_rate: 未使用（TreeEventQueue と引数を合わせるため）
+            seed: 未使用
+            seen: 数え済みのオブジェクトの id の集合
+
+        Returns:
+            メモリ使用量
+        """
+        entries: list[tuple] = [e for bucket in self._buckets for e in bucket]
+        return _entriesMemoryReport(entries, [self._buckets, self._xs, self._xrank, self._deleted, self._endpoints], seen)
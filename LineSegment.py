@@ -1,8 +1,12 @@
 
+from dataclasses import dataclass, field
 from enum import Enum, auto, unique
+from fractions import Fraction
 import math
+from numbers import Rational
 from typing import Self
-from Point import Point
+from Point import ExactPoint, Point
+from Predicates import crossSign, orientation, sameSide
     
 @unique
 class CrossPointStatus(Enum):
@@ -17,6 +21,97 @@ class CrossPointStatus(Enum):
 # 浮動小数点を０と比較する際の許容誤差
 _ABS_TOL: float = 1e-10
 
+def _isSeparated(ls1: "AnyLineSegment", ls2: "AnyLineSegment") -> bool:
+    """２線分が交差しないことが簡単な判定でわかるか否か
+
+    外接矩形が重ならない場合、または一方の線分の両端点が他方の線分を含む直線の同じ側に
+    ある場合（Predicates.sameSide）は交差しない
+
+    Args:
+        ls1: 線分
+        ls2: 線分
+
+    Returns:
+        交差しない場合は True, 交差する場合および端点が他方の直線上にある場合は False
+    """
+    if ls1.maxx < ls2.minx or ls2.maxx < ls1.minx or ls1.maxy < ls2.miny or ls2.maxy < ls1.miny:
+        return True
+    p1, p2, q1, q2 = ls1.pt1, ls1.pt2, ls2.pt1, ls2.pt2
+    return sameSide(p1, p2, q1, q2) or sameSide(q1, q2, p1, p2)
+
+def _lineCrossPoint(ls1: "AnyLineSegment", ls2: "AnyLineSegment") -> tuple[float, float]:
+    """平行でない２線分を含む直線の交点の座標
+
+    係数から求めた行列式が丸め誤差で 0 となる場合は、端点の座標から分数で求めて丸める
+
+    Args:
+        ls1: 線分
+        ls2: 線分, ls1 と平行でないこと
+
+    Returns:
+        交点の x 座標, y 座標
+    """
+    a1, b1, c1, a2, b2, c2 = ls1.a, ls1.b, ls1.c, ls2.a, ls2.b, ls2.c
+    d: float = a2 * b1 - a1 * b2
+    if d == 0:
+        x1, y1, x2, y2 = map(Fraction, (ls1.pt1.x, ls1.pt1.y, ls1.pt2.x, ls1.pt2.y))
+        x3, y3, x4, y4 = map(Fraction, (ls2.pt1.x, ls2.pt1.y, ls2.pt2.x, ls2.pt2.y))
+        a1, b1, c1 = y2 - y1, x1 - x2, x1 * y2 - y1 * x2
+        a2, b2, c2 = y4 - y3, x3 - x4, x3 * y4 - y3 * x4
+        d = a2 * b1 - a1 * b2
+        return float((c2 * b1 - c1 * b2) / d), float((c1 * a2 - c2 * a1) / d)
+    return (c2 * b1 - c1 * b2) / d, (c1 * a2 - c2 * a1) / d
+
+def _crossPointWithStatus(ls1: "AnyLineSegment", ls2: "AnyLineSegment") -> tuple[Point | None, CrossPointStatus]:
+    """２線分の交点と交点の状態
+
+    LineSegment.crossPointWithStatus を参照, 線分は変更しない
+
+    Args:
+        ls1: 線分
+        ls2: もう一方の線分
+
+    Returns:
+        交点（交点がない場合は None）, 交点の状態
+    """
+    if crossSign(ls1.pt1, ls1.pt2, ls2.pt1, ls2.pt2) == 0:
+        # 2線分が平行
+        if not (ls1.isOnLineByLineSegment(ls2.pt1) or ls1.isOnLineByLineSegment(ls2.pt2)):
+            return None, CrossPointStatus.PARALLEL
+
+        # 同じ直線上に 2 線分がある
+        in1: tuple[bool, bool] = (ls1.isInLineSegment(ls2.pt1), ls1.isInLineSegment(ls2.pt2))
+        in2: tuple[bool, bool] = (ls2.isInLineSegment(ls1.pt1), ls2.isInLineSegment(ls1.pt2))
+        if not (any(in1) or any(in2)):
+            return None, CrossPointStatus.ON_LINE
+        if all(in1) or all(in2):
+            # 一方が他方に含まれている
+            return None, CrossPointStatus.ON_LINE_INCLUDED
+        # 線分が重なっている
+        return None, CrossPointStatus.ON_LINE_OVERLAP
+
+    # 有効範囲内か？（交点を求める前に、外接矩形と向きで判定する）
+    if _isSeparated(ls1, ls2):
+        return None, CrossPointStatus.OUT_OF_LINESEGMENT
+    return ls1._solveCrossPoint(ls2), CrossPointStatus.EXIST
+
+def _clampedCrossPoint(ls1: "AnyLineSegment", ls2: "AnyLineSegment") -> Point:
+    """交差することがわかっている２線分の交点
+
+    丸め誤差で外接矩形を外れないよう、両線分の外接矩形の共通部分に収める
+
+    Args:
+        ls1: 線分
+        ls2: 線分, ls1 と平行でなく交差すること
+
+    Returns:
+        交点
+    """
+    x, y = _lineCrossPoint(ls1, ls2)
+    x = min(max(x, ls1.minx, ls2.minx), ls1.maxx, ls2.maxx)
+    y = min(max(y, ls1.miny, ls2.miny), ls1.maxy, ls2.maxy)
+    return Point(x, y)
+
 class LineSegment:
     """線分クラス
 
@@ -123,6 +218,7 @@ class LineSegment:
 
         getCrossPoint, hasCrossPoint, calcX, calcY 呼び出し後に、交点の
         状態が設定される
+        crossPointWithStatus, calcXWithStatus, calcYWithStatus は状態を設定せず、戻り値として返す
 
         Returns:
             交点の状態を表す enum
@@ -148,13 +244,15 @@ class LineSegment:
     def isOnLineByLineSegment(self, pt: Point) -> bool:
         """線分を含む直線上に Point があるか
 
+        ３点の向き（Predicates.orientation）により、許容誤差を用いずに判定する
+
         Args:
             pt: 判定対象の Point
         
         Returns:
             直線上にあれば true
         """
-        return math.isclose(self.c, self.a * pt.x + self.b * pt.y)
+        return orientation(self.pt1, self.pt2, pt) == 0
     
     def isInsideRectangle(self, pt: Point) -> bool:
         """線分の両端点が作る四角形内に Point があるか
@@ -190,42 +288,38 @@ class LineSegment:
         return self._calcCrossPoint(other)
 
     def _calcCrossPoint(self, other: Self) -> Point | None:
-        """線分の交点を求める
+        """線分の交点を求め、交点の状態を設定する
 
         Args:
             other: もう一方の線分
         Returns:
             交点の Point オブジェクト, 交点がない場合は None
         """
-        d: float = other.a * self.b - self.a * other.b
-        if math.isclose(d, 0, abs_tol=_ABS_TOL):
-            # 2線分が平行
-            self._cp_status = CrossPointStatus.PARALLEL
-
-            if (self.isOnLineByLineSegment(other.pt1) or self.isOnLineByLineSegment(other.pt2)):
-                # 同じ直線上に 2 線分がある
-                self._cp_status = CrossPointStatus.ON_LINE
-
-                if (self.isInLineSegment(other.pt1) or self.isInLineSegment(other.pt2)
-                    or other.isInLineSegment(self.pt1) or other.isInLineSegment(self.pt2)):
-                    # 線分が重なっている
-                    self._cp_status = CrossPointStatus.ON_LINE_OVERLAP
-                    if ((self.isInLineSegment(other.pt1) and self.isInLineSegment(other.pt2))
-                        or (other.isInLineSegment(self.pt1) and other.isInLineSegment(self.pt2))):
-                        # 一方が他方に含まれている
-                        self._cp_status = CrossPointStatus.ON_LINE_INCLUDED
-            return None
+        pt, self._cp_status = self.crossPointWithStatus(other)
+        return pt
 
-        x: float = (other.c * self.b - self.c * other.b) / d
-        y: float = (self.c * other.a - other.c * self.a) / d
+    def crossPointWithStatus(self, other: "AnyLineSegment") -> tuple[Point | None, CrossPointStatus]:
+        """線分の交点と交点の状態を求める
 
-        # 有効範囲内か？
-        pt: Point = Point().setAddress(x, y)
-        if self.isInsideRectangle(pt) and other.isInsideRectangle(pt):
-            self._cp_status = CrossPointStatus.EXIST
-            return pt
-        self._cp_status = CrossPointStatus.OUT_OF_LINESEGMENT
-        return None
+        getCrossPoint と異なり、線分の交点の状態（status）を変更しない
+        複数のスレッドから同じ線分を用いる場合はこちらを用いる
+
+        Args:
+            other: もう一方の線分
+        Returns:
+            交点の Point オブジェクト（交点がない場合は None）, 交点の状態
+        """
+        return _crossPointWithStatus(self, other)
+
+    def _solveCrossPoint(self, other: "AnyLineSegment") -> Point:
+        """交差することがわかっている線分との交点を求める
+
+        Args:
+            other: もう一方の線分, 平行でなく交差すること
+        Returns:
+            交点の Point オブジェクト
+        """
+        return _clampedCrossPoint(self, other)
 
     def calcXIfExist(self, y: float) -> float:
         """線分上の x 座標値を求める
@@ -235,12 +329,13 @@ class LineSegment:
         Returns:
             線分上の x 座標値, 直線が x 軸に平行な場合および線分外の場合はエラーとする
         """
-        result: float | None = self.calcX(y)
-        if (result is not None and self.status == CrossPointStatus.EXIST):
+        result, status = self.calcXWithStatus(y)
+        self._cp_status = status
+        if (result is not None and status == CrossPointStatus.EXIST):
             return result
-        if (self.status == CrossPointStatus.PARALLEL):
+        if (status == CrossPointStatus.PARALLEL):
             raise RuntimeError("linesegment is parallel to x axis")
-        elif (self.status == CrossPointStatus.OUT_OF_LINESEGMENT):
+        elif (status == CrossPointStatus.OUT_OF_LINESEGMENT):
             raise RuntimeError(f"linesegment is not cross to y: {y}")
         else:
             raise RuntimeError("unexpected error")
@@ -253,19 +348,33 @@ class LineSegment:
         Returns:
             線分上の x 座標値, 直線が x 軸に平行な場合および線分外の場合は None
         """
-        if (math.isclose(self.a, 0, abs_tol=_ABS_TOL)):
-            self._cp_status = CrossPointStatus.PARALLEL
-            return None
-        
-        x: float = (self.c - self.b * y) / self.a
+        result, self._cp_status = self.calcXWithStatus(y)
+        return result
+
+    def calcXWithStatus(self, y: float) -> tuple[float | None, CrossPointStatus]:
+        """線分上の x 座標値と交点の状態を求める
+
+        calcX と異なり、線分の交点の状態（status）を変更しない
 
-        pt: Point = Point().setAddress(x, y)
-        if self.isInsideRectangle(pt):
-            self._cp_status = CrossPointStatus.EXIST
-            return x
+        Args:
+            y: y 座標値
+        Returns:
+            線分上の x 座標値（直線が x 軸に平行な場合および線分外の場合は None）, 交点の状態
+        """
+        if (math.isclose(self.a, 0, abs_tol=_ABS_TOL)):
+            return None, CrossPointStatus.PARALLEL
         
-        self._cp_status = CrossPointStatus.OUT_OF_LINESEGMENT
-        return None
+        if not (self.miny <= y and y <= self.maxy):
+            return None, CrossPointStatus.OUT_OF_LINESEGMENT
+
+        # 線分の範囲は与えられた y 座標で判定し、丸め誤差で外接矩形を外れた x 座標は矩形内に収める
+        # 端点では端点の座標をそのまま返す
+        if y == self.miny:
+            return self.minyPt.x, CrossPointStatus.EXIST
+        if y == self.maxy:
+            return self.maxyPt.x, CrossPointStatus.EXIST
+        x: float = min(max((self.c - self.b * y) / self.a, self.minx), self.maxx)
+        return x, CrossPointStatus.EXIST
     
     def calcYIfExist(self, x: float) -> float:
         """線分上の y 座標値を求める
@@ -275,12 +384,13 @@ class LineSegment:
         Returns:
             線分上の y 座標値, 直線が y 軸に平行な場合および線分外の場合はエラーとする
         """
-        result: float | None = self.calcY(x)
-        if (result is not None and self.status == CrossPointStatus.EXIST):
+        result, status = self.calcYWithStatus(x)
+        self._cp_status = status
+        if (result is not None and status == CrossPointStatus.EXIST):
             return result
-        if (self.status == CrossPointStatus.PARALLEL):
+        if (status == CrossPointStatus.PARALLEL):
             raise RuntimeError("linesegment is parallel to y axis")
-        elif (self.status == CrossPointStatus.OUT_OF_LINESEGMENT):
+        elif (status == CrossPointStatus.OUT_OF_LINESEGMENT):
             raise RuntimeError(f"linesegment is not cross to x: {x}")
         else:
             raise RuntimeError("unexpected error")
@@ -293,18 +403,312 @@ class LineSegment:
         Returns:
             線分上の y 座標値, 直線が y 軸に平行な場合および線分外の場合は None
         """
+        result, self._cp_status = self.calcYWithStatus(x)
+        return result
+
+    def calcYWithStatus(self, x: float) -> tuple[float | None, CrossPointStatus]:
+        """線分上の y 座標値と交点の状態を求める
+
+        calcY と異なり、線分の交点の状態（status）を変更しない
+
+        Args:
+            x: x 座標値
+        Returns:
+            線分上の y 座標値（直線が y 軸に平行な場合および線分外の場合は None）, 交点の状態
+        """
         if (math.isclose(self.b, 0, abs_tol=_ABS_TOL)):
-            self._cp_status = CrossPointStatus.PARALLEL
-            return None
+            return None, CrossPointStatus.PARALLEL
         
-        y: float = (self.c - self.a * x) / self.b
+        if not (self.minx <= x and x <= self.maxx):
+            return None, CrossPointStatus.OUT_OF_LINESEGMENT
 
-        pt: Point = Point().setAddress(x, y)
-        if self.isInsideRectangle(pt):
-            self._cp_status = CrossPointStatus.EXIST
-            return y
-        
-        self._cp_status = CrossPointStatus.OUT_OF_LINESEGMENT
-        return None
+        # 線分の範囲は与えられた x 座標で判定し、丸め誤差で外接矩形を外れた y 座標は矩形内に収める
+        # 端点では端点の座標をそのまま返す
+        if x == self.minx:
+            return self.minxPt.y, CrossPointStatus.EXIST
+        if x == self.maxx:
+            return self.maxxPt.y, CrossPointStatus.EXIST
+        y: float = min(max((self.c - self.a * x) / self.b, self.miny), self.maxy)
+        return y, CrossPointStatus.EXIST
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FrozenLineSegment:
+    """変更不可の線分クラス
+
+    LineSegment と同じ線分を表すが、直線の係数・傾き・切片・外接矩形を生成時に一度だけ求めて保持する
+    平面走査法のように、同じ線分の係数等を繰り返し参照する処理で用いる
+
+    交点の状態（LineSegment.status）は保持しない
+    比較・ハッシュは同一性で行う
+
+    Attributes:
+        pt1: 端点１
+        pt2: 端点２
+
+    Note:
+        端点の Point は参照を保持するため、生成後に端点の座標を変更しないこと
+    """
+    pt1: Point
+    pt2: Point
+    a: float = field(init=False)          # 直線 ax + by = c の x の係数
+    b: float = field(init=False)          # 直線 ax + by = c の y の係数
+    c: float = field(init=False)          # 直線 ax + by = c の定数項
+    slope: float = field(init=False)      # 傾き, y 軸に平行な場合は無限大
+    intercept: float = field(init=False)  # y 切片, y 軸に平行な場合は nan
+    minx: float = field(init=False)
+    maxx: float = field(init=False)
+    miny: float = field(init=False)
+    maxy: float = field(init=False)
+    minxPt: Point = field(init=False)
+    maxxPt: Point = field(init=False)
+    minyPt: Point = field(init=False)
+    maxyPt: Point = field(init=False)
+
+    def __post_init__(self):
+        pt1: Point = self.pt1
+        pt2: Point = self.pt2
+        a: float = pt2.y - pt1.y
+        b: float = pt1.x - pt2.x
+        c: float = pt1.x * pt2.y - pt1.y * pt2.x
+        vertical: bool = math.isclose(b, 0, abs_tol=_ABS_TOL)
+        minxPt, maxxPt = (pt1, pt2) if pt1.x < pt2.x else (pt2, pt1)
+        minyPt, maxyPt = (pt1, pt2) if pt1.y < pt2.y else (pt2, pt1)
+
+        # frozen のため、object.__setattr__ で設定する
+        setattr_ = object.__setattr__
+        setattr_(self, "a", a)
+        setattr_(self, "b", b)
+        setattr_(self, "c", c)
+        setattr_(self, "slope", math.inf if vertical else -a / b)
+        setattr_(self, "intercept", math.nan if vertical else c / b)
+        setattr_(self, "minx", minxPt.x)
+        setattr_(self, "maxx", maxxPt.x)
+        setattr_(self, "miny", minyPt.y)
+        setattr_(self, "maxy", maxyPt.y)
+        setattr_(self, "minxPt", minxPt)
+        setattr_(self, "maxxPt", maxxPt)
+        setattr_(self, "minyPt", minyPt)
+        setattr_(self, "maxyPt", maxyPt)
+
+    @classmethod
+    def fromLineSegment(cls, ls: LineSegment) -> Self:
+        """LineSegment から生成する
+
+        Args:
+            ls: 線分
+
+        Returns:
+            同じ端点を持つ線分
+        """
+        return cls(ls.pt1, ls.pt2)
+
+    def isInLineSegment(self, pt: Point) -> bool:
+        """線分上に Point があるか
+
+        LineSegment.isInLineSegment を参照
+        """
+        return self.isOnLineByLineSegment(pt) and self.isInsideRectangle(pt)
+
+    def isOnLineByLineSegment(self, pt: Point) -> bool:
+        """線分を含む直線上に Point があるか
+
+        LineSegment.isOnLineByLineSegment を参照
+        """
+        return orientation(self.pt1, self.pt2, pt) == 0
+
+    def isInsideRectangle(self, pt: Point) -> bool:
+        """線分の両端点が作る四角形内に Point があるか
+
+        LineSegment.isInsideRectangle を参照
+        """
+        return self.minx <= pt.x and pt.x <= self.maxx and self.miny <= pt.y and pt.y <= self.maxy
+
+    def hasCrossPoint(self, other: "AnyLineSegment") -> bool:
+        """線分の交点が存在するか否か
+
+        LineSegment.hasCrossPoint を参照
+        """
+        return self.getCrossPoint(other) is not None
+
+    def getCrossPoint(self, other: "AnyLineSegment") -> Point | None:
+        """線分の交点を求める
+
+        LineSegment.getCrossPoint と同じ計算を行う（交点の状態は保持しない）
+
+        Args:
+            other: もう一方の線分
+        Returns:
+            交点の Point オブジェクト, 交点がない場合は None
+        """
+        # 外接矩形と向きで交差しない組を除いてから交点を求める
+        if _isSeparated(self, other) or crossSign(self.pt1, self.pt2, other.pt1, other.pt2) == 0:
+            # 交差しない, または 2線分が平行
+            return None
+        return self._solveCrossPoint(other)
+
+    def crossPointWithStatus(self, other: "AnyLineSegment") -> tuple[Point | None, CrossPointStatus]:
+        """線分の交点と交点の状態を求める
+
+        LineSegment.crossPointWithStatus を参照
+        """
+        return _crossPointWithStatus(self, other)
+
+    def _solveCrossPoint(self, other: "AnyLineSegment") -> Point:
+        """交差することがわかっている線分との交点を求める
+
+        Args:
+            other: もう一方の線分, 平行でなく交差すること
+        Returns:
+            交点の Point オブジェクト
+        """
+        return _clampedCrossPoint(self, other)
+
+    def calcXIfExist(self, y: float) -> float:
+        """線分上の x 座標値を求める
+
+        LineSegment.calcXIfExist を参照
+        """
+        x, status = self.calcXWithStatus(y)
+        if x is None:
+            if status == CrossPointStatus.PARALLEL:
+                raise RuntimeError("linesegment is parallel to x axis")
+            raise RuntimeError(f"linesegment is not cross to y: {y}")
+        return x
+
+    def calcX(self, y: float) -> float | None:
+        """線分上の x 座標値を求める
+
+        LineSegment.calcX を参照
+        """
+        return self.calcXWithStatus(y)[0]
+
+    def calcXWithStatus(self, y: float) -> tuple[float | None, CrossPointStatus]:
+        """線分上の x 座標値と交点の状態を求める
+
+        LineSegment.calcXWithStatus を参照
+        """
+        if math.isclose(self.a, 0, abs_tol=_ABS_TOL):
+            return None, CrossPointStatus.PARALLEL
+        if not (self.miny <= y and y <= self.maxy):
+            return None, CrossPointStatus.OUT_OF_LINESEGMENT
+        if y == self.miny:
+            return self.minyPt.x, CrossPointStatus.EXIST
+        if y == self.maxy:
+            return self.maxyPt.x, CrossPointStatus.EXIST
+        return min(max((self.c - self.b * y) / self.a, self.minx), self.maxx), CrossPointStatus.EXIST
+
+    def calcYIfExist(self, x: float) -> float:
+        """線分上の y 座標値を求める
+
+        LineSegment.calcYIfExist を参照
+        """
+        y, status = self.calcYWithStatus(x)
+        if y is None:
+            if status == CrossPointStatus.PARALLEL:
+                raise RuntimeError("linesegment is parallel to y axis")
+            raise RuntimeError(f"linesegment is not cross to x: {x}")
+        return y
+
+    def calcY(self, x: float) -> float | None:
+        """線分上の y 座標値を求める
+
+        LineSegment.calcY を参照
+        """
+        return self.calcYWithStatus(x)[0]
+
+    def calcYWithStatus(self, x: float) -> tuple[float | None, CrossPointStatus]:
+        """線分上の y 座標値と交点の状態を求める
+
+        LineSegment.calcYWithStatus を参照
+        """
+        if math.isclose(self.b, 0, abs_tol=_ABS_TOL):
+            return None, CrossPointStatus.PARALLEL
+        if not (self.minx <= x and x <= self.maxx):
+            return None, CrossPointStatus.OUT_OF_LINESEGMENT
+        if x == self.minx:
+            return self.minxPt.y, CrossPointStatus.EXIST
+        if x == self.maxx:
+            return self.maxxPt.y, CrossPointStatus.EXIST
+        return min(max((self.c - self.a * x) / self.b, self.miny), self.maxy), CrossPointStatus.EXIST
+
+
+def _toExact(v: float) -> int | Fraction:
+    """座標値を厳密な値（int または Fraction）に変換する
+    """
+    if isinstance(v, Rational):
+        return v if isinstance(v, int) else Fraction(v)
+    return Fraction(v)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ExactLineSegment(FrozenLineSegment):
+    """厳密な座標の線分クラス
+
+    端点の座標を int または Fraction で保持し、係数・交点・y 座標を許容誤差なしで厳密に求める
+        係数 a, b, c は端点の座標と同じ型（整数座標であれば int）
+        傾き・切片・交点・線分上の座標は Fraction
+    整数座標の場合、交点の判定は整数演算のみで行われる
+
+    ExactLineSegment 同士でのみ交点を求めること（浮動小数点数の座標の線分とは扱わない）
+    """
+
+    def __post_init__(self):
+        FrozenLineSegment.__post_init__(self)
+        object.__setattr__(self, "slope", math.inf if self.b == 0 else Fraction(-self.a, self.b))
+        object.__setattr__(self, "intercept", math.nan if self.b == 0 else Fraction(self.c, self.b))
+
+    @classmethod
+    def fromLineSegment(cls, ls: LineSegment) -> Self:
+        """LineSegment から生成する
+
+        端点の座標は厳密な値に変換する。float の座標は、その値を正確に表す Fraction とする
+
+        Args:
+            ls: 線分
+
+        Returns:
+            同じ端点を持つ線分
+        """
+        return cls(ExactPoint(_toExact(ls.pt1.x), _toExact(ls.pt1.y)), ExactPoint(_toExact(ls.pt2.x), _toExact(ls.pt2.y)))
+
+    def _solveCrossPoint(self, other: "ExactLineSegment") -> ExactPoint:
+        """交差することがわかっている線分との交点を分数で厳密に求める
+
+        ExactLineSegment 同士でのみ用いること
+
+        Args:
+            other: もう一方の線分, 平行でなく交差すること
+        Returns:
+            交点
+        """
+        d: int | Fraction = other.a * self.b - self.a * other.b
+        return ExactPoint(
+            Fraction(other.c * self.b - self.c * other.b) / d,
+            Fraction(self.c * other.a - other.c * self.a) / d)
+
+    def calcXWithStatus(self, y: int | Fraction) -> tuple[Fraction | None, CrossPointStatus]:
+        """線分上の x 座標値と交点の状態を分数で厳密に求める
+
+        LineSegment.calcXWithStatus を参照
+        """
+        if self.a == 0:
+            return None, CrossPointStatus.PARALLEL
+        if not (self.miny <= y and y <= self.maxy):
+            return None, CrossPointStatus.OUT_OF_LINESEGMENT
+        return Fraction(self.c - self.b * y, self.a), CrossPointStatus.EXIST
+
+    def calcYWithStatus(self, x: int | Fraction) -> tuple[Fraction | None, CrossPointStatus]:
+        """線分上の y 座標値と交点の状態を分数で厳密に求める
+
+        LineSegment.calcYWithStatus を参照
+        """
+        if self.b == 0:
+            return None, CrossPointStatus.PARALLEL
+        if not (self.minx <= x and x <= self.maxx):
+            return None, CrossPointStatus.OUT_OF_LINESEGMENT
+        return Fraction(self.c - self.a * x, self.b), CrossPointStatus.EXIST
 
 
+# 線分の型（LineSegment, FrozenLineSegment または ExactLineSegment）
+AnyLineSegment = LineSegment | FrozenLineSegment
@@ -0,0 +1,112 @@
+"""メモリ使用量の見積もりモジュール
+
+sys.getsizeof を用いて、オブジェクトが参照するオブジェクトまで
+たどってメモリ使用量を見積もる
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+import sys
+import types
+
+# 所有していない（共有されている）とみなしてたどらない型
+_SHARED_TYPES: tuple[type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    Enum,
+)
+
+@dataclass
+class TreeMemoryReport:
+    """2-3木のメモリ使用量
+
+    bytes で始まる値は sys.getsizeof による見積もり値
+    サンプリングした場合は、サンプルの平均値を要素数倍して合計を見積もる
+    """
+    leafCount: int             # 葉の数
+    internalCount: int         # 内部節点の数（root を含む）
+    height: int                # 木の高さ
+    bytesPerLeaf: float        # 葉 1 個あたりのバイト数（cargo を除く）
+    bytesPerInternal: float    # 内部節点 1 個あたりのバイト数
+    bytesPerCargo: float       # 葉が保持するオブジェクト 1 個あたりのバイト数（参照先を含む）
+    totalBytes: int            # 合計バイト数の見積もり
+    sampleRate: float          # サンプリング率, 1.0 の場合は全数
+
+
+@dataclass
+class SweepMemoryReport:
+    """平面走査法のメモリ使用量
+    """
+    statusReport: TreeMemoryReport | None  # 走査線上の線分 _A
+    eventReport: TreeMemoryReport | None   # イベント _B
+    crossesCount: int                      # 交点の数
+    crossesBytes: int                      # 交点のリストのバイト数（参照先を含む）
+    segmentsCount: int                     # 線分の数
+    segmentsBytes: int                     # 線分のリストのバイト数（参照先を含む）
+    totalBytes: int                        # 合計バイト数の見積もり
+
+
+def shallowSizeOf(obj: object) -> int:
+    """オブジェクト自身のバイト数
+
+    インスタンスの属性辞書 __dict__ は、オブジェクト自身の一部として含める
+
+    Args:
+        obj: 対象のオブジェクト
+
+    Returns:
+        バイト数
+    """
+    size: int = sys.getsizeof(obj)
+    d = getattr(obj, "__dict__", None)
+    if isinstance(d, dict):
+        size += sys.getsizeof(d)
+    return size
+
+
+def deepSizeOf(obj: object, seen: set[int] | None = None) -> int:
+    """オブジェクトが参照するオブジェクトまで含めたバイト数
+
+    seen に含まれるオブジェクトは数えない。また、数えたオブジェクトは seen に追加する
+    このため、共有されているオブジェクトは、seen を引き継いで呼び出すことで一度だけ数えられる
+
+    型、関数、モジュール、Enum のメンバーは共有されているとみなして数えない
+
+    Args:
+        obj: 対象のオブジェクト
+        seen: 数え済みのオブジェクトの id の集合
+
+    Returns:
+        バイト数
+    """
+    if seen is None:
+        seen = set()
+
+    size: int = 0
+    stack: list[object] = [obj]
+    while len(stack) > 0:
+        o: object = stack.pop()
+        if id(o) in seen or isinstance(o, _SHARED_TYPES):
+            continue
+        seen.add(id(o))
+        size += shallowSizeOf(o)
+
+        # 参照先
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif not isinstance(o, (str, bytes, int, float, complex, bool)):
+            d = getattr(o, "__dict__", None)
+            if isinstance(d, dict):
+                stack.extend(d.values())
+            for cls in type(o).__mro__:
+                slots = getattr(cls, "__slots__", ())
+                for name in ((slots,) if isinstance(slots, str) else slots):
+                    if name not in ("__dict__", "__weakref__") and hasattr(o, name):
+                        stack.append(getattr(o, name))
+    return size
@@ -10,7 +10,11 @@ class Point:
     Attributes:
         x: x 座標
         y: y 座標
+
+    Note:
+        交点・イベントごとに生成されるため、__slots__ により __dict__ を持たないようにする
     """
+    __slots__ = ("x", "y")
 
     def __init__(self, x: float | None = None, y: float | None = None):
         self.x : float = 0 if x is None else x
@@ -39,3 +43,30 @@ class Point:
         
     def __eq__(self, other: Self) -> bool:
         return math.isclose(self.x, other.x) and math.isclose(self.y, other.y)
+
+
+class ExactPoint(Point):
+    """厳密な座標の点クラス
+
+    座標を int または fractions.Fraction（有理数）で保持し、許容誤差を用いずに一致を判定する
+    有理数同士の比較は、分子・分母の整数の交差乗算で行われる
+
+    Attributes:
+        x: x 座標
+        y: y 座標
+    """
+    __slots__ = ()
+
+    def __eq__(self, other: Point) -> bool:
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def toPoint(self) -> Point:
+        """浮動小数点数の座標の点に変換する
+
+        Returns:
+            座標を float とした点
+        """
+        return Point(float(self.x), float(self.y))
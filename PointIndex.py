@@ -0,0 +1,119 @@
+"""点の索引モジュール
+
+Point.__eq__ (math.isclose) の意味で一致する点を、ハッシュにより O(1) で検索する
+"""
+
+import math
+from Point import Point
+
+# math.isclose の既定の相対許容誤差
+_REL_TOL: float = 1e-9
+
+# 仮数部の量子化の分割数
+#   1 セルの幅は値の大きさに対して 1/_MANTISSA_CELLS ～ 2/_MANTISSA_CELLS の相対幅となる
+#   一致とみなす範囲（相対幅 約 2 * _REL_TOL）よりも十分大きくすることで、
+#   一致しうる点は、探索範囲の両端が属する高々２つのセルに含まれる
+_MANTISSA_CELLS: int = 2 ** 26
+
+def _cell(v: float) -> tuple[int, int, int]:
+    """座標値を量子化したセルのキー
+
+    符号, 指数部, 仮数部の順に並ぶため、キーは値に対して単調となる
+
+    Args:
+        v: 座標値
+
+    Returns:
+        セルのキー
+    """
+    if v == 0:
+        return (0, 0, 0)
+    m, e = math.frexp(abs(v))
+    return (1 if v > 0 else -1, e, int(m * _MANTISSA_CELLS))
+
+def _cells(v: float) -> set[tuple[int, int, int]]:
+    """v と一致しうる値が属するセルのキー
+
+    math.isclose(v, w) が成り立つ w は |v - w| <= rel_tol * |v| / (1 - rel_tol) を満たすので、
+    その範囲の両端のセルを返す
+
+    Args:
+        v: 座標値
+
+    Returns:
+        セルのキーの集合
+    """
+    d: float = 2 * _REL_TOL * abs(v)
+    return {_cell(v - d), _cell(v + d)}
+
+
+class PointIndex:
+    """点の索引
+
+    座標を相対誤差に応じたグリッドに量子化し、セルごとに点を管理する
+    検索時は近傍のセルのみを調べ、Point.__eq__ と同じ判定を行う
+    """
+
+    def __init__(self):
+        self._cells: dict[tuple[tuple[int, int, int], tuple[int, int, int]], list[Point]] = {}
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, pt: Point) -> bool:
+        return self.find(pt) is not None
+
+    def add(self, pt: Point):
+        """点を追加する
+
+        同じ点が既にあるか否かは確認しない
+
+        Args:
+            pt: 追加する点
+        """
+        self._cells.setdefault((_cell(pt.x), _cell(pt.y)), []).append(pt)
+        self._size += 1
+
+    def find(self, pt: Point) -> Point | None:
+        """一致する点を検索する
+
+        Args:
+            pt: 検索する点
+
+        Returns:
+            Point.__eq__ で一致する追加済みの点, 見つからない場合は None
+        """
+        for cx in _cells(pt.x):
+            for cy in _cells(pt.y):
+                lst: list[Point] | None = self._cells.get((cx, cy))
+                if lst is None:
+                    continue
+                for p in lst:
+                    if p == pt:
+                        return p
+        return None
+
+    def remove(self, pt: Point):
+        """点を削除する
+
+        追加したオブジェクトそのもの（同一性で判定）を削除する
+
+        Args:
+            pt: 削除する点
+        """
+        key = (_cell(pt.x), _cell(pt.y))
+        lst: list[Point] | None = self._cells.get(key)
+        if lst is None:
+            return
+        for i, p in enumerate(lst):
+            if p is pt:
+                del lst[i]
+                self._size -= 1
+                if len(lst) == 0:
+                    del self._cells[key]
+                return
+
+    def clear(self):
+        self._cells.clear()
+        self._size = 0
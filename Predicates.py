@@ -0,0 +1,116 @@
+"""幾何述語モジュール
+
+線分の向き・平行の判定を、許容誤差を用いずに厳密に行う
+
+浮動小数点数の座標では、まず浮動小数点演算で値を求め、丸め誤差の上限（前進誤差限界）より
+値の絶対値が大きければその符号を結果とする。誤差限界内の場合のみ fractions.Fraction で厳密に計算し直す
+int, Fraction の座標では、最初の計算がそのまま厳密な値となる
+それ以外の型（numpy.int64 等）の座標は、常に分数で計算する
+"""
+
+from fractions import Fraction
+import sys
+from Point import Point
+
+# 丸めの単位（2 ** -53）
+_EPS: float = sys.float_info.epsilon / 2
+
+# 差の積２つの差 (a - b)(c - d) - (e - f)(g - h) の前進誤差限界の係数
+#   浮動小数点演算の結果を det, ２つの積を left, right とすると、
+#   |det - 厳密な値| <= _CROSS_ERR_BOUND * (|left| + |right|)
+#   （J. R. Shewchuk, Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates の orient2d と同じ限界）
+_CROSS_ERR_BOUND: float = (3.0 + 16.0 * _EPS) * _EPS
+
+def _sign(v) -> int:
+    return (v > 0) - (v < 0)
+
+def _toFraction(v) -> Fraction:
+    if isinstance(v, (float, int, Fraction)):
+        return Fraction(v)
+    # numpy.int64 等は桁あふれしないよう、分子・分母を Python の int とする
+    f: Fraction = Fraction(v)
+    return Fraction(int(f.numerator), int(f.denominator))
+
+def _crossSign(x1, y1, x2, y2, x3, y3, x4, y4) -> int:
+    """ベクトル (x2 - x1, y2 - y1) と (x4 - x3, y4 - y3) の外積の符号
+
+    Returns:
+        外積が正であれば 1, 負であれば -1, 0 であれば 0
+    """
+    left = (x2 - x1) * (y4 - y3)
+    right = (y2 - y1) * (x4 - x3)
+    det = left - right
+    if isinstance(det, (int, Fraction)):
+        # int, Fraction の座標では厳密な値
+        return _sign(det)
+
+    if isinstance(det, float):
+        # numpy.float64 等の float のサブクラスを含む
+        bound: float = _CROSS_ERR_BOUND * (abs(left) + abs(right))
+        if det > bound:
+            return 1
+        if -det > bound:
+            return -1
+
+    # 誤差限界内、または厳密な値か否かが分からない型のため、分数で計算し直す
+    x1, y1, x2, y2, x3, y3, x4, y4 = map(_toFraction, (x1, y1, x2, y2, x3, y3, x4, y4))
+    return _sign((x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3))
+
+def orientation(p: Point, q: Point, r: Point) -> int:
+    """３点の向き
+
+    Args:
+        p: 点
+        q: 点
+        r: 判定対象の点
+
+    Returns:
+        p から q への直線に対して r が左側（反時計回り）であれば 1, 右側（時計回り）であれば -1,
+        直線上（３点が同一直線上）であれば 0
+    """
+    return _crossSign(p.x, p.y, q.x, q.y, p.x, p.y, r.x, r.y)
+
+def crossSign(p1: Point, p2: Point, q1: Point, q2: Point) -> int:
+    """２線分の方向ベクトルの外積の符号
+
+    Args:
+        p1: 一方の線分の端点１
+        p2: 一方の線分の端点２
+        q1: もう一方の線分の端点１
+        q2: もう一方の線分の端点２
+
+    Returns:
+        p1 → p2 に対して q1 → q2 が反時計回りであれば 1, 時計回りであれば -1, 平行であれば 0
+    """
+    return _crossSign(p1.x, p1.y, p2.x, p2.y, q1.x, q1.y, q2.x, q2.y)
+
+def sameSide(p: Point, q: Point, r1: Point, r2: Point) -> bool:
+    """２点が直線の同じ側にあるか否か
+
+    orientation(p, q, r1) * orientation(p, q, r2) > 0 と同じ結果を返す
+    線分の交差判定で繰り返し用いるため、符号が確定する場合は関数呼び出しなしで判定する
+
+    Args:
+        p: 直線上の点
+        q: 直線上の点
+        r1: 判定対象の点
+        r2: 判定対象の点
+
+    Returns:
+        r1, r2 が p から q への直線の同じ側にあれば True, いずれかが直線上にあれば False
+    """
+    px, py = p.x, p.y
+    dx, dy = q.x - px, q.y - py
+    left = dx * (r1.y - py)
+    right = dy * (r1.x - px)
+    det1 = left - right
+    if not abs(det1) > _CROSS_ERR_BOUND * (abs(left) + abs(right)):
+        det1 = orientation(p, q, r1)
+        if det1 == 0:
+            return False
+    left = dx * (r2.y - py)
+    right = dy * (r2.x - px)
+    det2 = left - right
+    if not abs(det2) > _CROSS_ERR_BOUND * (abs(left) + abs(right)):
+        det2 = orientation(p, q, r2)
+    return (det1 > 0 and det2 > 0) or (det1 < 0 and det2 < 0)
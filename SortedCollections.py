@@ -0,0 +1,319 @@
+"""ソート済みコレクションモジュール
+
+2-3木を用いて、キーの自然な順序（<, > による比較）で要素を管理する
+辞書 SortedDict および集合 SortedSet を提供する
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from TwoThreeTree import Aggregator, Leaf, Node, TwoThreeTree
+
+@dataclass
+class _Item:
+    """SortedDict の要素
+    """
+    key: Any    # キー
+    value: Any  # 値
+
+class _ItemLeaf(Leaf[_Item]):
+
+    def __init__(self, val: _Item, parent: Node[_Item] | None):
+        super().__init__(val, parent, self._get_item_key, self._comp_item_key)
+
+    def _get_item_key(self, v: _Item) -> str:
+        return str(v.key)
+
+    def _comp_item_key(self, v1: _Item, v2: _Item) -> int:
+        if v1.key < v2.key:
+            return -1
+        elif v1.key > v2.key:
+            return 1
+        return 0
+
+def _itemleaf_ctor(v: _Item, parent: Node[_Item]):
+    return _ItemLeaf(v, parent)
+
+
+class SortedDict:
+    """キーの順に並ぶ辞書
+
+    2-3木の各内部節点に部分木の要素数を保持し、順位に関する操作
+    （bisect_left, bisect_right, peekitem, popitem）を O(log n) で行う
+    """
+
+    def __init__(self, iterable: Iterable[tuple[Any, Any]] | dict | None = None):
+        """コンストラクタ
+
+        Args:
+            iterable: 初期要素, 辞書または (キー, 値) の組の列
+        """
+        self._tree: TwoThreeTree[_ItemLeaf, _Item] = TwoThreeTree[_ItemLeaf, _Item](
+            _itemleaf_ctor,
+            # 部分木の要素数
+            Aggregator[_Item, int](0, lambda a, b: a + b, lambda v: 1))
+
+        if iterable is not None:
+            self.update(iterable)
+
+    def __len__(self) -> int:
+        return self._tree.root.agg_val
+
+    def __contains__(self, key: Any) -> bool:
+        return self._tree.search(_Item(key, None)) is not None
+
+    def __iter__(self) -> Iterator[Any]:
+        return (lf.cargo.key for lf in self._iter_leaves(self._tree.minimum(), False))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return (lf.cargo.key for lf in self._iter_leaves(self._tree.maximum(), True))
+
+    def __getitem__(self, key: Any) -> Any:
+        lf: Leaf[_Item] | None = self._tree.search(_Item(key, None))
+        if lf is None:
+            raise KeyError(key)
+        return lf.cargo.value
+
+    def __setitem__(self, key: Any, value: Any):
+        item: _Item = _Item(key, value)
+        lf: Leaf[_Item] = self._tree.insert(item)
+        if lf.cargo is not item:
+            # 既にキーが存在する場合は値のみ更新
+            lf.cargo.value = value
+
+    def __delitem__(self, key: Any):
+        if key not in self:
+            raise KeyError(key)
+        self._tree.delete(_Item(key, None))
+
+    def __repr__(self) -> str:
+        return f"SortedDict({{{', '.join(f'{k!r}: {v!r}' for k, v in self.items())}}})"
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        lf: Leaf[_Item] | None = self._tree.search(_Item(key, None))
+        if lf is None:
+            return default
+        return lf.cargo.value
+
+    def update(self, iterable: Iterable[tuple[Any, Any]] | dict):
+        """要素をまとめて追加する
+
+        Args:
+            iterable: 辞書または (キー, 値) の組の列
+        """
+        pairs: Iterable[tuple[Any, Any]] = iterable.items() if isinstance(iterable, dict) else iterable
+        for k, v in pairs:
+            self[k] = v
+
+    def clear(self):
+        self._tree.removeAll()
+
+    def keys(self) -> Iterator[Any]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        return (lf.cargo.value for lf in self._iter_leaves(self._tree.minimum(), False))
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        return ((lf.cargo.key, lf.cargo.value) for lf in self._iter_leaves(self._tree.minimum(), False))
+
+    def bisect_left(self, key: Any) -> int:
+        """キーを挿入する位置（同じキーがある場合はその前）
+
+        Args:
+            key: 対象のキー
+
+        Returns:
+            key より小さいキーの数
+        """
+        return self.bisect_right(key) - (1 if key in self else 0)
+
+    def bisect_right(self, key: Any) -> int:
+        """キーを挿入する位置（同じキーがある場合はその後）
+
+        Args:
+            key: 対象のキー
+
+        Returns:
+            key 以下のキーの数
+        """
+        first: Leaf[_Item] | None = self._tree.minimum()
+        if first is None:
+            return 0
+        return self._tree.aggregate(first.cargo, _Item(key, None))
+
+    def irange(self, minimum: Any = None, maximum: Any = None,
+               inclusive: tuple[bool, bool] = (True, True), reverse: bool = False) -> Iterator[Any]:
+        """範囲内のキーを順に返す
+
+        Args:
+            minimum: 範囲の下限, None の場合は下限なし
+            maximum: 範囲の上限, None の場合は上限なし
+            inclusive: (下限を含むか, 上限を含むか)
+            reverse: True の場合は降順
+
+        Returns:
+            キーのイテレータ
+        """
+        if not reverse:
+            start: Leaf[_Item] | None = self._find_start(minimum, inclusive[0], False)
+            for lf in self._iter_leaves(start, False):
+                if maximum is not None and (lf.cargo.key > maximum or (not inclusive[1] and lf.cargo.key == maximum)):
+                    return
+                yield lf.cargo.key
+        else:
+            start = self._find_start(maximum, inclusive[1], True)
+            for lf in self._iter_leaves(start, True):
+                if minimum is not None and (lf.cargo.key < minimum or (not inclusive[0] and lf.cargo.key == minimum)):
+                    return
+                yield lf.cargo.key
+
+    def peekitem(self, index: int = -1) -> tuple[Any, Any]:
+        """順位を指定して要素を取得する
+
+        Args:
+            index: 順位, 負の値の場合は末尾から数える
+
+        Returns:
+            (キー, 値)
+        """
+        lf: Leaf[_Item] = self._select(index)
+        return (lf.cargo.key, lf.cargo.value)
+
+    def popitem(self, index: int = -1) -> tuple[Any, Any]:
+        """順位を指定して要素を取り出す
+
+        Args:
+            index: 順位, 負の値の場合は末尾から数える
+
+        Returns:
+            (キー, 値)
+        """
+        lf: Leaf[_Item] = self._select(index)
+        item: _Item = lf.cargo
+        self._tree.delete(item)
+        return (item.key, item.value)
+
+    def _select(self, index: int) -> Leaf[_Item]:
+        """順位を指定して葉を取得する
+
+        内部節点の部分木の要素数を用いて、根から一度だけたどる
+
+        Args:
+            index: 順位, 負の値の場合は末尾から数える
+
+        Returns:
+            葉
+        """
+        size: int = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or size <= index:
+            raise IndexError("index out of range")
+
+        nd: Node[_Item] = self._tree.root
+        while not isinstance(nd, Leaf):
+            for child in (nd.left, nd.mid, nd.right):
+                if child is None:
+                    raise RuntimeError("invalid structure. maybe logical error")
+                count: int = 1 if isinstance(child, Leaf) else child.agg_val
+                if index < count:
+                    nd = child
+                    break
+                index -= count
+        return nd
+
+    def _find_start(self, key: Any, inclusive: bool, reverse: bool) -> Leaf[_Item] | None:
+        """範囲の走査を開始する葉を求める
+
+        Args:
+            key: 範囲の境界, None の場合は境界なし
+            inclusive: 境界を含むか
+            reverse: True の場合は降順に走査する
+
+        Returns:
+            走査を開始する葉, ない場合は None
+        """
+        if key is None:
+            return self._tree.maximum() if reverse else self._tree.minimum()
+
+        below, hit, above = self._tree.neighbors(_Item(key, None), 1, 1)
+        if hit is not None and inclusive:
+            return hit
+        if reverse:
+            return below[0] if len(below) > 0 else None
+        return above[0] if len(above) > 0 else None
+
+    def _iter_leaves(self, start: Leaf[_Item] | None, reverse: bool) -> Iterator[Leaf[_Item]]:
+        lf: Leaf[_Item] | None = start
+        while lf is not None:
+            yield lf
+            lf = self._tree.predecessor(lf) if reverse else self._tree.successor(lf)
+
+
+class SortedSet:
+    """要素の順に並ぶ集合
+
+    値を持たない SortedDict として実装する
+    """
+
+    def __init__(self, iterable: Iterable[Any] | None = None):
+        """コンストラクタ
+
+        Args:
+            iterable: 初期要素
+        """
+        self._dict: SortedDict = SortedDict()
+        if iterable is not None:
+            self.update(iterable)
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._dict
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._dict)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._dict)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._dict.peekitem(index)[0]
+
+    def __delitem__(self, index: int):
+        self._dict.popitem(index)
+
+    def __repr__(self) -> str:
+        return f"SortedSet([{', '.join(repr(k) for k in self)}])"
+
+    def add(self, key: Any):
+        self._dict[key] = None
+
+    def update(self, iterable: Iterable[Any]):
+        for k in iterable:
+            self.add(k)
+
+    def discard(self, key: Any):
+        if key in self._dict:
+            del self._dict[key]
+
+    def remove(self, key: Any):
+        del self._dict[key]
+
+    def clear(self):
+        self._dict.clear()
+
+    def pop(self, index: int = -1) -> Any:
+        return self._dict.popitem(index)[0]
+
+    def bisect_left(self, key: Any) -> int:
+        return self._dict.bisect_left(key)
+
+    def bisect_right(self, key: Any) -> int:
+        return self._dict.bisect_right(key)
+
+    def irange(self, minimum: Any = None, maximum: Any = None,
+               inclusive: tuple[bool, bool] = (True, True), reverse: bool = False) -> Iterator[Any]:
+        return self._dict.irange(minimum, maximum, inclusive, reverse)
@@ -1,205 +1,21 @@
 
 import math
-from enum import Enum, auto, unique
 import sys
-from dataclasses import dataclass
-from Point import Point
-from LineSegment import CrossPointStatus, LineSegment
-from TwoThreeTree import Leaf, Node, TwoThreeTree
+from EventQueue import BNode, EventQueue, EventQueueType, EventType, createEventQueue
+from MemoryReport import SweepMemoryReport, TreeMemoryReport, deepSizeOf
+from Point import ExactPoint, Point
+from PointIndex import PointIndex
+from Predicates import crossSign
+from LineSegment import AnyLineSegment, ExactLineSegment, FrozenLineSegment
+from SweepStatus import ANode, StatusHandle, Sweepline, SweepStatus, SweepStatusType, createSweepStatus
 
 # for debug
 #import datetime
 
-# 走査線を移動させる際の微小値
-_DELTA = 1e-5
+# 点を通る線分の判定で用いる y 座標の絶対許容誤差
+#   イベントの点は丸め誤差を含む交点でもあるため、浮動小数点数の計算では線分が点を厳密に通るかでは判定できない
+_Y_ABS_TOL: float = 1e-9
 
-@unique
-class EventType(Enum):
-    """イベント種類の enum
-
-    平面走査法のイベント種類を表す
-    """
-    LEFT  = auto()  # 左端点
-    CROSS = auto()  # 交点
-    RIGHT = auto()  # 右端点
-
-
-@dataclass
-class BNode:
-    """平面走査法で用いるイベント管理するための Node 要素
-    """
-    eventType: EventType     # イベント種類
-    pt: Point                # イベントに対する Point, この X 座標がメインのキー
-    ls: LineSegment          # Point が存在する線分
-    ls2: LineSegment | None  # イベントが交点の場合の２つ目の線分
-    lnId: int | None         # 線分 ID, 端点追加時のみ割り当てる
-
-class LeafB(Leaf[BNode]):
-
-    def __init__(self, val: BNode, parent: Node[BNode] | None):
-        super().__init__(val, parent, self._get_leafb_key, self._comp_leafb_key)
-
-    def _get_leafb_key(self, v: BNode) -> str:
-        return f"({v.pt.x}, {v.pt.y}), {v.eventType}"
-    
-    def _comp_leafb_key(self, v1: BNode, v2: BNode) -> int:
-        '''イベント要素の比較関数
-
-        走査線上に端点および交点が複数存在する場合に対応できるように、
-        x および y 座標を用いて同一 Node であるか判定する（x 座標が優先）
-        
-        そのうえで、イベントとしては交点を優先的に処理する
-        （走査線上に交点と端点がある場合、先に交点を処理して線分を入れ替えて
-        おかないと、端点追加に伴う上下の線分が正しく判定できなくなる）
-
-        また、線分の端点が重なっている場合へ対応するため、以下のようにする
-        ・イベント種類が異なる場合は、左端点を優先する（走査線上に線分を追加するのを優先する）
-        ・線分 ID により、同一 Node であるかを判定する（一方の線分 ID がないような場合は同じとみなす）
-
-        上記を踏まえると下記の優先順位で比較を行うこととする
-            x 座標の大小
-            イベントタイプ（交点、その他の順）、交点のほうが小さい（先に処理される）
-            y 座標の大小
-            端点が異なる場合は、イベントタイプ（左端点、右端点の順）、左端点を持つ方が小さい（先に処理される）
-            線分 ID（交点同士以外の場合）、線分 ID が小さい（先に処理される）
-        
-        Args:
-            v1: 比較要素1
-            v2: 比較要素2
-
-        Returns:
-            0: 一致,  負の値: v1 < v2,  正の値: v1 > v2
-        '''
-        if math.isclose(v1.pt.x, v2.pt.x):
-            if v1.eventType == EventType.CROSS and v2.eventType != EventType.CROSS:
-                return -1
-            elif v1.eventType != EventType.CROSS and v2.eventType == EventType.CROSS:
-                return 1
-            else:
-                #イベントタイプが同種類（交点同士または交点以外同士）の場合は y 座標を用いて判定する
-                if math.isclose(v1.pt.y, v2.pt.y):
-                    # y 座標が同じ場合は、交点同士かそれ以外かで判定方法を切り替える
-
-                    # 交点同士の場合
-                    if v1.eventType == EventType.CROSS and v2.eventType == EventType.CROSS:
-                        return 0
-                    
-                    # 交点同士の比較以外は 線分ID で同一か否かを判定
-                    #   線分の端点に該当するため ID が異なっていれば、異なる点として扱う
-                    if v1.lnId is None or v2.lnId is None:
-                        return 0
-                    else:
-                        # 線分 ID がある場合は、先に、イベントタイプで判定
-                        #   イベントタイプ異なる場合は、左端点を優先する(走査線上に追加する処理を優先する）
-                        if v1.eventType == EventType.LEFT and v2.eventType == EventType.RIGHT:
-                            return -1
-                        elif v1.eventType == EventType.RIGHT and v2.eventType == EventType.LEFT:
-                            return 1
-                    
-                        if v1.lnId > v2.lnId:
-                            return 1
-                        elif v1.lnId < v2.lnId:
-                            return -1
-                        else:
-                            return 0
-                if v1.pt.y < v2.pt.y:
-                    return -1
-                else:
-                    return 1
-        if v1.pt.x < v2.pt.x:
-            return -1
-        else:
-            return 1    
-
-def leafb_ctor(v: BNode, parent: Node[BNode]):
-    return LeafB(v, parent)
-
-
-@dataclass
-class Sweepline:
-    x: float   # 走査線の x 座標
-
-@dataclass
-class ANode:
-    """平面走査法で用いる走査線上の線分を管理するための Node 要素
-    """
-    ls: LineSegment      # Point が存在する線分, 走査線上における線分の y 座標をキーとする
-
-class LeafA(Leaf[ANode]):
-    _delta_x : float = -1 * _DELTA
-
-    def __init__(self, val: ANode, parent: Node[ANode] | None, sweepline: Sweepline):
-        super().__init__(val, parent,
-                         # func_get_val -> str
-                         #   走査線の x 座標における 線分の y 座標 を求める
-                         lambda v: str(v.ls.calcYIfExist(sweepline.x)),
-                         # func_comp -> int
-                         #   走査線の x 座標における 2線分の y 座標 を比較する
-                        self._comp)
-        self._sweepline: Sweepline = sweepline
-
-    def _comp(self, v1: ANode, v2: ANode) -> int:
-        """走査線の x 座標における ２線分（ANodeとして与える）の y 座標 を比較する
-            
-            v1 の y 座標のほうが大きい場合に正の値を返す
-
-        Args:
-            v1: 線分を含む ANode
-            v2: 線分を含む ANode
-
-        Returns:
-            v1 の y 座標 > v2 の y 座標 => 正の値
-            v1 の y 座標 == v2 の y 座標 => 0
-            v1 の y 座標 < v2 の y 座標 => 負の値
-        """
-        # 走査線上の y 座標を比較
-        if (math.isclose(v1.ls.calcYIfExist(self._sweepline.x), v2.ls.calcYIfExist(self._sweepline.x))):
-            # 走査線上の y 座標が同じ場合への対応
-
-            # 線分が同じであれば、走査線上の同一点（同一線分）と考え、一致とする
-            if ((v1.ls.pt1 == v2.ls.pt1 and v1.ls.pt2 == v2.ls.pt2) or
-                (v1.ls.pt1 == v2.ls.pt2 and v1.ls.pt2 == v2.ls.pt1)):
-                return 0
-            
-            # 異なる線分同士の場合は、交点である可能性が高い。なので、少しずらして線分の上下を判定する
-            #   ずらすのは走査線の進行方向の逆向きとする（交点通過により並びが変わらないようにするため）
-            y1: float | None
-            y2: float | None
-            try:
-                y1 = v1.ls.calcYIfExist(self._sweepline.x + LeafA._delta_x)
-            except:
-                y1 = None
-            try:
-                y2 = v2.ls.calcYIfExist(self._sweepline.x + LeafA._delta_x)
-            except:
-                y2 = None
-
-            if y1 is not None and y2 is not None:
-                if math.isclose(y1, y2):
-                    return 0
-                elif y1 < y2:
-                    return -1
-                elif y1 > y2:
-                    return 1
-                
-            # すらした結果、一方が範囲外で計算できない場合、走査線上に左端点がある線分と
-            # そうではない線分からなると思われるので、一致ではなく、走査線上に左端点がある線分を優先させる
-            #   もれなく交点を求められるように、走査線上に線分を追加するのを優先させるという意図
-            if v1.ls.status == CrossPointStatus.OUT_OF_LINESEGMENT and v2.ls.status == CrossPointStatus.EXIST:
-                # v1 が左端点 -> v1 を優先
-                return -1
-            elif v1.ls.status == CrossPointStatus.EXIST and v2.ls.status == CrossPointStatus.OUT_OF_LINESEGMENT:
-                # v2 が左端点 -> v2 を優先
-                return 1
-            # すらした結果、共に範囲外で計算できない場合などは、例外を投げる
-            raise RuntimeError(f"line calculation error, comparing 2 lines: {v1.ls.status = }, {v2.ls.status = }, sweep line x is {self._sweepline.x}")
-            
-        elif (v1.ls.calcYIfExist(self._sweepline.x) < v2.ls.calcYIfExist(self._sweepline.x)):
-            return -1
-        elif (v1.ls.calcYIfExist(self._sweepline.x) > v2.ls.calcYIfExist(self._sweepline.x)):
-            return 1
-        # ここにはこないはず
-        raise RuntimeError(f"invalid compare y values, sweepline x is {self._sweepline.x}")
 
 class SweepLineMethod:
     """平面走査法
@@ -209,229 +25,504 @@ class SweepLineMethod:
     Y軸に平行な走査線を、X軸に沿ってマイナス方向からプラス方向に走査させて、
     交点を求める
 
+    浮動小数点数の計算では、線分の端点・交点を通る線分の判定に許容誤差（_Y_ABS_TOL）を用いる
+    このため、0.1 刻みの座標のように２進数で正確に表せない座標で、端点が他の線分に
+    十進数では乗る場合（T 字の接触）は、２進数の値では乗らず LineSegment.getCrossPoint が
+    交点なしとする場合でも、走査では交点とする
+    ２進数の値のとおりに判定するには exact=True とし、十進数の値のとおりに判定するには
+    座標を Fraction（Fraction("0.1") 等）として exact=True とする
+
     _L         : 線分のリスト
+    _segments  : 走査に用いる線分のリスト, _L の各線分を係数等を保持する FrozenLineSegment としたもの
     _sweepline : 走査線
-    _A         : 走査線上に存在する線分の配列, 2-3木で管理
-    _B         : イベントの配列, 2-3木で管理
+    _A         : 走査線上に存在する線分の配列, SweepStatus の実装（2-3木, スキップリスト, ブロックのリスト）で管理
+    _B         : イベントの配列, EventQueue の実装（2-3木, 二分ヒープ, バケット）で管理
     _crosses   : 交点のリスト
+    _crossIndex: 交点の索引, 発見済みの交点の判定に用いる
+    _handles   : 線分 ID から _A の要素への対応, 右端点・交点のイベントで _A の探索を省略する
+    _checkedPairs: 交点を確認済みの線分の組（線分 ID の組）, 右端点を通過した線分の組は取り除く
+    _verticals : 走査線に平行な線分の x 座標ごとのリスト, 走査線がその x 座標に達した際にまとめて処理する
+    _leftsAt   : 走査線に平行な線分がある x 座標に左端点を持つ線分の、左端点の y 座標のリスト
+    _exact     : 厳密な計算を行うか否か
+                 True の場合、線分を ExactLineSegment とし、座標・交点を int, Fraction で扱い、許容誤差を用いずに判定する
+                 交点は出力時にのみ浮動小数点数に変換する
+    _executed  : 実行済みか否か, 再度実行する場合は reset で _A, _B などを空にして再利用する
     """
-    _delta_x : float = _DELTA       # 交点を持つ線分の上下判定の際に用いる微小値
-    _PARALLEL_DELTA_X: float = 1.0  # 走査線に平行な線分の判定で用いる値
+    _CHECKED_PAIRS_MAX: int = 1 << 16  # 確認済みの線分の組を保持する最大数
 
-    def __init__(self, lses: list[LineSegment]):
+    def __init__(self, lses: list[AnyLineSegment], eventQueueType: EventQueueType = EventQueueType.TREE,
+                 sweepStatusType: SweepStatusType = SweepStatusType.TREE, exact: bool = False):
         """コンストラクタ
 
         Args:
-            lses  線分のリスト
+            lses  線分のリスト, LineSegment は FrozenLineSegment（厳密な計算の場合は ExactLineSegment）に変換して用いる
+            eventQueueType  イベントの管理に用いるキューの種類
+            sweepStatusType  走査線上の線分の管理に用いる構造の種類
+            exact  厳密な計算を行うか否か, 浮動小数点数による計算より遅いため、既定では行わない
         """
-        self._L: list[LineSegment] = lses
+        self._eventQueueType: EventQueueType = eventQueueType
+        self._L: list[AnyLineSegment] = lses
+        self._exact: bool = exact
+        self._segments: list[FrozenLineSegment] = SweepLineMethod._toSegments(lses, self._exact)
 
         # 平面走査法で用いる配列を準備
-        self._sweepline: Sweepline = Sweepline(-sys.float_info.max)
-        self._A: TwoThreeTree[LeafA, ANode] = TwoThreeTree[LeafA, ANode](lambda v, p : LeafA(v, p, self._sweepline)) # sweepline が必要で、かつ実行時にバインドしたいので、lambdaで定義する
-        self._B: TwoThreeTree[LeafB, BNode] = TwoThreeTree[LeafB, BNode](leafb_ctor)
+        self._sweepline: Sweepline = Sweepline(-sys.float_info.max, self._exact)
+        self._A: SweepStatus = createSweepStatus(sweepStatusType, self._sweepline)
+        self._B: EventQueue = createEventQueue(eventQueueType, self._segments, self._exact)
 
         # 交点のリスト
         self._crosses: list[Point] = []
+        # 発見済みの交点の索引
+        self._crossIndex: PointIndex = PointIndex()
+        # 線分 ID から走査線上の線分の要素への対応
+        self._handles: dict[int, StatusHandle] = {}
+        # 交点を確認済みの線分の組, 値は交点の有無（保持数を超えた場合は古いものから取り除く）
+        self._checkedPairs: dict[tuple[int, int], bool] = {}
+        # 線分 ID から、その線分を含む確認済みの組への対応
+        self._pairsByLine: dict[int, set[tuple[int, int]]] = {}
+        # 走査線に平行な線分の x 座標ごとのリスト
+        self._verticals: dict[float, list[FrozenLineSegment]] = {}
+        # 走査線に平行な線分がある x 座標における、左端点の y 座標のリスト
+        self._leftsAt: dict[float, list[float]] = {}
+        # 実行済みか否か
+        self._executed: bool = False
+
+    def reset(self, lses: list[AnyLineSegment] | None = None, exact: bool | None = None):
+        """走査の状態を初期化し、別の線分のリストに対して再度実行できるようにする
+
+        走査線上の線分の管理構造, イベントキュー, 索引などは再生成せずに空にして再利用する
+        交点のリストは新たに用意する（それまでに getCrossPoints で返したリストは変更しない）
+
+        Args:
+            lses  線分のリスト, None の場合はそれまでの線分のリストで再度実行する
+            exact  厳密な計算を行うか否か, None の場合はそれまでと同じとする
+        """
+        exact = self._exact if exact is None else exact
+        if lses is not None:
+            self._L = lses
+        if lses is not None or exact != self._exact:
+            self._segments = SweepLineMethod._toSegments(self._L, exact)
+
+        self._sweepline.x = -sys.float_info.max
+        self._sweepline.exact = exact
+        self._A.removeAll()
+        if exact == self._exact:
+            self._B.reset(self._segments)
+        else:
+            # 座標の比較方法が異なるため、イベントキューを作り直す
+            self._B = createEventQueue(self._eventQueueType, self._segments, exact)
+        self._exact = exact
+
+        self._crosses = []
+        self._crossIndex.clear()
+        self._handles.clear()
+        self._checkedPairs.clear()
+        self._pairsByLine.clear()
+        self._verticals.clear()
+        self._leftsAt.clear()
+        self._executed = False
+
+    @staticmethod
+    def _toSegments(lses: list[AnyLineSegment], exact: bool) -> list[FrozenLineSegment]:
+        """走査に用いる線分のリスト
+
+        Args:
+            lses  線分のリスト
+            exact  厳密な計算を行うか否か
+
+        Returns:
+            FrozenLineSegment（厳密な計算の場合は ExactLineSegment）のリスト
+        """
+        if exact:
+            return [ls if isinstance(ls, ExactLineSegment) else ExactLineSegment.fromLineSegment(ls) for ls in lses]
+        return [ls if isinstance(ls, FrozenLineSegment) else FrozenLineSegment.fromLineSegment(ls) for ls in lses]
 
     def getCrossPoints(self) -> list[Point]:
+        """交点のリスト
+
+        厳密な計算を行った場合は、座標を浮動小数点数に変換した点のリストを返す
+
+        Returns:
+            交点のリスト
+        """
+        if self._exact:
+            return [pt.toPoint() for pt in self._crosses]
+        return self._crosses
+
+    def getExactCrossPoints(self) -> list[ExactPoint]:
+        """厳密な座標の交点のリスト
+
+        Returns:
+            交点のリスト（座標は int または Fraction）, 厳密な計算を行っていない場合はエラーとする
+        """
+        if not self._exact:
+            raise RuntimeError("exact computation is not enabled")
         return self._crosses
 
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None) -> SweepMemoryReport:
+        """メモリ使用量の見積もり
+
+        線分のリスト, 交点のリスト, _A, _B のメモリ使用量を求める
+        線分や交点は _A, _B の要素からも参照されるため、先に数えて二重に数えないようにする
+
+        Args:
+            sample_rate: _A, _B のバイト数を求める節点の割合 (0, 1], TwoThreeTree.memory_report を参照
+            seed: サンプリングに用いる乱数のシード
+
+        Returns:
+            メモリ使用量
+        """
+        seen: set[int] = set()
+        segments_bytes: int = deepSizeOf(self._L, seen) + deepSizeOf(self._segments, seen)
+        crosses_bytes: int = deepSizeOf(self._crosses, seen) + deepSizeOf(self._crossIndex, seen)
+        a: TreeMemoryReport = self._A.memory_report(sample_rate, seed, seen)
+        b: TreeMemoryReport = self._B.memory_report(sample_rate, seed, seen)
+        return SweepMemoryReport(
+            a,
+            b,
+            len(self._crosses),
+            crosses_bytes,
+            len(self._L),
+            segments_bytes,
+            segments_bytes + crosses_bytes + a.totalBytes + b.totalBytes)
+
     def exec(self):
         """平面走査法の実行
+
+        実行済みの場合は、同じ線分のリストについて reset してから実行する
         """
 
         # 初期化
+        if self._executed:
+            self.reset()
+        self._executed = True
         self._init()
 
         # line sweep
         while(True):
-            lfb: Leaf[BNode] | None = self._B.minimum()
+            bn: BNode | None = self._B.minimum()
 
             # for debug
-            #self._B.visualizeGraph(True, "tree_b_" + datetime.datetime.now().isoformat())
             #self._A.visualizeGraph(True, "tree_a_" + datetime.datetime.now().isoformat())
 
-            if lfb is None:
+            if bn is None:
                 break
-            if not isinstance(lfb, LeafB):
-                raise RuntimeError("unknown minimum leaf")
             
             # 走査線を移動
-            self._sweepline.x = lfb.cargo.pt.x
-
-            # イベントに応じて処理を分岐
-            if lfb.cargo.eventType == EventType.LEFT:
-                self._procLeft(lfb)
-
-            elif lfb.cargo.eventType == EventType.RIGHT:
-                self._procRight(lfb)
-
-            elif lfb.cargo.eventType == EventType.CROSS:
-                self._procCross(lfb)
-            
-            # 次のイベントへ
-            self._B.delete(lfb.cargo)
+            #   移動先に走査線に平行な線分があれば、その x 座標のイベントより先にまとめて処理する
+            moved: bool = bn.pt.x != self._sweepline.x
+            self._sweepline.x = bn.pt.x
+            if moved and len(self._verticals) > 0:
+                verticals: list[FrozenLineSegment] | None = self._verticals.pop(bn.pt.x, None)
+                if verticals is not None:
+                    self._procVerticals(verticals, self._leftsAt.pop(bn.pt.x, []))
+
+            # 同じ点のイベントをまとめて取り出す
+            #   端点同士は同じ点であれば連続して並ぶ（交点のイベントは、同じ点に端点がある場合は追加しない）
+            group: list[BNode] = [bn]
+            self._B.delete(bn)
+            if bn.eventType != EventType.CROSS:
+                while(True):
+                    nxt: BNode | None = self._B.minimum()
+                    if nxt is None or nxt.eventType == EventType.CROSS or not (nxt.pt == bn.pt):
+                        break
+                    group.append(nxt)
+                    self._B.delete(nxt)
+
+            # 同じ点のイベントをまとめて処理
+            self._procEventPoint(bn.pt, group)
         return
-    
-    def _procLeft(self, lfb: LeafB):
-        """左端点のイベントを処理
 
-        走査線上の線分を管理する木にノードを追加
+    def _procEventPoint(self, pt: Point, group: list[BNode]):
+        """同じ点のイベントをまとめて処理
+
+        点 pt を左端点とする線分 U, 右端点とする線分 L, 内部を通る線分 C を求め、
+        L と C を走査線上から削除したのち、C と U を pt の直後の上下の順（傾きの順）に追加する
+        交点の確認は、追加した線分の両端とその外側の線分の組についてのみ行う
 
         Args:
-            lfb  線分の端点
+            pt  イベントの点
+            group  pt におけるイベントのリスト（交点のイベント 1 個、または端点のイベント）
         """
+        x: float = self._sweepline.x
+
+        # 左端点・右端点の線分（走査線に平行な線分は _A に追加しないので別途処理する）
+        upper: list[BNode] = []
+        lower: list[StatusHandle] = []
+        # 既知の pt を通る走査線上の線分
+        known: list[StatusHandle] = []
+        # pt を通る線分の数（交点であるか否かの判定に用いる）
+        through: list[FrozenLineSegment] = []
+        for bn in group:
+            if bn.eventType == EventType.CROSS:
+                # 交点なので、必ずあるはず
+                if bn.ls2 is None:
+                    raise RuntimeError("no 2nd line segment")
+                ids: tuple[int | None, int | None] = (None, None) if bn.crossLnIds is None else bn.crossLnIds
+                for ls, lnId in ((bn.ls, ids[0]), (bn.ls2, ids[1])):
+                    h: StatusHandle | None = self._findHandle(ls, lnId)
+                    if h is None:
+                        raise RuntimeError(f"line segment for cross point ({bn.pt.x}, {bn.pt.y}) was not found on sweep line, x = {x}")
+                    known.append(h)
+            elif bn.ls.b == 0:
+                # 走査線に平行な場合は、x 座標ごとにまとめて処理済み
+                continue
+            elif bn.eventType == EventType.LEFT:
+                upper.append(bn)
+            else:
+                # 端点に対応する走査線上の線分
+                h = self._findHandle(bn.ls, bn.lnId)
+                if h is None:
+                    raise RuntimeError(f"right point ({bn.pt.x}, {bn.pt.y}) was not found in line segments on sweep line: {bn.pt.x}")
+                lower.append(h)
+                known.append(h)
+
+        # pt を通る走査線上の線分の並び（連続している）を求める
+        run: list[StatusHandle] = self._findRun(pt, known)
+        below: StatusHandle | None
+        above: StatusHandle | None
+        if len(run) > 0:
+            below = self._A.predecessor(run[0])
+            above = self._A.successor(run[-1])
+        else:
+            below, above = self._A.bisect(lambda an: self._isAbove(an.ls, pt))
+
+        # 数値誤差により並びに含まれなかった右端点の線分
+        run_ids: set[int] = {id(h) for h in run}
+        for h in lower:
+            if id(h) not in run_ids:
+                if h is below:
+                    below = self._A.predecessor(h)
+                if h is above:
+                    above = self._A.successor(h)
+                run.append(h)
+                run_ids.add(id(h))
+
+        # 交点であれば交点リストへ追加
+        lower_ids: set[int] = {id(h) for h in lower}
+        crossing: list[StatusHandle] = [h for h in run if id(h) not in lower_ids]
+        through.extend(h.cargo.ls for h in run)
+        through.extend(bn.ls for bn in upper)
+        if self._hasCrossingAt(through) and not self._isExistCrossPoint(pt):
+            self._addCrossPoint(pt)
+
+        # L を削除
+        for h in run:
+            if id(h) in lower_ids:
+                self._handles.pop(h.cargo.lnId, None)
+                self._forgetPairs(h.cargo.lnId)
+                self._A.delete(h)
+
+        # C の並びを反転して、pt の直後の上下の順（傾きの順）にする
+        #   pt の直前は傾きの降順に並んでいるので、反転すれば昇順となる
+        #   数値誤差により反転で傾きの順とならない場合は、削除して追加しなおす
+        if len(crossing) >= 2:
+            reversible: bool = self._isContiguous(crossing)
+            if reversible:
+                self._A.reverse(crossing[0], crossing[-1])
+                crossing.reverse()
+            if not reversible or not SweepLineMethod._isSlopeOrdered(crossing):
+                for h in crossing:
+                    self._handles.pop(h.cargo.lnId, None)
+                    self._A.delete(h)
+                prev_c: StatusHandle | None = below
+                for i, an in enumerate(sorted((h.cargo for h in crossing), key=SweepLineMethod._slopeKey)):
+                    prev_c = self._A.insertAfter(prev_c, an)
+                    crossing[i] = prev_c
+                    if an.lnId is not None:
+                        self._handles[an.lnId] = prev_c
+
+        # U を傾きの順に C の間へ追加
+        ans: list[ANode] = sorted((ANode(bn.ls, bn.lnId) for bn in upper), key=SweepLineMethod._slopeKey)
+        prev: StatusHandle | None = below
+        inserted: list[StatusHandle] = []
+        ci: int = 0
+        for an in ans:
+            while ci < len(crossing) and SweepLineMethod._slopeKey(crossing[ci].cargo) < SweepLineMethod._slopeKey(an):
+                prev = crossing[ci]
+                inserted.append(prev)
+                ci += 1
+            prev = self._A.insertAfter(prev, an)
+            inserted.append(prev)
+            if an.lnId is not None:
+                self._handles[an.lnId] = prev
+        inserted.extend(crossing[ci:])
+
+        # 新たに隣り合う線分の交点を確認し、あれば追加
+        if len(inserted) == 0:
+            if below is not None and above is not None:
+                self._checkCrossPoint(below.cargo, above.cargo)
+        elif len(upper) > 0:
+            # 左端点がある場合は下側を先に確認
+            if below is not None:
+                self._checkCrossPoint(inserted[0].cargo, below.cargo)
+            if above is not None:
+                self._checkCrossPoint(inserted[-1].cargo, above.cargo)
+        else:
+            # 交点通過後、上側になる線分と、さらにその上の線分との交点
+            if above is not None:
+                self._checkCrossPoint(inserted[-1].cargo, above.cargo)
+            # 交点通過後、下側になる線分と、さらにその下の線分との交点
+            if below is not None:
+                self._checkCrossPoint(inserted[0].cargo, below.cargo)
+        return
 
-        # 走査線に平行な場合
-        if lfb.cargo.ls.b == 0:
-            # 端点を通る X 軸に平行な線を規定
-            #   線分の式は b * y = c となる。その際、2点の x 座標の差分により b = 2 * _PARALLEL_DELTA_X と求められる。
-            #   このため、 _PARALLEL_DELTA_X が小さすぎる値の場合、計算誤差により問題が生じる
-            ln1: LineSegment = LineSegment(
-                Point(self._sweepline.x - SweepLineMethod._PARALLEL_DELTA_X, lfb.cargo.ls.miny),
-                Point(self._sweepline.x + SweepLineMethod._PARALLEL_DELTA_X, lfb.cargo.ls.miny))
-            ln2: LineSegment = LineSegment(
-                Point(self._sweepline.x - SweepLineMethod._PARALLEL_DELTA_X, lfb.cargo.ls.maxy),
-                Point(self._sweepline.x + SweepLineMethod._PARALLEL_DELTA_X, lfb.cargo.ls.maxy))
-            an1: ANode = ANode(ln1)
-            an2: ANode = ANode(ln2)
-            # 走査線に平行な線分と交点を持つ線分のリスト
-            #  an1 と an2 の線分範囲にある _A の要素が、現在の走査線と交点を持つ線分となる
-            lst: list[Leaf[ANode]] = self._A.range(an1, an2)
-            for lf in lst:
-                self._crosses.append(Point(self._sweepline.x, float(lf.val))) # Leaf.val が Y 座標以外を戻す場合は要修正
-            # 交点イベントの追加は行わない
-            return
-
-        # その他の場合
-
-        # 走査線上の線分として追加                
-        sweep_line_x_old = self._sweepline.x
-        an: ANode = ANode(lfb.cargo.ls)
-        try:
-            lfa: Leaf[ANode] = self._A.insert(an)
-        except RuntimeError as e:
-            # 左端点が交点でもある場合、追加時の走査線上の上下判定で範囲外のエラーとなる
-            # このため、走査線を少しだけ進めて再度追加を行う
-            
-            #print(e)
-            try:
-                self._sweepline.x = self._sweepline.x + SweepLineMethod._delta_x
-                lfa: Leaf[ANode] = self._A.insert(an)
-
-            except RuntimeError as e2:
-                raise RuntimeError(f"exception occured: cannot add LEFT endpoint: ({lfb.cargo.pt.x}, {lfb.cargo.pt.y})") from e2
-
-        # 走査線を元に戻す
-        self._sweepline.x = sweep_line_x_old
-
-        # 追加線分の前後の交点を確認し、あれば追加
-        prev: Leaf[ANode] | None = self._A.predecessor(lfa)
-        succ: Leaf[ANode] | None = self._A.successor(lfa)
+    def _procVerticals(self, verticals: list[FrozenLineSegment], lefts: list[float]):
+        """x 座標が同じ走査線に平行な線分をまとめて処理
 
-        if prev is not None:
-            self._checkCrossPoint(lfa.cargo, prev.cargo)
-        if succ is not None:
-            self._checkCrossPoint(lfa.cargo, succ.cargo)
+        走査線がその x 座標に達し、その x 座標のイベントを処理する前に呼び出す
+        このとき、走査線上の線分と、その x 座標に左端点を持つ線分（lefts）が、走査線と交わる線分のすべてとなる
+        それらの走査線上の y 座標のうち、平行な線分の y 座標の範囲にあるものを、下から順に照合して交点とする
+        走査線に平行な線分は走査線上の線分としては追加せず、交点イベントの追加も行わない
 
+        Args:
+            verticals  走査線に平行な線分のリスト
+            lefts  その x 座標に左端点を持つ線分の、左端点の y 座標のリスト
+        """
+        x: float = self._sweepline.x
+        tol: float = 0 if self._exact else _Y_ABS_TOL
+
+        # 平行な線分の y 座標の範囲を、下端の順に結合
+        spans: list[list[float]] = []
+        for ls in sorted(verticals, key=lambda ls: ls.miny):
+            if len(spans) > 0 and ls.miny <= spans[-1][1] + tol:
+                spans[-1][1] = max(spans[-1][1], ls.maxy)
+            else:
+                spans.append([ls.miny, ls.maxy])
+        lo: float = spans[0][0] - tol
+        hi: float = spans[-1][1] + tol
+
+        # 最も下の範囲から最も上の範囲までにある線分の y 座標
+        ys: list[float] = [y for y in lefts if lo <= y <= hi]
+        _, h = self._A.bisect(lambda an: self._sweepline.lineY(an.ls) >= lo)
+        while h is not None:
+            y: float = self._sweepline.lineY(h.cargo.ls)
+            if y > hi:
+                break
+            ys.append(y)
+            h = self._A.successor(h)
+        ys.sort()
+
+        # y 座標と範囲を下から順に照合
+        si: int = 0
+        for y in ys:
+            while si < len(spans) and spans[si][1] + tol < y:
+                si += 1
+            if si == len(spans):
+                break
+            if spans[si][0] - tol <= y:
+                pt: Point = ExactPoint(x, y) if self._exact else Point(x, y)
+                if not self._isExistCrossPoint(pt):
+                    self._addCrossPoint(pt)
         return
 
-    def _procRight(self, lfb: LeafB):
-        """右端点のイベントを処理
+    def _findRun(self, pt: Point, known: list[StatusHandle]) -> list[StatusHandle]:
+        """点を通る走査線上の線分の並びを求める
+
+        既知の線分があればその前後を、なければ点の位置を二分探索して、点を通る線分をたどる
 
-        走査線上の線分を管理する木からノードを削除
-        
         Args:
-            lfb  線分の端点
+            pt  対象の点
+            known  点を通ることが既知の走査線上の線分の要素
+
+        Returns:
+            点を通る線分の要素のリスト（下から順）
+        """
+        start: StatusHandle | None = None
+        for h in known:
+            if self._passesThrough(h.cargo.ls, pt):
+                start = h
+                break
+        if start is None:
+            _, start = self._A.bisect(lambda an: self._isAbove(an.ls, pt))
+            if start is None or not self._passesThrough(start.cargo.ls, pt):
+                return []
+
+        run: list[StatusHandle] = [start]
+        h: StatusHandle | None = self._A.predecessor(start)
+        while h is not None and self._passesThrough(h.cargo.ls, pt):
+            run.insert(0, h)
+            h = self._A.predecessor(h)
+        h = self._A.successor(start)
+        while h is not None and self._passesThrough(h.cargo.ls, pt):
+            run.append(h)
+            h = self._A.successor(h)
+        return run
+
+    def _passesThrough(self, ls: FrozenLineSegment, pt: Point) -> bool:
+        """走査線上の線分が点（走査線上の点）を通るか否か
+
+        浮動小数点数の計算では、走査線上の y 座標が許容誤差（_Y_ABS_TOL）内であれば通るとする
         """
+        if self._exact:
+            return self._sweepline.lineY(ls) == pt.y
+        return math.isclose(self._sweepline.lineY(ls), pt.y, abs_tol=_Y_ABS_TOL)
 
-        # 走査線に平行な場合
-        if lfb.cargo.ls.b == 0:
-            # _A に追加されていないので、なにもしない
-            return
-        
-        # 端点に対応する走査線上の線分
-        an: ANode = ANode(lfb.cargo.ls)
-        lfa: Leaf[ANode] | None = self._A.search(an)
+    def _isAbove(self, ls: FrozenLineSegment, pt: Point) -> bool:
+        """走査線上の線分が点（走査線上の点）を通る、または点より上にあるか否か
+        """
+        return self._sweepline.lineY(ls) > pt.y or self._passesThrough(ls, pt)
 
-        if lfa is None:
-            raise RuntimeError(f"right point ({lfb.cargo.pt.x}, {lfb.cargo.pt.y}) was not found in line segments on sweep line: {lfb.cargo.pt.x}")
+    @staticmethod
+    def _slopeKey(an: ANode) -> tuple[float, int]:
+        """点の直後の上下の順とするためのキー（傾き, 線分 ID）
+        """
+        return (an.slope, -1 if an.lnId is None else an.lnId)
 
-        # 削除線分の前後の Node を取得
-        prev: Leaf[ANode] | None = self._A.predecessor(lfa)
-        succ: Leaf[ANode] | None = self._A.successor(lfa)
+    def _isContiguous(self, run: list[StatusHandle]) -> bool:
+        """線分の並びが走査線上で連続しているか否か
+        """
+        for h1, h2 in zip(run, run[1:]):
+            if self._A.successor(h1) is not h2:
+                return False
+        return True
+
+    @staticmethod
+    def _isSlopeOrdered(run: list[StatusHandle]) -> bool:
+        """線分の並びが傾きの順であるか否か
+        """
+        for h1, h2 in zip(run, run[1:]):
+            if -h1.cargo.ls.a / h1.cargo.ls.b > -h2.cargo.ls.a / h2.cargo.ls.b:
+                return False
+        return True
 
-        # 削除
-        self._A.delete(lfa.cargo)
+    @staticmethod
+    def _hasCrossingAt(lses: list[FrozenLineSegment]) -> bool:
+        """点を通る線分の中に、平行でない２線分があるか否か
 
-        # 削除線分の前後の線分に対する交点を確認し、あれば追加
-        if prev is not None and succ is not None:
-            self._checkCrossPoint(prev.cargo, succ.cargo)
-        return
-    
-    def _procCross(self, lfb: LeafB):
-        """交点のイベントを処理
+        同一直線上で重なる線分のみの場合は、交点とはしない（LineSegment.getCrossPoint と同様）
 
-        走査線上の線分を管理する木の順序を入れ替え
-        
         Args:
-            lfb  線分の交点
-        """
-        # 交点なので、必ずあるはず
-        if lfb.cargo.ls2 is None:
-            raise RuntimeError("no 2nd line segment")
-
-        # 2-3 木の葉の swap メソッドを利用して走査線上の講演を入れ替える
-        #   走査線上の線分は交点通過前の並びに従うので、必ず指定した線分に対する葉を取得できる
-        #   その後、走査線を交点以降に動かし、上下を判定し、入れ替えを行う
-
-        # 交点に対応する走査線上の線分の存在
-        lfa_ls1: Leaf[ANode] | None = self._A.search(
-            ANode(lfb.cargo.ls)
-        )
-        if lfa_ls1 is None:
-            raise RuntimeError(f"line segment for cross point ({lfb.cargo.pt.x}, {lfb.cargo.pt.y}) was not found on sweep line, x = {self._sweepline.x}")
-
-        # 交点に対応する走査線上の線分の存在
-        lfa_ls2: Leaf[ANode] | None = self._A.search(
-                ANode(lfb.cargo.ls2)
-            )
-        if lfa_ls2 is None:
-            raise RuntimeError(f"line segment for cross point ({lfb.cargo.pt.x}, {lfb.cargo.pt.y}) was not found on sweep line, x = {self._sweepline.x}")
-        
-        # 上下を判定
-        sweep_line_x_old: float = self._sweepline.x
-        self._sweepline.x = self._sweepline.x + SweepLineMethod._delta_x
-
-        ret: int = lfa_ls1.compareCargo(lfa_ls2.cargo)
-        if  ret == 0:
-            raise RuntimeError(f"two lines are same at cross point ({lfb.cargo.pt.x}, {lfb.cargo.pt.y}), sweep line, x = {self._sweepline.x}")
-        elif ret > 0:
-            lfa_upper_switched: Leaf[ANode] | None = lfa_ls1
-            lfa_lower_switched: Leaf[ANode] | None = lfa_ls2
-        else:
-            lfa_upper_switched: Leaf[ANode] | None = lfa_ls2
-            lfa_lower_switched: Leaf[ANode] | None = lfa_ls1
+            lses  点を通る線分のリスト
 
-        # 走査線位置を元に戻しておく
-        self._sweepline.x = sweep_line_x_old
+        Returns:
+            平行でない２線分があれば True
+        """
+        if len(lses) < 2:
+            return False
+        ls0: FrozenLineSegment = lses[0]
+        for ls in lses[1:]:
+            if crossSign(ls0.pt1, ls0.pt2, ls.pt1, ls.pt2) != 0:
+                return True
+        return False
 
-        # 入れ替え
-        self._A.swap(lfa_upper_switched, lfa_lower_switched)
+    def _findHandle(self, ls: FrozenLineSegment, lnId: int | None) -> StatusHandle | None:
+        """線分に対応する走査線上の要素を取得する
 
-        # 新しい交点の探索
+        線分 ID との対応があればそれを用い、なければ走査線上の線分を探索する
 
-        # 交点通過後、上側になる線分と、さらにその上の線分との交点
-        lfa_next: Leaf[ANode] | None = self._A.successor(lfa_upper_switched)
-        if lfa_next is not None:
-            self._checkCrossPoint(lfa_upper_switched.cargo, lfa_next.cargo)
-        # 交点通過後、下側になる線分と、さらにその下の線分との交点
-        lfa_prev: Leaf[ANode] | None = self._A.predecessor(lfa_lower_switched)
-        if lfa_prev is not None:
-            self._checkCrossPoint(lfa_lower_switched.cargo, lfa_prev.cargo)
+        Args:
+            ls  線分
+            lnId  線分 ID
 
-        return
+        Returns:
+            走査線上の要素, 見つからない場合は None
+        """
+        if lnId is not None:
+            h: StatusHandle | None = self._handles.get(lnId)
+            if h is not None:
+                return h
+        return self._A.search(ANode(ls))
 
     def _checkCrossPoint(self, target: ANode, other: ANode):
         """２線分の交点をチェック
@@ -442,32 +533,37 @@ class SweepLineMethod:
             target  線分１
             other   線分２
         """
+        # 確認済みの組であれば何もしない
+        #   交点がない組は何度確認しても同じ、交点がある組は初回の確認で交点リストに追加済みのため
+        key: tuple[int, int] | None = None
+        if target.lnId is not None and other.lnId is not None:
+            key = (target.lnId, other.lnId) if target.lnId < other.lnId else (other.lnId, target.lnId)
+            if key in self._checkedPairs:
+                return
+
         cp : Point | None = target.ls.getCrossPoint(other.ls)
 
+        if key is not None:
+            self._rememberPair(key, cp is not None)
+
         if cp is not None:
+            # すでに発見した交点であれば何もしない
+            if self._isExistCrossPoint(cp):
+                return
+
             addpt: BNode = BNode(
                 EventType.CROSS,
                 cp,
                 target.ls,
                 other.ls,
-                None)
-            
-            # すでに発見した交点であれば何もしない
-            if self._isExistCrossPoint(cp):
-                return
+                None,
+                None if key is None else (target.lnId, other.lnId))
             
             # 交点リストへ追加
-            self._crosses.append(cp)
+            self._addCrossPoint(cp)
 
             # 交点と同じ座標の端点があるかチェック
-            lfb_end: Leaf[BNode] | None = self._B.search(
-                BNode(
-                    EventType.RIGHT, # CROSS 以外を指定
-                    cp,
-                    target.ls,       # other.ls でもよい
-                    None,
-                    None))
-            if lfb_end is not None:
+            if self._B.hasEndpoint(cp):
                 # 端点がある場合は、交点としてイベント木には追加しない
                 return
 
@@ -475,6 +571,44 @@ class SweepLineMethod:
             self._B.insert(addpt)
         return
     
+    def _rememberPair(self, key: tuple[int, int], crossed: bool):
+        """線分の組を確認済みとして記録する
+
+        Args:
+            key  線分 ID の組（小さい順）
+            crossed  交点の有無
+        """
+        if key not in self._checkedPairs and len(self._checkedPairs) >= self._CHECKED_PAIRS_MAX:
+            # 最も古い組を取り除く
+            self._dropPair(next(iter(self._checkedPairs)))
+        self._checkedPairs[key] = crossed
+        self._pairsByLine.setdefault(key[0], set()).add(key)
+        self._pairsByLine.setdefault(key[1], set()).add(key)
+
+    def _forgetPairs(self, lnId: int | None):
+        """右端点を通過した線分を含む組を、確認済みの組から取り除く
+
+        Args:
+            lnId  線分 ID
+        """
+        if lnId is None:
+            return
+        for key in list(self._pairsByLine.get(lnId, ())):
+            self._dropPair(key)
+
+    def _dropPair(self, key: tuple[int, int]):
+        """確認済みの組を、線分 ID からの対応とともに取り除く
+
+        Args:
+            key  線分 ID の組（小さい順）
+        """
+        del self._checkedPairs[key]
+        for lnId in key:
+            keys: set[tuple[int, int]] = self._pairsByLine[lnId]
+            keys.discard(key)
+            if len(keys) == 0:
+                del self._pairsByLine[lnId]
+
     def _init(self):
         """平面走査法実行前の初期化
 
@@ -482,8 +616,8 @@ class SweepLineMethod:
         """
         # 線分の端点を B に追加
         lineId: int = 0
-        ls: LineSegment
-        for ls in self._L:
+        ls: FrozenLineSegment
+        for ls in self._segments:
             # 線分の左端点
             bn: BNode = BNode(
                 EventType.LEFT,
@@ -503,6 +637,15 @@ class SweepLineMethod:
             self._B.insert(bn)
             lineId += 1
 
+        # 走査線に平行な線分を x 座標ごとにまとめる
+        for ls in self._segments:
+            if ls.b == 0:
+                self._verticals.setdefault(ls.minx, []).append(ls)
+        if len(self._verticals) > 0:
+            for ls in self._segments:
+                if ls.b != 0 and ls.minx in self._verticals:
+                    self._leftsAt.setdefault(ls.minx, []).append(ls.minxPt.y)
+
         # Aは 初期化時点では空のため、何もしない
         return
 
@@ -515,6 +658,14 @@ class SweepLineMethod:
         Returns:
             true: 交点が発見済み    false: 交点未発見
         """
-        ret: Point | None = next((pt for pt in self._crosses if pt.x == cp.x and pt.y == cp.y), None)
-        return isinstance(ret, Point)
+        return cp in self._crossIndex
+
+    def _addCrossPoint(self, cp: Point):
+        """交点を交点リストへ追加
+
+        Args:
+            cp  追加する交点
+        """
+        self._crosses.append(cp)
+        self._crossIndex.add(cp)
     
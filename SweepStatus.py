@@ -0,0 +1,918 @@
+"""走査線上の線分の管理モジュール
+
+平面走査法において、走査線と交差する線分を走査線上の y 座標の順に管理する
+SweepLineMethod は SweepStatus のインターフェースを通して線分を管理する
+
+実装
+    TreeSweepStatus     : 2-3木
+    SkipListSweepStatus : スキップリスト
+    BlockListSweepStatus: ソート済みのブロックのリスト（平方分割）
+"""
+
+import math
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum, auto, unique
+from fractions import Fraction
+from typing import Any, Callable
+from LineSegment import _ABS_TOL, AnyLineSegment, FrozenLineSegment
+from MemoryReport import TreeMemoryReport, deepSizeOf, shallowSizeOf
+from TwoThreeTree import Leaf, Node, TwoThreeTree
+
+class Sweepline:
+    """走査線
+
+    走査線の x 座標における線分の y 座標をキャッシュする
+    x 座標を変更するとキャッシュを破棄する
+
+    exact が True の場合、座標は厳密な値（int, Fraction）とし、y 座標を Fraction で求め、許容誤差なしで比較する
+    """
+    __slots__ = ("_x", "_ys", "_lineYs", "exact")
+
+    def __init__(self, x: float, exact: bool = False):
+        """コンストラクタ
+
+        Args:
+            x: 走査線の x 座標
+            exact: 座標が厳密な値か否か
+        """
+        self._x: float = x
+        self.exact: bool = exact
+        # 線分から走査線上の y 座標への対応（線分は同一性で判定）
+        self._ys: dict[AnyLineSegment, float] = {}
+        # 線分から、線分を含む直線の走査線上の y 座標への対応
+        self._lineYs: dict[AnyLineSegment, float] = {}
+
+    def __repr__(self) -> str:
+        return f"Sweepline(x={self._x!r})"
+
+    @property
+    def x(self) -> float:
+        """走査線の x 座標
+        """
+        return self._x
+
+    @x.setter
+    def x(self, x: float):
+        if x != self._x:
+            self._ys.clear()
+            self._lineYs.clear()
+        self._x = x
+
+    def calcY(self, ls: AnyLineSegment) -> float:
+        """走査線上における線分の y 座標
+
+        LineSegment.calcYIfExist(x) と同じ値を返す。走査線上に線分がない場合はエラーとする
+        線分の交点の状態を変更しない calcYWithStatus を用いるため、複数のスレッドで同じ線分を用いてもよい
+
+        Args:
+            ls: 線分
+
+        Returns:
+            走査線上の y 座標
+        """
+        y: float | None = self._ys.get(ls)
+        if y is None:
+            y, status = ls.calcYWithStatus(self._x)
+            if y is None:
+                raise RuntimeError(f"linesegment is not on sweepline x: {self._x} ({status.name})")
+            self._ys[ls] = y
+        return y
+
+    def lineY(self, ls: AnyLineSegment) -> float:
+        """走査線上における、線分を含む直線の y 座標（線分の範囲は確認しない）
+
+        Args:
+            ls: 線分, y 軸に平行でないこと
+
+        Returns:
+            走査線上の y 座標
+        """
+        y: float | None = self._lineYs.get(ls)
+        if y is None:
+            y = Fraction(ls.c - ls.a * self._x, ls.b) if self.exact else (ls.c - ls.a * self._x) / ls.b
+            self._lineYs[ls] = y
+        return y
+
+@dataclass(slots=True)
+class ANode:
+    """平面走査法で用いる走査線上の線分を管理するための Node 要素
+    """
+    ls: AnyLineSegment       # Point が存在する線分, 走査線上における線分の y 座標をキーとする
+    lnId: int | None = None  # 線分 ID, 比較には用いない
+    slope: float = field(init=False, repr=False, compare=False)  # 線分の傾き, y 軸に平行な場合は無限大
+
+    def __post_init__(self):
+        if isinstance(self.ls, FrozenLineSegment):
+            self.slope = self.ls.slope
+            return
+        b: float = self.ls.b
+        self.slope = math.inf if math.isclose(b, 0, abs_tol=_ABS_TOL) else -self.ls.a / b
+
+
+def compareANode(v1: ANode, v2: ANode, sweepline: Sweepline, after: bool = False) -> int:
+    """走査線の x 座標における ２線分（ANodeとして与える）の y 座標 を比較する
+
+        v1 の y 座標のほうが大きい場合に正の値を返す
+        走査線上の y 座標が同じ場合は、傾きにより走査線の直前（after が True の場合は直後）の上下を判定する
+        傾きも同じ場合（同一直線上の線分）は一致とする
+        y 座標の一致は math.isclose で判定する（sweepline.exact が True の場合は許容誤差なし）
+
+    Args:
+        v1: 線分を含む ANode
+        v2: 線分を含む ANode
+        sweepline: 走査線
+        after: 走査線の直後の順とするか否か, False の場合は直前の順とする
+
+    Returns:
+        v1 の y 座標 > v2 の y 座標 => 正の値
+        v1 の y 座標 == v2 の y 座標 => 0
+        v1 の y 座標 < v2 の y 座標 => 負の値
+    """
+    # 走査線上の y 座標を比較
+    y1: float = sweepline.calcY(v1.ls)
+    y2: float = sweepline.calcY(v2.ls)
+    if (y1 != y2) if sweepline.exact else not math.isclose(y1, y2):
+        return -1 if y1 < y2 else 1
+
+    # 走査線上の y 座標が同じ場合は、傾きで比較する
+    #   走査線の直後では傾きの大きい線分が上、直前では傾きの大きい線分が下となる
+    #   直前の順とする場合も、走査線の直前に存在しない（左端点が走査線上にある）線分は延長した直線で比較する
+    s1: float = v1.slope
+    s2: float = v2.slope
+    if s1 == s2:
+        return 0
+    if after:
+        return -1 if s1 < s2 else 1
+    return 1 if s1 < s2 else -1
+
+
+class LeafA(Leaf[ANode]):
+
+    def __init__(self, val: ANode, parent: Node[ANode] | None, sweepline: Sweepline):
+        super().__init__(val, parent,
+                         # func_get_val -> str
+                         #   走査線の x 座標における 線分の y 座標 を求める
+                         lambda v: str(sweepline.calcY(v.ls)),
+                         # func_comp -> int
+                         #   走査線の x 座標における 2線分の y 座標 を比較する
+                        self._comp)
+        self._sweepline: Sweepline = sweepline
+
+    def _comp(self, v1: ANode, v2: ANode) -> int:
+        """走査線の x 座標における ２線分（ANodeとして与える）の y 座標 を比較する
+
+        compareANode を参照
+        """
+        return compareANode(v1, v2, self._sweepline)
+
+
+@dataclass(eq=False)
+class StatusEntry:
+    """木以外の実装で用いる、走査線上の線分の要素
+
+    swap により位置が変わっても、同じ線分に対して同じオブジェクトを返す
+    """
+    cargo: ANode      # 線分
+    pos: Any = None   # 実装ごとの位置の情報（スキップリストの節点, ブロック）
+
+# 走査線上の線分の要素, 木の場合は葉そのものとする
+StatusHandle = Leaf[ANode] | StatusEntry
+
+
+@unique
+class SweepStatusType(Enum):
+    """走査線上の線分の管理方法の enum
+    """
+    TREE     = auto()  # 2-3木
+    SKIPLIST = auto()  # スキップリスト
+    BLOCKS   = auto()  # ソート済みのブロックのリスト
+
+
+class SweepStatus(ABC):
+    """走査線上の線分の管理のインターフェース
+
+    線分の順序は、走査線の x 座標における y 座標の順（compareANode）とする
+    各メソッドの戻り値の要素（StatusHandle）は、削除されるまで同じ線分を指し、cargo 属性で ANode を参照できる
+    """
+
+    def __init__(self, sweepline: Sweepline):
+        """コンストラクタ
+
+        Args:
+            sweepline: 走査線, 比較時にはその時点の x 座標を用いる
+        """
+        self._sweepline: Sweepline = sweepline
+
+    def compare(self, v1: ANode, v2: ANode, after: bool = False) -> int:
+        """現在の走査線の位置での２線分の比較
+
+        Args:
+            v1: 線分を含む ANode
+            v2: 線分を含む ANode
+            after: 走査線上で y 座標が同じ場合に、走査線の直後の順とするか否か
+
+        Returns:
+            compareANode を参照
+        """
+        return compareANode(v1, v2, self._sweepline, after)
+
+    @abstractmethod
+    def insert(self, an: ANode) -> StatusHandle:
+        """線分を追加する
+
+        追加する線分の左端点は走査線上、またはその手前にあるものとし、走査線の直後の順（compare の after=True）で位置を決める
+        このため、左端点が他の線分上にある場合も、傾きにより一度の探索で位置が決まる
+        既に一致する線分（同一直線上で重なる線分）がある場合は、追加せずにその要素を返す
+
+        Args:
+            an: 追加する線分
+
+        Returns:
+            追加した線分の要素
+        """
+        pass
+
+    @abstractmethod
+    def insertAfter(self, h: StatusHandle | None, an: ANode) -> StatusHandle:
+        """位置を指定して線分を追加する
+
+        比較を行わずに h の直後に追加する。順序を保つのは呼び出し側の責任とする
+
+        Args:
+            h: 追加位置の直前の線分の要素, None の場合は先頭に追加する
+            an: 追加する線分
+
+        Returns:
+            追加した線分の要素
+        """
+        pass
+
+    @abstractmethod
+    def bisect(self, func_pred: Callable[[ANode], bool]) -> tuple[StatusHandle | None, StatusHandle | None]:
+        """条件により線分の並びを二分する
+
+        func_pred は線分の順序に対して単調（False が続いたのち True が続く）であることを前提とする
+
+        Args:
+            func_pred: 線分に対する条件
+
+        Returns:
+            (条件を満たさない最後の線分の要素, 条件を満たす最初の線分の要素), それぞれない場合は None
+        """
+        pass
+
+    @abstractmethod
+    def search(self, an: ANode) -> StatusHandle | None:
+        """線分を探索する
+
+        Args:
+            an: 探索する線分
+
+        Returns:
+            一致する線分の要素, ない場合は None
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, h: StatusHandle):
+        """線分を削除する
+
+        Args:
+            h: 削除する線分の要素
+        """
+        pass
+
+    @abstractmethod
+    def predecessor(self, h: StatusHandle) -> StatusHandle | None:
+        """直下の線分
+
+        Args:
+            h: 対象の線分の要素
+
+        Returns:
+            直下の線分の要素, ない場合は None
+        """
+        pass
+
+    @abstractmethod
+    def successor(self, h: StatusHandle) -> StatusHandle | None:
+        """直上の線分
+
+        Args:
+            h: 対象の線分の要素
+
+        Returns:
+            直上の線分の要素, ない場合は None
+        """
+        pass
+
+    @abstractmethod
+    def swap(self, h1: StatusHandle, h2: StatusHandle):
+        """２つの線分の位置を、順序に関わらず入れ替える
+
+        Args:
+            h1: 1つ目の線分の要素
+            h2: 2つ目の線分の要素
+        """
+        pass
+
+    @abstractmethod
+    def reverse(self, h1: StatusHandle, h2: StatusHandle):
+        """h1 から h2 までの連続する線分の並びを、順序に関わらず反転する
+
+        Args:
+            h1: 並びの最初の線分の要素
+            h2: 並びの最後の線分の要素（h1 以降にあること）
+        """
+        pass
+
+    @abstractmethod
+    def range(self, an1: ANode, an2: ANode) -> list[StatusHandle]:
+        """y 座標の範囲 [an1, an2] にある線分をリストアップする
+
+        Args:
+            an1: 小さいほうの値
+            an2: 大きいほうの値
+
+        Returns:
+            線分の要素のリスト（昇順）
+        """
+        pass
+
+    @abstractmethod
+    def removeAll(self):
+        """全線分を削除する
+        """
+        pass
+
+    @abstractmethod
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        Args:
+            sample_rate: バイト数を求める要素の割合 (0, 1]
+            seed: サンプリングに用いる乱数のシード
+            seen: 数え済みのオブジェクトの id の集合
+
+        Returns:
+            メモリ使用量
+        """
+        pass
+
+
+def createSweepStatus(sweepStatusType: SweepStatusType, sweepline: Sweepline) -> SweepStatus:
+    """走査線上の線分の管理を生成する
+
+    Args:
+        sweepStatusType: 管理方法の種類
+        sweepline: 走査線
+
+    Returns:
+        走査線上の線分の管理
+    """
+    if sweepStatusType == SweepStatusType.SKIPLIST:
+        return SkipListSweepStatus(sweepline)
+    elif sweepStatusType == SweepStatusType.BLOCKS:
+        return BlockListSweepStatus(sweepline)
+    return TreeSweepStatus(sweepline)
+
+
+class TreeSweepStatus(SweepStatus):
+    """2-3木による走査線上の線分の管理
+    """
+
+    def __init__(self, sweepline: Sweepline):
+        super().__init__(sweepline)
+        self._tree: TwoThreeTree[LeafA, ANode] = TwoThreeTree[LeafA, ANode](lambda v, p : LeafA(v, p, self._sweepline)) # sweepline が必要で、かつ実行時にバインドしたいので、lambdaで定義する
+
+    def insert(self, an: ANode) -> Leaf[ANode]:
+        # 葉の比較関数は走査線の直前の順のため、直後の順の条件で二分して位置を指定して追加する
+        below, above = self.bisect(lambda v: self.compare(v, an, True) >= 0)
+        if above is not None and self.compare(above.cargo, an, True) == 0:
+            return above
+        return self._tree.insertAfter(below, an)
+
+    def insertAfter(self, h: Leaf[ANode] | None, an: ANode) -> Leaf[ANode]:
+        return self._tree.insertAfter(h, an)
+
+    def bisect(self, func_pred: Callable[[ANode], bool]) -> tuple[Leaf[ANode] | None, Leaf[ANode] | None]:
+        first: Leaf[ANode] | None = self._tree.searchFirst(func_pred)
+        if first is None:
+            return (self._tree.maximum(), None)
+        return (self._tree.predecessor(first), first)
+
+    def search(self, an: ANode) -> Leaf[ANode] | None:
+        return self._tree.search(an)
+
+    def delete(self, h: Leaf[ANode]):
+        self._tree.deleteLeaf(h)
+
+    def predecessor(self, h: Leaf[ANode]) -> Leaf[ANode] | None:
+        return self._tree.predecessor(h)
+
+    def successor(self, h: Leaf[ANode]) -> Leaf[ANode] | None:
+        return self._tree.successor(h)
+
+    def swap(self, h1: Leaf[ANode], h2: Leaf[ANode]):
+        self._tree.swap(h1, h2)
+
+    def reverse(self, h1: Leaf[ANode], h2: Leaf[ANode]):
+        self._tree.reverse(h1, h2)
+
+    def range(self, an1: ANode, an2: ANode) -> list[Leaf[ANode]]:
+        return self._tree.range(an1, an2)
+
+    def removeAll(self):
+        self._tree.removeAll()
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        return self._tree.memory_report(sample_rate, seed, seen)
+
+
+class _SkipNode:
+    """スキップリストの節点
+
+    各レベルで前後の節点への参照を持ち、削除時に探索を不要とする
+    """
+
+    def __init__(self, entry: StatusEntry | None, level: int):
+        self.entry: StatusEntry | None = entry
+        self.next: list[_SkipNode | None] = [None] * level
+        self.prev: list[_SkipNode | None] = [None] * level
+
+
+class SkipListSweepStatus(SweepStatus):
+    """ランダム化スキップリストによる走査線上の線分の管理
+
+    節点のレベルは確率 _P で 1 ずつ増やす
+    swap は節点間で要素を入れ替えるため、節点の構造は変化しない
+    """
+    _MAX_LEVEL: int = 32
+    _P: float = 0.25
+
+    def __init__(self, sweepline: Sweepline, seed: int | None = None):
+        """コンストラクタ
+
+        Args:
+            sweepline: 走査線
+            seed: レベルの決定に用いる乱数のシード
+        """
+        super().__init__(sweepline)
+        self._rnd: random.Random = random.Random(seed)
+        self._head: _SkipNode = _SkipNode(None, SkipListSweepStatus._MAX_LEVEL)
+        self._level: int = 1
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _randomLevel(self) -> int:
+        level: int = 1
+        while level < SkipListSweepStatus._MAX_LEVEL and self._rnd.random() < SkipListSweepStatus._P:
+            level += 1
+        return level
+
+    def _lowerBound(self, an: ANode, after: bool = False) -> list[_SkipNode]:
+        """an 未満の最後の節点を各レベルについて求める
+
+        Args:
+            an: 対象の線分
+            after: 走査線の直後の順で比較するか否か
+
+        Returns:
+            各レベルにおける an 未満の最後の節点（なければ先頭の節点）
+        """
+        update: list[_SkipNode] = [self._head] * self._level
+        x: _SkipNode = self._head
+        for i in range(self._level - 1, -1, -1):
+            nxt: _SkipNode | None = x.next[i]
+            while nxt is not None and self.compare(nxt.entry.cargo, an, after) < 0:
+                x = nxt
+                nxt = x.next[i]
+            update[i] = x
+        return update
+
+    def insert(self, an: ANode) -> StatusEntry:
+        update: list[_SkipNode] = self._lowerBound(an, True)
+        cand: _SkipNode | None = update[0].next[0]
+        if cand is not None and self.compare(cand.entry.cargo, an, True) == 0:
+            return cand.entry
+
+        level: int = self._randomLevel()
+        if level > self._level:
+            update.extend([self._head] * (level - self._level))
+            self._level = level
+
+        return self._link(update, an, level)
+
+    def _link(self, update: list[_SkipNode], an: ANode, level: int) -> StatusEntry:
+        """節点を生成して、各レベルで update の直後につなぐ
+
+        Args:
+            update: 各レベルにおける直前の節点
+            an: 追加する線分
+            level: 節点のレベル
+
+        Returns:
+            追加した線分の要素
+        """
+        entry: StatusEntry = StatusEntry(an)
+        nd: _SkipNode = _SkipNode(entry, level)
+        entry.pos = nd
+        for i in range(level):
+            p: _SkipNode = update[i]
+            nxt: _SkipNode | None = p.next[i]
+            nd.next[i] = nxt
+            nd.prev[i] = p
+            p.next[i] = nd
+            if nxt is not None:
+                nxt.prev[i] = nd
+        self._size += 1
+        return entry
+
+    def insertAfter(self, h: StatusEntry | None, an: ANode) -> StatusEntry:
+        level: int = self._randomLevel()
+        if level > self._level:
+            self._level = level
+
+        # 各レベルの直前の節点は、直前の節点から後ろ向きにたどって求める
+        update: list[_SkipNode] = []
+        x: _SkipNode = self._head if h is None else h.pos
+        for i in range(level):
+            while len(x.next) <= i:
+                x = x.prev[len(x.next) - 1]
+            update.append(x)
+        return self._link(update, an, level)
+
+    def bisect(self, func_pred: Callable[[ANode], bool]) -> tuple[StatusEntry | None, StatusEntry | None]:
+        x: _SkipNode = self._head
+        for i in range(self._level - 1, -1, -1):
+            nxt: _SkipNode | None = x.next[i]
+            while nxt is not None and not func_pred(nxt.entry.cargo):
+                x = nxt
+                nxt = x.next[i]
+        first: _SkipNode | None = x.next[0]
+        return (None if x is self._head else x.entry, None if first is None else first.entry)
+
+    def search(self, an: ANode) -> StatusEntry | None:
+        cand: _SkipNode | None = self._lowerBound(an)[0].next[0]
+        if cand is not None and self.compare(cand.entry.cargo, an) == 0:
+            return cand.entry
+        return None
+
+    def delete(self, h: StatusEntry):
+        nd: _SkipNode = h.pos
+        for i in range(len(nd.next)):
+            p: _SkipNode = nd.prev[i]
+            nxt: _SkipNode | None = nd.next[i]
+            p.next[i] = nxt
+            if nxt is not None:
+                nxt.prev[i] = p
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        h.pos = None
+        self._size -= 1
+
+    def predecessor(self, h: StatusEntry) -> StatusEntry | None:
+        p: _SkipNode = h.pos.prev[0]
+        return None if p is self._head else p.entry
+
+    def successor(self, h: StatusEntry) -> StatusEntry | None:
+        nxt: _SkipNode | None = h.pos.next[0]
+        return None if nxt is None else nxt.entry
+
+    def swap(self, h1: StatusEntry, h2: StatusEntry):
+        nd1: _SkipNode = h1.pos
+        nd2: _SkipNode = h2.pos
+        nd1.entry, nd2.entry = h2, h1
+        h1.pos, h2.pos = nd2, nd1
+
+    def reverse(self, h1: StatusEntry, h2: StatusEntry):
+        nodes: list[_SkipNode] = [h1.pos]
+        while nodes[-1] is not h2.pos:
+            nxt: _SkipNode | None = nodes[-1].next[0]
+            if nxt is None:
+                raise RuntimeError("h2 is not found after h1")
+            nodes.append(nxt)
+        entries: list[StatusEntry] = [nd.entry for nd in nodes]
+        for nd, e in zip(nodes, reversed(entries)):
+            nd.entry = e
+            e.pos = nd
+
+    def range(self, an1: ANode, an2: ANode) -> list[StatusEntry]:
+        lst: list[StatusEntry] = []
+        x: _SkipNode | None = self._lowerBound(an1)[0].next[0]
+        while x is not None and self.compare(x.entry.cargo, an2) <= 0:
+            lst.append(x.entry)
+            x = x.next[0]
+        return lst
+
+    def removeAll(self):
+        self._head = _SkipNode(None, SkipListSweepStatus._MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        要素と節点（前後の参照のリストを含む）を葉, 先頭の節点を内部節点として扱う
+        高さは現在のレベルとする。サンプリングは行わない
+
+        Args:
+            sample_rate: 未使用（TreeSweepStatus と引数を合わせるため）
+            seed: 未使用
+            seen: 数え済みのオブジェクトの id の集合
+
+        Returns:
+            メモリ使用量
+        """
+        if seen is None:
+            seen = set()
+        leaf_bytes: int = 0
+        cargo_bytes: int = 0
+        x: _SkipNode | None = self._head.next[0]
+        while x is not None:
+            leaf_bytes += shallowSizeOf(x) + shallowSizeOf(x.next) + shallowSizeOf(x.prev) + shallowSizeOf(x.entry)
+            cargo_bytes += deepSizeOf(x.entry.cargo, seen)
+            x = x.next[0]
+        head_bytes: int = shallowSizeOf(self._head) + shallowSizeOf(self._head.next) + shallowSizeOf(self._head.prev)
+        return TreeMemoryReport(
+            self._size,
+            1,
+            self._level,
+            leaf_bytes / self._size if self._size > 0 else 0.0,
+            float(head_bytes),
+            cargo_bytes / self._size if self._size > 0 else 0.0,
+            leaf_bytes + head_bytes + cargo_bytes,
+            1.0)
+
+
+class _Block:
+    """ソート済みのブロック
+    """
+
+    def __init__(self, entries: list[StatusEntry], idx: int):
+        self.entries: list[StatusEntry] = entries
+        self.idx: int = idx       # ブロックのリストにおける位置
+        for e in entries:
+            e.pos = self
+
+
+class BlockListSweepStatus(SweepStatus):
+    """ソート済みのブロックのリスト（平方分割）による走査線上の線分の管理
+
+    線分を昇順に並べ、_LOAD 個程度ずつのブロックに分けて保持する
+    ブロックの末尾の線分で二分探索してブロックを決め、ブロック内でも二分探索する
+    ブロックが _LOAD の 2 倍を超えたら分割し、空になったら取り除く
+
+    要素はブロックへの参照を持ち、前後の要素はブロック内の位置から求める
+    """
+    _LOAD: int = 64
+
+    def __init__(self, sweepline: Sweepline):
+        super().__init__(sweepline)
+        self._blocks: list[_Block] = []
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _locate(self, an: ANode, after: bool = False) -> tuple[int, int]:
+        """an 以上の最初の線分の位置
+
+        Args:
+            an: 対象の線分
+            after: 走査線の直後の順で比較するか否か
+
+        Returns:
+            (ブロックの位置, ブロック内の位置), 全線分が an 未満の場合は最後のブロックの末尾
+        """
+        lo: int = 0
+        hi: int = len(self._blocks) - 1
+        if hi < 0:
+            return (0, 0)
+        # an 以上の線分を末尾に持つ最初のブロック
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if self.compare(self._blocks[mid].entries[-1].cargo, an, after) < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        entries: list[StatusEntry] = self._blocks[lo].entries
+        l: int = 0
+        h: int = len(entries)
+        while l < h:
+            m: int = (l + h) // 2
+            if self.compare(entries[m].cargo, an, after) < 0:
+                l = m + 1
+            else:
+                h = m
+        return (lo, l)
+
+    def _renumber(self, start: int):
+        for i in range(start, len(self._blocks)):
+            self._blocks[i].idx = i
+
+    def insert(self, an: ANode) -> StatusEntry:
+        if len(self._blocks) == 0:
+            entry: StatusEntry = StatusEntry(an)
+            self._blocks.append(_Block([entry], 0))
+            self._size += 1
+            return entry
+
+        bi, i = self._locate(an, True)
+        block: _Block = self._blocks[bi]
+        if i < len(block.entries) and self.compare(block.entries[i].cargo, an, True) == 0:
+            return block.entries[i]
+
+        entry = StatusEntry(an, block)
+        block.entries.insert(i, entry)
+        self._size += 1
+        self._split(bi)
+        return entry
+
+    def _split(self, bi: int):
+        """ブロックが大きくなりすぎた場合に分割する
+
+        Args:
+            bi: ブロックの位置
+        """
+        block: _Block = self._blocks[bi]
+        if len(block.entries) > 2 * BlockListSweepStatus._LOAD:
+            half: int = len(block.entries) // 2
+            self._blocks.insert(bi + 1, _Block(block.entries[half:], bi + 1))
+            del block.entries[half:]
+            self._renumber(bi + 2)
+
+    def insertAfter(self, h: StatusEntry | None, an: ANode) -> StatusEntry:
+        if len(self._blocks) == 0:
+            entry: StatusEntry = StatusEntry(an)
+            self._blocks.append(_Block([entry], 0))
+            self._size += 1
+            return entry
+
+        block: _Block
+        i: int
+        if h is None:
+            block = self._blocks[0]
+            i = 0
+        else:
+            block = h.pos
+            i = block.entries.index(h) + 1
+        entry = StatusEntry(an, block)
+        block.entries.insert(i, entry)
+        self._size += 1
+        self._split(block.idx)
+        return entry
+
+    def bisect(self, func_pred: Callable[[ANode], bool]) -> tuple[StatusEntry | None, StatusEntry | None]:
+        if len(self._blocks) == 0:
+            return (None, None)
+        # 末尾の線分が条件を満たす最初のブロック
+        lo: int = 0
+        hi: int = len(self._blocks)
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if func_pred(self._blocks[mid].entries[-1].cargo):
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo == len(self._blocks):
+            return (self._blocks[-1].entries[-1], None)
+        entries: list[StatusEntry] = self._blocks[lo].entries
+        l: int = 0
+        h: int = len(entries)
+        while l < h:
+            m: int = (l + h) // 2
+            if func_pred(entries[m].cargo):
+                h = m
+            else:
+                l = m + 1
+        first: StatusEntry = entries[l]
+        if l > 0:
+            return (entries[l - 1], first)
+        if lo > 0:
+            return (self._blocks[lo - 1].entries[-1], first)
+        return (None, first)
+
+    def search(self, an: ANode) -> StatusEntry | None:
+        if len(self._blocks) == 0:
+            return None
+        bi, i = self._locate(an)
+        entries: list[StatusEntry] = self._blocks[bi].entries
+        if i < len(entries) and self.compare(entries[i].cargo, an) == 0:
+            return entries[i]
+        return None
+
+    def delete(self, h: StatusEntry):
+        block: _Block = h.pos
+        block.entries.remove(h)
+        if len(block.entries) == 0:
+            del self._blocks[block.idx]
+            self._renumber(block.idx)
+        h.pos = None
+        self._size -= 1
+
+    def predecessor(self, h: StatusEntry) -> StatusEntry | None:
+        block: _Block = h.pos
+        i: int = block.entries.index(h)
+        if i > 0:
+            return block.entries[i - 1]
+        if block.idx > 0:
+            return self._blocks[block.idx - 1].entries[-1]
+        return None
+
+    def successor(self, h: StatusEntry) -> StatusEntry | None:
+        block: _Block = h.pos
+        i: int = block.entries.index(h)
+        if i + 1 < len(block.entries):
+            return block.entries[i + 1]
+        if block.idx + 1 < len(self._blocks):
+            return self._blocks[block.idx + 1].entries[0]
+        return None
+
+    def swap(self, h1: StatusEntry, h2: StatusEntry):
+        b1: _Block = h1.pos
+        b2: _Block = h2.pos
+        i1: int = b1.entries.index(h1)
+        i2: int = b2.entries.index(h2)
+        b1.entries[i1] = h2
+        b2.entries[i2] = h1
+        h1.pos, h2.pos = b2, b1
+
+    def reverse(self, h1: StatusEntry, h2: StatusEntry):
+        # 並びの位置 (ブロック, ブロック内の位置)
+        slots: list[tuple[_Block, int]] = []
+        block: _Block = h1.pos
+        i: int = block.entries.index(h1)
+        while True:
+            slots.append((block, i))
+            if block.entries[i] is h2:
+                break
+            i += 1
+            if i == len(block.entries):
+                if block.idx + 1 == len(self._blocks):
+                    raise RuntimeError("h2 is not found after h1")
+                block = self._blocks[block.idx + 1]
+                i = 0
+        entries: list[StatusEntry] = [b.entries[j] for b, j in slots]
+        for (b, j), e in zip(slots, reversed(entries)):
+            b.entries[j] = e
+            e.pos = b
+
+    def range(self, an1: ANode, an2: ANode) -> list[StatusEntry]:
+        lst: list[StatusEntry] = []
+        if len(self._blocks) == 0:
+            return lst
+        bi, i = self._locate(an1)
+        while bi < len(self._blocks):
+            entries: list[StatusEntry] = self._blocks[bi].entries
+            while i < len(entries):
+                if self.compare(entries[i].cargo, an2) > 0:
+                    return lst
+                lst.append(entries[i])
+                i += 1
+            bi += 1
+            i = 0
+        return lst
+
+    def removeAll(self):
+        self._blocks.clear()
+        self._size = 0
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        要素を葉, ブロック（要素のリストを含む）を内部節点として扱い、高さは 2 とする
+        ブロックのリスト自体は内部節点に按分する。サンプリングは行わない
+
+        Args:
+            sample_rate: 未使用（TreeSweepStatus と引数を合わせるため）
+            seed: 未使用
+            seen: 数え済みのオブジェクトの id の集合
+
+        Returns:
+            メモリ使用量
+        """
+        if seen is None:
+            seen = set()
+        leaf_bytes: int = 0
+        cargo_bytes: int = 0
+        block_bytes: int = shallowSizeOf(self._blocks)
+        for block in self._blocks:
+            block_bytes += shallowSizeOf(block) + shallowSizeOf(block.entries)
+            for e in block.entries:
+                leaf_bytes += shallowSizeOf(e)
+                cargo_bytes += deepSizeOf(e.cargo, seen)
+        count: int = len(self._blocks)
+        return TreeMemoryReport(
+            self._size,
+            count,
+            2 if self._size > 0 else 0,
+            leaf_bytes / self._size if self._size > 0 else 0.0,
+            block_bytes / count if count > 0 else 0.0,
+            cargo_bytes / self._size if self._size > 0 else 0.0,
+            leaf_bytes + block_bytes + cargo_bytes,
+            1.0)
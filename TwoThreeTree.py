@@ -2,11 +2,15 @@
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum, auto, unique
-from typing import Callable, Generic, Self, TypeVar, Union
+import random
+from typing import Any, Callable, Generic, Self, TypeVar, Union
 
 from graphviz import Digraph
 
+from MemoryReport import TreeMemoryReport, deepSizeOf, shallowSizeOf
+
 @unique
 class NodeChildPos(Enum):
     LEFT  = auto()
@@ -107,6 +111,12 @@ class InternalNode(Node[T]):
         self.left_max_node: Node[T] | None = None
         self.mid_max_node: Node[T] | None = None
 
+        # 部分木の集約値（TwoThreeTree に Aggregator が指定された場合のみ利用）
+        self.agg_val: Any = None
+
+        # 部分木の区間の終点の最大値（TwoThreeTree が区間木モードの場合のみ利用）
+        self.max_end: float | None = None
+
     @property
     def isInternal(self) -> bool:
         return True
@@ -241,13 +251,33 @@ class Leaf(Node[T]):
         return self.isEqualCargo(other.cargo)
 
 
+A = TypeVar("A")
+@dataclass
+class Aggregator(Generic[T, A]):
+    """部分木の集約値（モノイド）の定義
+
+    葉の並び順に沿って集約値を求めるための定義
+    func_combine は結合法則を満たし、identity はその単位元であること
+    （交換法則は不要、left -> mid -> right の順に結合する）
+
+    Attributes:
+        identity: 単位元
+        func_combine: 2つの集約値を結合する関数
+        func_leaf_val: 葉の値オブジェクト T から集約値を求める関数
+    """
+    identity: A
+    func_combine: Callable[[A, A], A]
+    func_leaf_val: Callable[[T], A]
+
+
 NL = TypeVar("NL", bound=Leaf)
 class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致することを想定
     """2-3木クラス
 
     2-3木を表すクラス
     """
-    def __init__(self, func_leaf_ctor: Callable[[T, Node[T]], NL]):
+    def __init__(self, func_leaf_ctor: Callable[[T, Node[T]], NL], aggregator: Aggregator[T, Any] | None = None,
+                 func_interval: Callable[[T], tuple[float, float]] | None = None):
         """初期化
 
         根の Node を作成する
@@ -255,9 +285,17 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
 
         Args:
             func_leaf_ctor: 値オブジェクト T より 葉の要素を作成する関数, 第1引数: 値オブジェクト T, 第2引数: 親ノード
+            aggregator: 部分木の集約値の定義, 指定した場合は aggregate メソッドが利用可能になる
+            func_interval: 値オブジェクト T より 区間 (始点, 終点) を求める関数, 指定した場合は区間木モードとなり
+                stab, overlapping メソッドが利用可能になる
+                区間木モードでは、葉の比較関数は区間の始点の順に並べるものであること
         """
         self.root: InternalNode[T] = InternalNode[T](None)
         self._func_leaf_ctor = func_leaf_ctor
+        self._aggregator: Aggregator[T, Any] | None = aggregator
+        self._func_interval: Callable[[T], tuple[float, float]] | None = func_interval
+        if aggregator is not None:
+            self.root.agg_val = aggregator.identity
 
     @property
     def size(self) -> int:
@@ -546,11 +584,22 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
         # 葉を木に追加
         inter: InternalNode[T] | None = self._insert_leaf(parent, leaf)
 
+        self._rebuild_after_insert(parent, leaf, inter)
+        return leaf
+
+    def _rebuild_after_insert(self, parent: InternalNode[T], leaf: Leaf[T], inter: InternalNode[T] | None):
+        """葉の追加後の2-3木の再構成
+
+        Args:
+            parent: 葉を追加した内部節点
+            leaf: 追加した葉
+            inter: 葉の追加により増加した内部節点, 増加しなかった場合は None
+        """
         # 中間要素の追加がない場合
         if inter is None:
             # 最大要素のアップデート
             self._update_max_node(leaf.parent)
-            return leaf
+            return
 
         # 中間要素が増えた場合
         base: InternalNode[T] = parent                # 葉の追加先となる基準の内部節点
@@ -603,10 +652,90 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
                 # 木の上へ
                 base = target
                 target = target.parent
-            
-        # 追加要素を返す
+
+    def insertAfter(self, lf: Leaf[T] | None, obj: T) -> Leaf[T]:
+        """位置を指定した要素の追加
+
+        引数で与えられた obj を内部に持つ葉を作成して、lf の直後に追加する
+        キーの値の比較は行わないため、追加後も順序が保たれるようにするのは呼び出し側の責任とする
+
+        当該要素を追加したのち、2-3木が保たれるように再構築を行う
+
+        Args:
+            lf: 追加位置の直前の葉, None の場合は先頭に追加する
+                なお、search メソッド等の戻り値であることを想定している
+            obj: 追加対象の要素
+
+        Returns:
+            追加した要素に該当する Leaf
+        """
+        parent: InternalNode[T]
+        children: list[Node[T]]
+        pos: int
+        if lf is None:
+            first: Leaf[T] | None = self.minimum()
+            if first is None:
+                # 空の場合
+                parent = self.root
+                children = []
+                pos = 0
+            else:
+                parent = first.parent
+                children = [c for c in (parent.left, parent.mid, parent.right) if c is not None]
+                pos = 0
+        else:
+            if lf.parent is None or not isinstance(lf.parent, InternalNode):
+                raise RuntimeError("leaf is not in the tree")
+            parent = lf.parent
+            children = [c for c in (parent.left, parent.mid, parent.right) if c is not None]
+            # 同じ値を持つ別の葉と区別するため、同一性で位置を求める
+            pos = next(i for i, c in enumerate(children) if c is lf) + 1
+
+        leaf: Leaf[T] = self._func_leaf_ctor(obj, parent)
+        children.insert(pos, leaf)
+
+        inter: InternalNode[T] | None = None
+        if len(children) <= 2:
+            # root に葉が１個または２個の場合
+            parent.left = children[0]
+            parent.mid = children[1] if len(children) > 1 else None
+            self._update_max_node_raw(parent)
+        elif len(children) == 3:
+            self._insert_leaf_without_inter(parent, children[0], children[1], children[2])
+        else:
+            inter = self._insert_leaf_with_inter(parent, children[0], children[1], children[2], children[3])
+
+        self._rebuild_after_insert(parent, leaf, inter)
         return leaf
 
+    def searchFirst(self, func_pred: Callable[[T], bool]) -> Leaf[T] | None:
+        """条件を満たす最初の葉を探す
+
+        func_pred は葉の順序に対して単調（False が続いたのち True が続く）であることを前提とし、
+        内部節点の最大要素を用いて根から一度だけたどる
+
+        Args:
+            func_pred: 要素に対する条件
+
+        Returns:
+            条件を満たす最初の葉, ない場合は None
+        """
+        nd: Node[T] | None = self.root
+        while isinstance(nd, InternalNode):
+            if nd.left is None:
+                return None
+            if nd.left_max_node is not None and func_pred(nd.left_max_node.cargo):
+                nd = nd.left
+            elif nd.mid is not None and (nd.right is None or (nd.mid_max_node is not None and func_pred(nd.mid_max_node.cargo))):
+                nd = nd.mid
+            elif nd.right is not None:
+                nd = nd.right
+            else:
+                return None
+        if isinstance(nd, Leaf) and func_pred(nd.cargo):
+            return nd
+        return None
+
     def _insert_leaf(self, target: InternalNode[T], leaf: Leaf[T]) -> InternalNode[T] | None:
         """ 葉を2-3木に追加する
 
@@ -773,6 +902,58 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
         nd.left_max_node = self._maximum_raw(nd.left)
         nd.mid_max_node = self._maximum_raw(nd.mid)
 
+        # 集約値の更新
+        if self._aggregator is not None:
+            nd.agg_val = self._aggregate_children(nd)
+
+        # 区間の終点の最大値の更新
+        if self._func_interval is not None:
+            nd.max_end = self._max_end_children(nd)
+
+    def _max_end_children(self, nd: InternalNode[T]) -> float | None:
+        """内部節点の子要素の区間の終点の最大値を求める
+
+        Args:
+            nd: 対象の内部節点
+
+        Returns:
+            nd を根とする部分木の区間の終点の最大値, 子要素がない場合は None
+        """
+        result: float | None = None
+        for c in (nd.left, nd.mid, nd.right):
+            if c is None:
+                break
+            end: float | None
+            if isinstance(c, Leaf):
+                end = self._func_interval(c.cargo)[1]
+            else:
+                end = c.max_end
+            if end is not None and (result is None or result < end):
+                result = end
+        return result
+
+    def _aggregate_children(self, nd: InternalNode[T]) -> Any:
+        """内部節点の子要素の集約値を結合する
+
+        子要素の集約値は更新済みであることを前提とする
+
+        Args:
+            nd: 対象の内部節点
+
+        Returns:
+            nd を根とする部分木の集約値
+        """
+        agg: Aggregator[T, Any] = self._aggregator
+        result: Any = agg.identity
+        for c in (nd.left, nd.mid, nd.right):
+            if c is None:
+                break
+            if isinstance(c, Leaf):
+                result = agg.func_combine(result, agg.func_leaf_val(c.cargo))
+            else:
+                result = agg.func_combine(result, c.agg_val)
+        return result
+
     def swap(self, lf1: Leaf[T], lf2: Leaf[T]):
         """葉の入れ替え
 
@@ -806,6 +987,50 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
         self._update_max_node(lf2.parent)
         self._update_max_node(lf1.parent)
 
+    def reverse(self, lf1: Leaf[T], lf2: Leaf[T]):
+        """連続する葉の並びの反転
+
+        lf1 から lf2 までの連続する葉の並びを、キーの値に関わらず反転する
+        swap と同様に、反転後、木の再構築を行わないことに注意
+
+        最大 node の更新は、影響を受ける節点について下の階層から一度ずつ行う
+
+        なお、引数の Leaf は search メソッド等の戻り値であることを想定している
+
+        Args:
+            lf1: 並びの最初の葉
+            lf2: 並びの最後の葉（lf1 以降にあること）
+        """
+        leaves: list[Leaf[T]] = [lf1]
+        while leaves[-1] is not lf2:
+            nxt: Leaf[T] | None = self.successor(leaves[-1])
+            if nxt is None:
+                raise RuntimeError("lf2 is not found after lf1")
+            leaves.append(nxt)
+        if len(leaves) < 2:
+            return
+
+        # 葉がつながる位置
+        slots: list[tuple[int, Node[T]]] = []
+        for lf in leaves:
+            if lf.parent is None:
+                raise RuntimeError("leaf is not in the tree")
+            slots.append((self._leaf_position(lf.parent, lf), lf.parent))
+
+        # 付け替え
+        for (pos, p), lf in zip(slots, reversed(leaves)):
+            self._swap_raw(pos, p, lf)
+
+        # 最大 node を更新（葉の深さは同じなので、階層ごとに更新する）
+        level: dict[int, Node[T]] = {id(p): p for _, p in slots}
+        while len(level) > 0:
+            upper: dict[int, Node[T]] = {}
+            for nd in level.values():
+                self._update_max_node_raw(nd)
+                if nd.parent is not None:
+                    upper[id(nd.parent)] = nd.parent
+            level = upper
+
     def _leaf_position(self, p: Node[T], lf: Leaf[T]) -> int:
         """親から見た葉の位置
 
@@ -816,12 +1041,13 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
         Returns:
             1: left, 0: mid, -1: right
         """
-        if p.left == lf:
+        # 同じ値を持つ別の葉と区別するため、同一性で判定する
+        if p.left is lf:
             return 1
-        elif p.mid == lf:
+        elif p.mid is lf:
             return 0
         elif p.right is not None:
-            if p.right == lf:
+            if p.right is lf:
                 return -1
         raise RuntimeError("invalid leaf position")
 
@@ -895,7 +1121,217 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
                 lf = next
             else:
                 return lst
-    
+
+    def neighbors(self, target: T, k_below: int, k_above: int) -> tuple[list[Leaf[T]], Leaf[T] | None, list[Leaf[T]]]:
+        """引数の要素の前後にある要素を取得する
+
+        target の値より小さい要素を最大 k_below 個、大きい要素を最大 k_above 個
+        取得する。target と同じ値を持つ葉が存在しなくてもよい
+
+        木の探索は 1 回のみで、その後は葉を順にたどる
+
+        Args:
+            target: 基準となる要素
+            k_below: target より小さい要素の最大取得数
+            k_above: target より大きい要素の最大取得数
+
+        Returns:
+            (target より小さい要素のリスト, target と同じ値の葉 または None, target より大きい要素のリスト)
+            リストはいずれも昇順
+        """
+        lower: Leaf[T] | None
+        upper: Leaf[T] | None
+        hit: Leaf[T] | None = None
+
+        nd: Node[T] = self._search_raw(target)
+        if isinstance(nd, Leaf):
+            hit = nd
+            lower = self.predecessor(nd)
+            upper = self.successor(nd)
+        else:
+            lower, upper = self._find_bounds_in_children(nd, target)
+
+        below: list[Leaf[T]] = []
+        while lower is not None and len(below) < k_below:
+            below.append(lower)
+            lower = self.predecessor(lower)
+        below.reverse()
+
+        above: list[Leaf[T]] = []
+        while upper is not None and len(above) < k_above:
+            above.append(upper)
+            upper = self.successor(upper)
+
+        return below, hit, above
+
+    def _find_bounds_in_children(self, nd: Node[T], target: T) -> tuple[Leaf[T] | None, Leaf[T] | None]:
+        """target を挟む前後の葉を求める
+
+        _search_raw で見つからなかった場合の戻り値（葉を子要素に持つ節点）を対象とする
+
+        Args:
+            nd: _search_raw の戻り値となる内部節点
+            target: 基準となる要素
+
+        Returns:
+            (target より小さい最大の葉, target より大きい最小の葉), 存在しない場合は None
+        """
+        children: list[Leaf[T]] = [c for c in (nd.left, nd.mid, nd.right) if isinstance(c, Leaf)]
+        if len(children) == 0:
+            # root のみの場合
+            return None, None
+
+        for i, c in enumerate(children):
+            if c.compareCargo(target) > 0:
+                if i == 0:
+                    return self.predecessor(c), c
+                return children[i - 1], c
+
+        # 全ての子要素が target より小さい場合
+        return children[-1], self.successor(children[-1])
+
+    def aggregate(self, target1: T, target2: T) -> Any:
+        """引数の範囲にある要素の集約値を求める
+
+        引数で与えられたオブジェクトの値 [target1, target2] の範囲に該当する
+        葉の集約値を、葉の並び順に結合して求める
+
+        範囲の境界を通る経路以外は、内部節点に保持した部分木の集約値を用いるため
+        O(log n) で求められる
+
+        Args:
+            target1, 小さいほうの値
+            target2, 大きいほうの値
+
+        Returns
+            集約値, 該当する要素がない場合は単位元
+        """
+        if self._aggregator is None:
+            raise RuntimeError("aggregator is not specified.")
+        return self._aggregate_raw(self.root, target1, target2, True, True)
+
+    def _aggregate_raw(self, nd: Node[T] | None, target1: T, target2: T, check_lo: bool, check_hi: bool) -> Any:
+        """再帰により範囲内の集約値を求める
+
+        Args:
+            nd: 対象の Node
+            target1, 小さいほうの値
+            target2, 大きいほうの値
+            check_lo: nd の部分木の要素に target1 より小さいものが含まれうる場合 True
+            check_hi: nd の部分木の要素に target2 より大きいものが含まれうる場合 True
+
+        Returns:
+            nd の部分木のうち範囲内の要素の集約値
+        """
+        agg: Aggregator[T, Any] = self._aggregator
+        if nd is None:
+            return agg.identity
+
+        if isinstance(nd, Leaf):
+            if check_lo and nd.compareCargo(target1) < 0:
+                return agg.identity
+            if check_hi and nd.compareCargo(target2) > 0:
+                return agg.identity
+            return agg.func_leaf_val(nd.cargo)
+
+        if not isinstance(nd, InternalNode):
+            raise RuntimeError("invalid node type.")
+
+        # 部分木全体が範囲内
+        if not check_lo and not check_hi:
+            return nd.agg_val
+
+        result: Any = agg.identity
+        prev_max: Node[T] | None = None  # 一つ前の子要素の最大要素（子要素の最小要素はこれより大きい）
+        for child, child_max in ((nd.left, nd.left_max_node), (nd.mid, nd.mid_max_node), (nd.right, None)):
+            if child is None:
+                break
+
+            # 子要素の最小要素が target2 より大きい場合は、以降の子要素も範囲外
+            if check_hi and isinstance(prev_max, Leaf) and prev_max.compareCargo(target2) >= 0:
+                break
+
+            # 子要素の最大要素が target1 より小さい場合は、範囲外
+            if check_lo and isinstance(child_max, Leaf) and child_max.compareCargo(target1) < 0:
+                prev_max = child_max
+                continue
+
+            lo: bool = check_lo and not (isinstance(prev_max, Leaf) and prev_max.compareCargo(target1) >= 0)
+            hi: bool = check_hi and not (isinstance(child_max, Leaf) and child_max.compareCargo(target2) <= 0)
+            result = agg.func_combine(result, self._aggregate_raw(child, target1, target2, lo, hi))
+            prev_max = child_max
+
+        return result
+
+    def stab(self, x: float) -> list[Leaf[T]]:
+        """区間 [始点, 終点] に x を含む要素をリストアップする
+
+        区間木モードの場合のみ利用可能
+
+        Args:
+            x: 対象の値
+
+        Returns
+            Leaf[T] のリスト, 区間の始点の順
+        """
+        return self.overlapping(x, x)
+
+    def overlapping(self, lo: float, hi: float) -> list[Leaf[T]]:
+        """区間 [始点, 終点] が [lo, hi] と重なる要素をリストアップする
+
+        区間木モードの場合のみ利用可能
+
+        部分木の終点の最大値が lo より小さい部分木、および始点が hi より大きい
+        部分木は探索しない
+
+        Args:
+            lo: 範囲の下限
+            hi: 範囲の上限
+
+        Returns
+            Leaf[T] のリスト, 区間の始点の順
+        """
+        if self._func_interval is None:
+            raise RuntimeError("tree is not interval mode.")
+        lst: list[Leaf[T]] = []
+        self._overlapping_raw(self.root, lo, hi, lst)
+        return lst
+
+    def _overlapping_raw(self, nd: Node[T] | None, lo: float, hi: float, lst: list[Leaf[T]]):
+        """再帰により [lo, hi] と重なる要素をリストアップする
+
+        Args:
+            nd: 対象の Node
+            lo: 範囲の下限
+            hi: 範囲の上限
+            lst: 結果を格納するリスト
+        """
+        if nd is None:
+            return
+
+        if isinstance(nd, Leaf):
+            start, end = self._func_interval(nd.cargo)
+            if start <= hi and lo <= end:
+                lst.append(nd)
+            return
+
+        if not isinstance(nd, InternalNode):
+            raise RuntimeError("invalid node type.")
+
+        # 部分木の全区間の終点が lo より小さい
+        if nd.max_end is None or nd.max_end < lo:
+            return
+
+        prev_max: Node[T] | None = None  # 一つ前の子要素の最大要素（子要素の始点はこれ以上となる）
+        for child, child_max in ((nd.left, nd.left_max_node), (nd.mid, nd.mid_max_node), (nd.right, None)):
+            if child is None:
+                break
+            # 以降の子要素の始点は全て hi より大きい
+            if isinstance(prev_max, Leaf) and self._func_interval(prev_max.cargo)[0] > hi:
+                break
+            self._overlapping_raw(child, lo, hi, lst)
+            prev_max = child_max
+
     def delete(self, obj: T):
         """要素の削除
 
@@ -915,12 +1351,25 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
             # 削除対象がない
             return
 
+        self.deleteLeaf(result)
+
+    def deleteLeaf(self, lf: Leaf[T]):
+        """葉の削除
+
+        引数で与えられた葉を、探索（要素の比較）を行わずに削除する
+        なお、引数の Leaf は search メソッド等の戻り値であることを想定している
+
+        当該要素を削除したのち、2-3木が保たれるように再構築を行う
+
+        Args:
+            lf: 削除対象の葉
+        """
         # ノードを削除
-        if result.parent is None or not isinstance(result.parent, InternalNode):
+        if lf.parent is None or not isinstance(lf.parent, InternalNode):
             raise RuntimeError()
         
-        base : InternalNode[T] = result.parent
-        self._delete_raw(result, base)
+        base : InternalNode[T] = lf.parent
+        self._delete_raw(lf, base)
         # base の子要素は左詰めになっている点に注意
 
         # 2-3木を再構成
@@ -1114,6 +1563,73 @@ class TwoThreeTree(Generic[NL, T]): # T は Node の型パラメータと一致
             self.root.mid = None
         if self.root.left is not None:
             self.root.left = None
+        # 最大要素を更新
+        self._update_max_node_raw(self.root)
+
+    def memory_report(self, sample_rate: float = 1.0, seed: int | None = None, seen: set[int] | None = None) -> TreeMemoryReport:
+        """メモリ使用量の見積もり
+
+        木全体を一度だけたどり、葉・内部節点の数と、sys.getsizeof による
+        バイト数を求める
+        葉が保持するオブジェクト（cargo）は、参照先まで含めて数える
+
+        sample_rate に 1.0 未満を指定した場合は、その割合の節点のみバイト数を
+        求め、平均値から合計を見積もる（運用中の大きな木で用いることを想定）
+
+        Args:
+            sample_rate: バイト数を求める節点の割合 (0, 1]
+            seed: サンプリングに用いる乱数のシード
+            seen: 数え済みのオブジェクトの id の集合, 他の構造と共有するオブジェクトを二重に数えないために指定する
+
+        Returns:
+            メモリ使用量
+        """
+        if sample_rate <= 0 or 1 < sample_rate:
+            raise ValueError(f"sample_rate must be in (0, 1]: {sample_rate}")
+        if seen is None:
+            seen = set()
+        rnd: random.Random = random.Random(seed)
+
+        leaf_count: int = 0
+        internal_count: int = 0
+        leaf_bytes: int = 0
+        internal_bytes: int = 0
+        cargo_bytes: int = 0
+        sampled_leaf: int = 0
+        sampled_internal: int = 0
+
+        stack: list[Node[T]] = [self.root]
+        while len(stack) > 0:
+            nd: Node[T] = stack.pop()
+            sampled: bool = sample_rate >= 1.0 or rnd.random() < sample_rate
+            if isinstance(nd, Leaf):
+                leaf_count += 1
+                if sampled:
+                    sampled_leaf += 1
+                    leaf_bytes += shallowSizeOf(nd)
+                    cargo_bytes += deepSizeOf(nd.cargo, seen)
+                continue
+
+            internal_count += 1
+            if sampled:
+                sampled_internal += 1
+                internal_bytes += shallowSizeOf(nd)
+            for c in (nd.left, nd.mid, nd.right):
+                if c is not None:
+                    stack.append(c)
+
+        per_leaf: float = leaf_bytes / sampled_leaf if sampled_leaf > 0 else 0.0
+        per_internal: float = internal_bytes / sampled_internal if sampled_internal > 0 else 0.0
+        per_cargo: float = cargo_bytes / sampled_leaf if sampled_leaf > 0 else 0.0
+        return TreeMemoryReport(
+            leaf_count,
+            internal_count,
+            self.height,
+            per_leaf,
+            per_internal,
+            per_cargo,
+            round((per_leaf + per_cargo) * leaf_count + per_internal * internal_count),
+            sample_rate)
 
     def visualizeGraph(self, verbose: bool, graph_name:str = "two_three_graph.gv", format_name: str = "pdf"):
         """2-3木を図示する
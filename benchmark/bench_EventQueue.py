@@ -0,0 +1,69 @@
+"""イベントキューのベンチマーク
+
+SweepLineMethod のイベントキューの種類ごとに処理時間を比較する
+    queue ops : 全端点のイベントを追加し、最小要素の取得と削除を繰り返す
+    sweep     : 平面走査法全体
+
+入力は整数座標のランダムな線分とする
+
+実行方法（リポジトリのルートで実行）
+    $ python -m benchmark.bench_EventQueue [線分数 ...]
+"""
+
+import random
+import sys
+import time
+
+from Point import Point
+from LineSegment import LineSegment
+from EventQueue import BNode, EventQueue, EventQueueType, EventType, createEventQueue
+from SweepLineMethod import SweepLineMethod
+
+
+def _create_lines(n: int, seed: int) -> list[LineSegment]:
+    rnd: random.Random = random.Random(seed)
+    size: int = n
+    # 短めの線分として、交点数が線分数に比例する程度にする
+    lst: list[LineSegment] = []
+    for _ in range(n):
+        x: int = rnd.randint(0, size)
+        y: int = rnd.randint(0, size)
+        lst.append(LineSegment(Point(x, y), Point(x + rnd.randint(1, 10), y + rnd.randint(-10, 10))))
+    return lst
+
+
+def bench_queue_ops(queue_type: EventQueueType, lst: list[LineSegment]) -> float:
+    queue: EventQueue = createEventQueue(queue_type, lst)
+    start: float = time.perf_counter()
+    for i, ls in enumerate(lst):
+        queue.insert(BNode(EventType.LEFT, ls.minxPt, ls, None, i))
+        queue.insert(BNode(EventType.RIGHT, ls.maxxPt, ls, None, i))
+    while True:
+        bn: BNode | None = queue.minimum()
+        if bn is None:
+            break
+        queue.hasEndpoint(bn.pt)
+        queue.delete(bn)
+    return time.perf_counter() - start
+
+
+def bench_sweep(queue_type: EventQueueType, lst: list[LineSegment]) -> tuple[float, int]:
+    slm: SweepLineMethod = SweepLineMethod(lst, eventQueueType=queue_type)
+    start: float = time.perf_counter()
+    try:
+        slm.exec()
+    except RuntimeError as e:
+        # 数値誤差により走査に失敗した場合は、交点数を -1 とする
+        print(f"  sweep failed: {e}")
+        return time.perf_counter() - start, -1
+    return time.perf_counter() - start, len(slm.getCrossPoints())
+
+
+if __name__ == "__main__":
+    sizes: list[int] = [int(a) for a in sys.argv[1:]] if len(sys.argv) > 1 else [200, 1000, 5000]
+    for n in sizes:
+        lst: list[LineSegment] = _create_lines(n, n)
+        for queue_type in EventQueueType:
+            ops_sec: float = bench_queue_ops(queue_type, lst)
+            sweep_sec, crosses = bench_sweep(queue_type, lst)
+            print(f"{queue_type.name:6s} n={n:>6d}  queue ops {ops_sec:8.3f} s  sweep {sweep_sec:8.3f} s  crosses={crosses}")
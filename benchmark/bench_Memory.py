@@ -0,0 +1,67 @@
+"""平面走査法のメモリ使用量・確保量のベンチマーク
+
+レコード 1 個あたりのバイト数と、走査全体のメモリ使用量を求める
+    record : Point, BNode, ANode, Sweepline 1 個あたりのバイト数（sys.getsizeof, __dict__ を含む）
+    sweep  : 走査後の SweepLineMethod.memory_report による合計バイト数と、
+             走査中に tracemalloc で計測した確保量のピーク
+             それぞれを交点 1 個あたり、イベント 1 個あたりに換算する
+             イベント数は、端点のイベント数（線分数の 2 倍）と交点数の和とする
+
+実行方法（リポジトリのルートで実行）
+    $ python -m benchmark.bench_Memory [線分数 ...]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from Point import Point
+from LineSegment import LineSegment
+from MemoryReport import SweepMemoryReport, shallowSizeOf
+from EventQueue import BNode, EventType
+from SweepLineMethod import SweepLineMethod
+from SweepStatus import ANode, Sweepline
+
+
+def _create_lines(n: int, seed: int) -> list[LineSegment]:
+    # 1 辺 100 の正方形内の、長さ 10 程度までの線分（交点数が線分数に比例する程度）
+    rnd: random.Random = random.Random(seed)
+    lst: list[LineSegment] = []
+    for _ in range(n):
+        x: float = rnd.uniform(0, 100)
+        y: float = rnd.uniform(0, 100)
+        lst.append(LineSegment(Point(x, y), Point(x + rnd.uniform(-10, 10), y + rnd.uniform(-10, 10))))
+    return lst
+
+
+def record_sizes() -> dict[str, int]:
+    ls: LineSegment = LineSegment(Point(0, 0), Point(1, 1))
+    return {
+        "Point": shallowSizeOf(Point(0.5, 0.5)),
+        "BNode": shallowSizeOf(BNode(EventType.LEFT, ls.pt1, ls, None, 0)),
+        "ANode": shallowSizeOf(ANode(ls, 0)),
+        "Sweepline": shallowSizeOf(Sweepline(0.0)),
+    }
+
+
+def bench(lst: list[LineSegment]) -> tuple[int, int, int, int]:
+    slm: SweepLineMethod = SweepLineMethod(lst)
+    tracemalloc.start()
+    slm.exec()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rep: SweepMemoryReport = slm.memory_report()
+    crosses: int = len(slm.getCrossPoints())
+    return crosses, 2 * len(lst) + crosses, rep.totalBytes, peak
+
+
+if __name__ == "__main__":
+    for name, size in record_sizes().items():
+        print(f"record {name:10s} {size:6d} bytes")
+
+    sizes: list[int] = [int(a) for a in sys.argv[1:]] if len(sys.argv) > 1 else [1000, 5000]
+    for n in sizes:
+        crosses, events, total, peak = bench(_create_lines(n, n))
+        print(f"sweep  N={n:>6d}  crosses {crosses:8d}  events {events:8d}  "
+              f"report {total:10d} B ({total / max(crosses, 1):7.1f} B/cross, {total / events:7.1f} B/event)  "
+              f"peak {peak:10d} B ({peak / max(crosses, 1):7.1f} B/cross, {peak / events:7.1f} B/event)")
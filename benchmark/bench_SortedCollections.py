@@ -0,0 +1,116 @@
+"""SortedDict のベンチマーク
+
+SortedDict（2-3木）と、以下のベースラインの処理時間を比較する
+    dict+sort   : dict に格納し、順序が必要になるたびにキーをソートする
+    bisect list : ソート済みリストに bisect.insort で追加する
+
+実行方法（リポジトリのルートで実行）
+    $ python -m benchmark.bench_SortedCollections [キー数の指数 ...]
+
+    例) 10^4, 10^5, 10^6 キーで計測（デフォルト）
+    $ python -m benchmark.bench_SortedCollections 4 5 6
+
+    10^7 キーは SortedDict の構築に数 GB のメモリと長い時間を要するため、
+    明示的に指定した場合のみ計測する
+    $ python -m benchmark.bench_SortedCollections 7
+"""
+
+import bisect
+import random
+import sys
+import time
+from typing import Callable
+
+from SortedCollections import SortedDict
+
+# 1 回の計測で行う問い合わせ数
+_QUERIES: int = 10000
+
+# insort による構築を行う最大キー数（これを超える場合は一括ソートで構築する）
+_INSORT_LIMIT: int = 10 ** 5
+
+# 順序付きの問い合わせのたびにソートする dict+sort の問い合わせ数
+_RESORT_QUERIES: int = 20
+
+
+def _measure(func: Callable[[], object]) -> float:
+    start: float = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _report(name: str, n: int, op: str, count: int, sec: float):
+    print(f"{name:12s} n={n:>9d} {op:16s} {sec:9.3f} s  {sec / count * 1e6:10.2f} us/op")
+
+
+def bench(n: int):
+    rnd: random.Random = random.Random(n)
+    keys: list[float] = [rnd.random() for _ in range(n)]
+    queries: list[float] = [rnd.random() for _ in range(_QUERIES)]
+
+    # SortedDict
+    sd: SortedDict = SortedDict()
+    def build_sd():
+        for k in keys:
+            sd[k] = k
+    _report("SortedDict", n, "build", n, _measure(build_sd))
+    _report("SortedDict", n, "get", _QUERIES, _measure(lambda: [sd.get(q) for q in queries]))
+    _report("SortedDict", n, "bisect_left", _QUERIES, _measure(lambda: [sd.bisect_left(q) for q in queries]))
+    _report("SortedDict", n, "irange(10 keys)", _QUERIES,
+            _measure(lambda: [list(sd.irange(q, q + 10 / n)) for q in queries]))
+    _report("SortedDict", n, "peekitem", _QUERIES,
+            _measure(lambda: [sd.peekitem(int(q * n)) for q in queries]))
+    def mixed_sd():
+        for q in queries:
+            sd[q] = q
+            sd.bisect_left(q)
+            del sd[q]
+    _report("SortedDict", n, "insert+rank+del", _QUERIES, _measure(mixed_sd))
+    del sd
+
+    # dict+sort
+    d: dict[float, float] = {}
+    def build_dict():
+        for k in keys:
+            d[k] = k
+    _report("dict+sort", n, "build", n, _measure(build_dict))
+    _report("dict+sort", n, "get", _QUERIES, _measure(lambda: [d.get(q) for q in queries]))
+    def mixed_dict():
+        for q in queries[:_RESORT_QUERIES]:
+            d[q] = q
+            bisect.bisect_left(sorted(d), q)
+            del d[q]
+    _report("dict+sort", n, "insert+rank+del", _RESORT_QUERIES, _measure(mixed_dict))
+    del d
+
+    # bisect list
+    lst: list[float] = []
+    def build_list():
+        nonlocal lst
+        if n <= _INSORT_LIMIT:
+            for k in keys:
+                bisect.insort(lst, k)
+        else:
+            lst = sorted(keys)
+    _report("bisect list", n, "build" if n <= _INSORT_LIMIT else "build(sorted)", n, _measure(build_list))
+    def get_list():
+        for q in queries:
+            i: int = bisect.bisect_left(lst, q)
+            _ = i < len(lst) and lst[i] == q
+    _report("bisect list", n, "get", _QUERIES, _measure(get_list))
+    _report("bisect list", n, "bisect_left", _QUERIES, _measure(lambda: [bisect.bisect_left(lst, q) for q in queries]))
+    _report("bisect list", n, "irange(10 keys)", _QUERIES,
+            _measure(lambda: [lst[bisect.bisect_left(lst, q):bisect.bisect_right(lst, q + 10 / n)] for q in queries]))
+    def mixed_list():
+        for q in queries:
+            bisect.insort(lst, q)
+            i: int = bisect.bisect_left(lst, q)
+            del lst[i]
+    _report("bisect list", n, "insert+rank+del", _QUERIES, _measure(mixed_list))
+    del lst
+
+
+if __name__ == "__main__":
+    exps: list[int] = [int(a) for a in sys.argv[1:]] if len(sys.argv) > 1 else [4, 5, 6]
+    for e in exps:
+        bench(10 ** e)
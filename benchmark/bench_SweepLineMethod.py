@@ -0,0 +1,70 @@
+"""平面走査法を小さなジョブとして繰り返し実行する場合のベンチマーク
+
+線分数 N のジョブ（線分のリスト）を続けて処理し、1 秒あたりのジョブ数を比較する
+    new   : ジョブごとに SweepLineMethod を生成して実行する
+    reset : 1 個の SweepLineMethod を reset で初期化して再利用する
+
+EventQueueType, SweepStatusType の組（TREE/TREE, HEAP/SKIPLIST, BUCKET/BLOCKS）ごとに求める
+
+実行方法（リポジトリのルートで実行）
+    $ python -m benchmark.bench_SweepLineMethod [線分数 ...]
+"""
+
+import random
+import sys
+import time
+
+from Point import Point
+from LineSegment import LineSegment
+from EventQueue import EventQueueType
+from SweepLineMethod import SweepLineMethod
+from SweepStatus import SweepStatusType
+
+# 計測に用いるジョブの延べ線分数（線分数が少ない場合はジョブ数を増やす）
+_TOTAL_SEGMENTS: int = 20000
+
+_TYPES: list[tuple[EventQueueType, SweepStatusType]] = [
+    (EventQueueType.TREE, SweepStatusType.TREE),
+    (EventQueueType.HEAP, SweepStatusType.SKIPLIST),
+    (EventQueueType.BUCKET, SweepStatusType.BLOCKS),
+]
+
+
+def _create_jobs(n: int, count: int, seed: int) -> list[list[LineSegment]]:
+    # 1 辺 100 の正方形内の、長さ 10 程度までの線分（交点数が線分数に比例する程度）
+    rnd: random.Random = random.Random(seed)
+    jobs: list[list[LineSegment]] = []
+    for _ in range(count):
+        lst: list[LineSegment] = []
+        for _ in range(n):
+            x: float = rnd.uniform(0, 100)
+            y: float = rnd.uniform(0, 100)
+            lst.append(LineSegment(Point(x, y), Point(x + rnd.uniform(-10, 10), y + rnd.uniform(-10, 10))))
+        jobs.append(lst)
+    return jobs
+
+
+def bench(eqt: EventQueueType, sst: SweepStatusType, jobs: list[list[LineSegment]]) -> tuple[float, float]:
+    start: float = time.perf_counter()
+    for lst in jobs:
+        slm: SweepLineMethod = SweepLineMethod(lst, eventQueueType=eqt, sweepStatusType=sst)
+        slm.exec()
+    new_sec: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slm = SweepLineMethod([], eventQueueType=eqt, sweepStatusType=sst)
+    for lst in jobs:
+        slm.reset(lst)
+        slm.exec()
+    reset_sec: float = time.perf_counter() - start
+
+    return len(jobs) / new_sec, len(jobs) / reset_sec
+
+
+if __name__ == "__main__":
+    sizes: list[int] = [int(a) for a in sys.argv[1:]] if len(sys.argv) > 1 else [100, 1000]
+    for n in sizes:
+        jobs: list[list[LineSegment]] = _create_jobs(n, max(_TOTAL_SEGMENTS // n, 5), n)
+        for eqt, sst in _TYPES:
+            new_jps, reset_jps = bench(eqt, sst, jobs)
+            print(f"{eqt.name:6s}/{sst.name:8s} N={n:>5d}  jobs x{len(jobs):<4d}  new {new_jps:9.1f} jobs/s  reset {reset_jps:9.1f} jobs/s")
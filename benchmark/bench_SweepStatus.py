@@ -0,0 +1,68 @@
+"""走査線上の線分の管理のベンチマーク
+
+SweepStatusType ごとに処理時間を比較する
+    build : 走査線上に N 本の線分を追加する
+    ops   : 線分の探索, 前後の線分の取得, 削除, 再追加を繰り返す
+    swap  : 隣り合う線分の入れ替えを繰り返す
+
+走査線上の線分数 N は、数百から数万を想定する
+
+実行方法（リポジトリのルートで実行）
+    $ python -m benchmark.bench_SweepStatus [線分数 ...]
+"""
+
+import random
+import sys
+import time
+
+from Point import Point
+from LineSegment import LineSegment
+from SweepStatus import ANode, StatusHandle, Sweepline, SweepStatus, SweepStatusType, createSweepStatus
+
+_OPS: int = 5000
+
+
+def _create_nodes(n: int, seed: int) -> list[ANode]:
+    # 走査線 x = 0 をまたぎ、互いに交わらない線分
+    rnd: random.Random = random.Random(seed)
+    ys: list[int] = rnd.sample(range(10 * n), n)
+    return [ANode(LineSegment(Point(-100, y), Point(100, y + 0.5))) for y in ys]
+
+
+def bench(status_type: SweepStatusType, ans: list[ANode], seed: int) -> tuple[float, float, float]:
+    rnd: random.Random = random.Random(seed)
+    st: SweepStatus = createSweepStatus(status_type, Sweepline(0.0))
+
+    start: float = time.perf_counter()
+    handles: list[StatusHandle] = [st.insert(an) for an in ans]
+    build_sec: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(_OPS):
+        i: int = rnd.randrange(len(ans))
+        h: StatusHandle | None = st.search(ans[i])
+        st.predecessor(h)
+        st.successor(h)
+        st.delete(h)
+        handles[i] = st.insert(ans[i])
+    ops_sec: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(_OPS):
+        h = handles[rnd.randrange(len(ans))]
+        succ: StatusHandle | None = st.successor(h)
+        if succ is not None:
+            st.swap(h, succ)
+            st.swap(h, succ)
+    swap_sec: float = time.perf_counter() - start
+
+    return build_sec, ops_sec, swap_sec
+
+
+if __name__ == "__main__":
+    sizes: list[int] = [int(a) for a in sys.argv[1:]] if len(sys.argv) > 1 else [300, 3000, 30000]
+    for n in sizes:
+        ans: list[ANode] = _create_nodes(n, n)
+        for status_type in SweepStatusType:
+            build_sec, ops_sec, swap_sec = bench(status_type, ans, n)
+            print(f"{status_type.name:8s} N={n:>6d}  build {build_sec:8.3f} s  ops x{_OPS} {ops_sec:8.3f} s  swap x{_OPS} {swap_sec:8.3f} s")
@@ -1,6 +1,7 @@
 
 from dataclasses import dataclass
 import math
+from LineSegment import LineSegment
 from TwoThreeTree import Leaf, Node
 
 # テスト用の Node 要素
@@ -27,3 +28,31 @@ class MyLeaf(Leaf[NodeForTest]):
 
 def myleaf_ctor(v: NodeForTest, parent: Node[NodeForTest]):
     return MyLeaf(v, parent)
+
+# 区間木モードのテスト用の Node 要素
+@dataclass
+class SegmentForTest:
+    id: int             # id, 始点が同じ場合の順序に用いる
+    ls: LineSegment     # 線分, x 方向の範囲を区間とする
+
+class SegmentLeaf(Leaf[SegmentForTest]):
+
+    def __init__(self, val: SegmentForTest, parent: Node[SegmentForTest] | None):
+        super().__init__(val, parent, self._get_key, self._comp_key)
+
+    def _get_key(self, v: SegmentForTest) -> str:
+        return f"[{v.ls.minx}, {v.ls.maxx}]"
+
+    def _comp_key(self, v1: SegmentForTest, v2: SegmentForTest) -> int:
+        # 区間の始点の順, 同じ場合は id の順
+        if v1.ls.minx < v2.ls.minx:
+            return -1
+        elif v1.ls.minx > v2.ls.minx:
+            return 1
+        return v1.id - v2.id
+
+def segmentleaf_ctor(v: SegmentForTest, parent: Node[SegmentForTest]):
+    return SegmentLeaf(v, parent)
+
+def segment_interval(v: SegmentForTest) -> tuple[float, float]:
+    return (v.ls.minx, v.ls.maxx)
@@ -0,0 +1,79 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from BatchCrossPoint import calcCrossPoints, segmentArray
+from LineSegment import CrossPointStatus, LineSegment
+from Point import Point
+
+
+class TestBatchCrossPoint(unittest.TestCase):
+    """線分の交点の一括計算に関するテスト
+
+    組ごとに LineSegment.getCrossPoint（_calcCrossPoint）を呼び出した結果と比較する
+    """
+
+    def _assertSameAsScalar(self, lses1: list[LineSegment], lses2: list[LineSegment], pairs: list[tuple[int, int]]):
+        idx1: np.ndarray = np.array([i for i, _ in pairs], dtype=np.intp)
+        idx2: np.ndarray = np.array([j for _, j in pairs], dtype=np.intp)
+        xs, ys, statuses = calcCrossPoints(segmentArray(lses1), segmentArray(lses2), idx1, idx2)
+
+        self.assertEqual(len(pairs), len(statuses))
+        for k, (i, j) in enumerate(pairs):
+            pt: Point | None = lses1[i].getCrossPoint(lses2[j])
+            self.assertEqual(lses1[i].status, CrossPointStatus(int(statuses[k])), (i, j))
+            if pt is None:
+                self.assertTrue(math.isnan(xs[k]) and math.isnan(ys[k]))
+            else:
+                self.assertEqual((pt.x, pt.y), (float(xs[k]), float(ys[k])))
+
+    def _randomLines(self, rnd: random.Random, n: int, coord) -> list[LineSegment]:
+        return [LineSegment(Point(coord(), coord()), Point(coord(), coord())) for _ in range(n)]
+
+    def test_batch_1(self):
+        # 交点の状態ごとの組
+        ls: LineSegment = LineSegment(Point(1, -1), Point(3, 1))
+        others: list[LineSegment] = [
+            LineSegment(Point(4, 0), Point(5, 3)),    # OUT_OF_LINESEGMENT（外接矩形が重ならない）
+            LineSegment(Point(2, 1), Point(3, 3)),    # OUT_OF_LINESEGMENT（両端点が同じ側）
+            LineSegment(Point(0, 2), Point(2, -1)),   # EXIST
+            LineSegment(Point(2, 0), Point(4, 3)),    # EXIST（端点で接する）
+            LineSegment(Point(0, 0), Point(2, 2)),    # PARALLEL
+            LineSegment(Point(4, 2), Point(5, 3)),    # ON_LINE
+            LineSegment(Point(2, 0), Point(5, 3)),    # ON_LINE_OVERLAP
+            LineSegment(Point(1.5, -0.5), Point(2, 0)),  # ON_LINE_INCLUDED
+            LineSegment(Point(2, 0), Point(2, 0)),    # 長さ 0 の線分
+        ]
+        self._assertSameAsScalar([ls], others, [(0, j) for j in range(len(others))])
+        self._assertSameAsScalar(others, [ls], [(j, 0) for j in range(len(others))])
+
+        statuses = calcCrossPoints(segmentArray([ls]), segmentArray(others), np.zeros(len(others), dtype=np.intp), np.arange(len(others)))[2]
+        self.assertEqual([CrossPointStatus.OUT_OF_LINESEGMENT, CrossPointStatus.OUT_OF_LINESEGMENT,
+                          CrossPointStatus.EXIST, CrossPointStatus.EXIST,
+                          CrossPointStatus.PARALLEL, CrossPointStatus.ON_LINE,
+                          CrossPointStatus.ON_LINE_OVERLAP, CrossPointStatus.ON_LINE_INCLUDED],
+                         [CrossPointStatus(int(s)) for s in statuses[:-1]])
+
+    def test_batch_2(self):
+        # 乱数の座標の線分の総当たり
+        rnd: random.Random = random.Random(0)
+        lses: list[LineSegment] = self._randomLines(rnd, 60, lambda: rnd.uniform(0, 10))
+        pairs: list[tuple[int, int]] = [(i, j) for i in range(len(lses)) for j in range(len(lses)) if i != j]
+        self._assertSameAsScalar(lses, lses, pairs)
+
+    def test_batch_3(self):
+        # 平行・同一直線上・端点の共有などの縮退が多い格子上の座標
+        for seed, coord in enumerate([lambda rnd: float(rnd.randint(0, 6)), lambda rnd: rnd.randint(0, 20) / 10]):
+            rnd: random.Random = random.Random(seed)
+            lses: list[LineSegment] = self._randomLines(rnd, 50, lambda: coord(rnd))
+            pairs: list[tuple[int, int]] = [(i, j) for i in range(len(lses)) for j in range(len(lses))]
+            self._assertSameAsScalar(lses, lses, pairs)
+
+    def test_batch_4(self):
+        # 組がない場合
+        xs, ys, statuses = calcCrossPoints(segmentArray([]), segmentArray([]), np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp))
+        self.assertEqual(0, len(xs))
+        self.assertEqual(0, len(ys))
+        self.assertEqual(0, len(statuses))
@@ -0,0 +1,99 @@
+import random
+import unittest
+from Point import Point
+from LineSegment import LineSegment
+from EventQueue import BNode, BucketEventQueue, EventType, HeapEventQueue, TreeEventQueue
+
+class TestEventQueue(unittest.TestCase):
+    """イベントキューに関するテスト
+    """
+
+    def _create_events(self) -> list[BNode]:
+        rnd: random.Random = random.Random(6)
+        events: list[BNode] = []
+        for i in range(100):
+            ls: LineSegment = LineSegment(Point(rnd.randint(0, 20), rnd.randint(0, 20)), Point(rnd.randint(0, 20), rnd.randint(0, 20)))
+            events.append(BNode(EventType.LEFT, ls.minxPt, ls, None, i))
+            events.append(BNode(EventType.RIGHT, ls.maxxPt, ls, None, i))
+        for i in range(30):
+            ls: LineSegment = LineSegment(Point(0, 0), Point(1, 1))
+            events.append(BNode(EventType.CROSS, Point(rnd.randint(0, 20) + 0.5, rnd.uniform(0, 20)), ls, ls, None))
+        rnd.shuffle(events)
+        return events
+
+    def test_event_queue_1(self):
+        # 2-3木と同じ順序でイベントが取り出されること
+        tree: TreeEventQueue = TreeEventQueue()
+        heap: HeapEventQueue = HeapEventQueue()
+        for bn in self._create_events():
+            tree.insert(bn)
+            heap.insert(bn)
+
+        while True:
+            bn1: BNode | None = tree.minimum()
+            bn2: BNode | None = heap.minimum()
+            self.assertIs(bn1, bn2)
+            if bn1 is None:
+                break
+            tree.delete(bn1)
+            heap.delete(bn2)
+        self.assertEqual(0, len(heap))
+
+    def test_event_queue_2(self):
+        # 先頭以外のイベントの削除（遅延削除）と端点の判定
+        heap: HeapEventQueue = HeapEventQueue()
+        ls: LineSegment = LineSegment(Point(1, 1), Point(3, 2))
+        left: BNode = BNode(EventType.LEFT, ls.minxPt, ls, None, 0)
+        right: BNode = BNode(EventType.RIGHT, ls.maxxPt, ls, None, 0)
+        cross: BNode = BNode(EventType.CROSS, Point(2, 1.5), ls, ls, None)
+        heap.insert(left)
+        heap.insert(right)
+        heap.insert(cross)
+
+        self.assertTrue(heap.hasEndpoint(Point(3, 2)))
+        self.assertFalse(heap.hasEndpoint(Point(2, 1.5)))
+
+        heap.delete(cross)
+        heap.delete(right)
+        self.assertFalse(heap.hasEndpoint(Point(3, 2)))
+        self.assertEqual(1, len(heap))
+        self.assertIs(left, heap.minimum())
+
+        heap.delete(left)
+        self.assertIsNone(heap.minimum())
+
+        tree: TreeEventQueue = TreeEventQueue()
+        tree.insert(right)
+        self.assertTrue(tree.hasEndpoint(Point(3, 2)))
+        self.assertFalse(tree.hasEndpoint(Point(3, 1)))
+
+    def test_event_queue_3(self):
+        # バケットキューも 2-3木と同じ順序でイベントが取り出されること
+        events: list[BNode] = self._create_events()
+        tree: TreeEventQueue = TreeEventQueue()
+        bucket: BucketEventQueue = BucketEventQueue([bn.ls for bn in events if bn.eventType != EventType.CROSS])
+        for bn in events:
+            tree.insert(bn)
+            bucket.insert(bn)
+
+        # 先頭以外の削除
+        for bn in events[:20]:
+            tree.delete(bn)
+            bucket.delete(bn)
+
+        while True:
+            bn1: BNode | None = tree.minimum()
+            bn2: BNode | None = bucket.minimum()
+            self.assertIs(bn1, bn2)
+            if bn1 is None:
+                break
+            tree.delete(bn1)
+            bucket.delete(bn2)
+
+            # 処理中に現在位置より後ろ（格子点の間, 範囲外）に交点を追加
+            if bn1.eventType == EventType.LEFT and bn1.lnId % 10 == 0:
+                for x in (bn1.pt.x + 0.25, bn1.pt.x + 1e-12, 100.0):
+                    cross: BNode = BNode(EventType.CROSS, Point(x, bn1.pt.y), bn1.ls, bn1.ls, None)
+                    tree.insert(cross)
+                    bucket.insert(cross)
+        self.assertEqual(0, len(bucket))
@@ -0,0 +1,138 @@
+import bisect
+import random
+import unittest
+from SortedCollections import SortedDict, SortedSet
+
+class TestSortedDict(unittest.TestCase):
+    """SortedDict に関するテスト
+    """
+
+    def setUp(self):
+        self.sd: SortedDict = SortedDict({5: "e", 1: "a", 3: "c", 9: "i", 7: "g"})
+
+    def tearDown(self):
+        pass
+
+    def test_sorted_dict_01(self):
+        """要素の追加・取得・削除
+        """
+        self.assertEqual(5, len(self.sd))
+        self.assertEqual([1, 3, 5, 7, 9], list(self.sd))
+        self.assertEqual([9, 7, 5, 3, 1], list(reversed(self.sd)))
+        self.assertEqual("c", self.sd[3])
+        self.assertIn(7, self.sd)
+        self.assertNotIn(4, self.sd)
+        with self.assertRaises(KeyError):
+            self.sd[4]
+
+        self.sd[4] = "d"
+        self.sd[3] = "C"
+        self.assertEqual(6, len(self.sd))
+        self.assertEqual([(1, "a"), (3, "C"), (4, "d"), (5, "e"), (7, "g"), (9, "i")], list(self.sd.items()))
+
+        del self.sd[1]
+        self.assertEqual([3, 4, 5, 7, 9], list(self.sd.keys()))
+        self.assertEqual(["C", "d", "e", "g", "i"], list(self.sd.values()))
+        with self.assertRaises(KeyError):
+            del self.sd[1]
+
+        self.sd.clear()
+        self.assertEqual(0, len(self.sd))
+        self.assertEqual([], list(self.sd))
+
+    def test_sorted_dict_02(self):
+        """bisect_left, bisect_right
+        """
+        self.assertEqual(0, self.sd.bisect_left(0))
+        self.assertEqual(0, self.sd.bisect_left(1))
+        self.assertEqual(1, self.sd.bisect_right(1))
+        self.assertEqual(2, self.sd.bisect_left(4))
+        self.assertEqual(2, self.sd.bisect_right(4))
+        self.assertEqual(4, self.sd.bisect_left(9))
+        self.assertEqual(5, self.sd.bisect_right(9))
+        self.assertEqual(5, self.sd.bisect_left(10))
+        self.assertEqual(0, SortedDict().bisect_right(1))
+
+    def test_sorted_dict_03(self):
+        """irange
+        """
+        self.assertEqual([3, 5, 7], list(self.sd.irange(3, 7)))
+        self.assertEqual([5], list(self.sd.irange(3, 7, (False, False))))
+        self.assertEqual([5, 7, 9], list(self.sd.irange(4)))
+        self.assertEqual([1, 3], list(self.sd.irange(maximum=4)))
+        self.assertEqual([7, 5, 3], list(self.sd.irange(2, 8, reverse=True)))
+        self.assertEqual([5, 3], list(self.sd.irange(3, 7, (True, False), reverse=True)))
+        self.assertEqual([], list(self.sd.irange(10, 20)))
+
+    def test_sorted_dict_04(self):
+        """peekitem, popitem
+        """
+        self.assertEqual((9, "i"), self.sd.peekitem())
+        self.assertEqual((1, "a"), self.sd.peekitem(0))
+        self.assertEqual((5, "e"), self.sd.peekitem(2))
+        self.assertEqual((7, "g"), self.sd.peekitem(-2))
+        with self.assertRaises(IndexError):
+            self.sd.peekitem(5)
+
+        self.assertEqual((9, "i"), self.sd.popitem())
+        self.assertEqual((1, "a"), self.sd.popitem(0))
+        self.assertEqual([3, 5, 7], list(self.sd))
+
+    def test_sorted_dict_05(self):
+        """ランダムな操作で bisect を用いたリストの結果と一致すること
+        """
+        rnd: random.Random = random.Random(3)
+        sd: SortedDict = SortedDict()
+        keys: list[int] = []
+        for _ in range(500):
+            k: int = rnd.randrange(0, 200)
+            if k in sd and rnd.random() < 0.4:
+                del sd[k]
+                keys.remove(k)
+            elif k not in sd:
+                sd[k] = str(k)
+                bisect.insort(keys, k)
+
+            self.assertEqual(len(keys), len(sd))
+            t: int = rnd.randrange(-5, 205)
+            self.assertEqual(bisect.bisect_left(keys, t), sd.bisect_left(t))
+            self.assertEqual(bisect.bisect_right(keys, t), sd.bisect_right(t))
+            if len(keys) > 0:
+                i: int = rnd.randrange(0, len(keys))
+                self.assertEqual(keys[i], sd.peekitem(i)[0])
+        self.assertEqual(keys, list(sd))
+
+
+class TestSortedSet(unittest.TestCase):
+    """SortedSet に関するテスト
+    """
+
+    def test_sorted_set_01(self):
+        """要素の追加・取得・削除
+        """
+        ss: SortedSet = SortedSet(["b", "d", "a", "c", "b"])
+        self.assertEqual(4, len(ss))
+        self.assertEqual(["a", "b", "c", "d"], list(ss))
+        self.assertEqual("a", ss[0])
+        self.assertEqual("d", ss[-1])
+
+        ss.add("e")
+        ss.discard("z")
+        ss.remove("b")
+        with self.assertRaises(KeyError):
+            ss.remove("b")
+        self.assertEqual(["a", "c", "d", "e"], list(ss))
+
+        del ss[0]
+        self.assertEqual("e", ss.pop())
+        self.assertEqual(["c", "d"], list(ss))
+
+    def test_sorted_set_02(self):
+        """bisect_left, bisect_right, irange
+        """
+        ss: SortedSet = SortedSet(range(0, 20, 2))
+        self.assertEqual(3, ss.bisect_left(6))
+        self.assertEqual(4, ss.bisect_right(6))
+        self.assertEqual(4, ss.bisect_left(7))
+        self.assertEqual([6, 8, 10], list(ss.irange(5, 10)))
+        self.assertEqual([10, 8, 6], list(ss.irange(5, 10, reverse=True)))
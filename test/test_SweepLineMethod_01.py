@@ -237,3 +237,28 @@ class TestSweepLineMethod(unittest.TestCase):
 
         self.assertAlmostEqual(1.0, pts[0].x)
         self.assertAlmostEqual(1.0, pts[0].y)
+
+    def test_sweepline_12(self):
+        # 線分数: 5, 交点数: 2
+        #   ３本以上の線分が１点で交わる場合
+        #   交点通過後の線分の並び（傾きの順）が正しくないと、２つ目の交点が求められない
+        lst: list[LineSegment] = []
+        lst.append(LineSegment(Point(-2.0, -2.0), Point(2.0,  2.0)))
+        lst.append(LineSegment(Point(-2.0,  2.0), Point(2.0, -2.0)))
+        lst.append(LineSegment(Point(-2.0,  0.0), Point(2.0,  0.0)))
+        lst.append(LineSegment(Point(-2.0, -1.0), Point(2.0,  1.0)))
+        lst.append(LineSegment(Point( 0.5,  1.5), Point(3.0,  1.5)))
+
+        slm : SweepLineMethod = SweepLineMethod(lst)
+        slm.exec()
+
+        pts: list[Point] = slm.getCrossPoints()
+        
+        # 交点が想定のものかチェック
+        self.assertEqual(2, len(pts))
+
+        self.assertAlmostEqual(0.0, pts[0].x)
+        self.assertAlmostEqual(0.0, pts[0].y)
+
+        self.assertAlmostEqual(1.5, pts[1].x)
+        self.assertAlmostEqual(1.5, pts[1].y)
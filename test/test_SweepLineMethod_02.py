@@ -68,3 +68,36 @@ class TestSweepLineMethod(unittest.TestCase):
 
         self.assertAlmostEqual( 1.0, pts[2].x)
         self.assertAlmostEqual( 1.0, pts[2].y)
+
+    def test_sweepline_general_3(self):
+        # 同じ x 座標にある複数の走査線に平行な線分
+        #   その x 座標で終わる線分・始まる線分・通過する線分との交点
+        lst: list[LineSegment] = []
+        lst.append(LineSegment(Point( 0.0, 0.0), Point( 0.0, 1.0)))
+        lst.append(LineSegment(Point( 0.0, 3.0), Point( 0.0, 2.0)))
+        lst.append(LineSegment(Point( 0.0, 0.5), Point( 0.0, 2.5)))
+        lst.append(LineSegment(Point( 0.0, 5.0), Point( 0.0, 6.0)))
+        lst.append(LineSegment(Point(-1.0, 0.0), Point( 1.0, 2.0)))
+        lst.append(LineSegment(Point(-1.0, 3.0), Point( 0.0, 3.0)))
+        lst.append(LineSegment(Point( 0.0, 2.0), Point( 1.0, 4.0)))
+        lst.append(LineSegment(Point(-1.0, 4.0), Point( 1.0, 4.0)))
+
+        slm : SweepLineMethod = SweepLineMethod(lst)
+        slm.exec()
+
+        pts: list[Point] = slm.getCrossPoints()
+
+        # 交点が想定のものかチェック
+        self.assertEqual(4, len(pts))
+
+        self.assertAlmostEqual(0.0, pts[0].x)
+        self.assertAlmostEqual(1.0, pts[0].y)
+
+        self.assertAlmostEqual(0.0, pts[1].x)
+        self.assertAlmostEqual(2.0, pts[1].y)
+
+        self.assertAlmostEqual(0.0, pts[2].x)
+        self.assertAlmostEqual(3.0, pts[2].y)
+
+        self.assertAlmostEqual(1.0, pts[3].x)
+        self.assertAlmostEqual(4.0, pts[3].y)
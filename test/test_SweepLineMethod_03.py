@@ -0,0 +1,253 @@
+import math
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from Point import Point
+from LineSegment import CrossPointStatus, FrozenLineSegment, LineSegment
+from MemoryReport import SweepMemoryReport
+from SweepLineMethod import EventQueueType, SweepLineMethod, SweepStatusType
+
+
+class TestSweepLineMethod(unittest.TestCase):
+    """平面走査法に関するテスト
+
+    交点計算以外の機能に関するテストケース
+    """
+
+    def _create_lines(self) -> list[LineSegment]:
+        lst: list[LineSegment] = []
+        lst.append(LineSegment(Point(1.0,  2.0), Point(5.0, 2.0)))
+        lst.append(LineSegment(Point(1.0,  1.0), Point(4.0, 4.0)))
+        lst.append(LineSegment(Point(2.0,  3.0), Point(4.0, 0.0)))
+        lst.append(LineSegment(Point(3.0,  2.5), Point(5.0, 3.0)))
+        lst.append(LineSegment(Point(4.0,  3.0), Point(6.0, 2.0)))
+        lst.append(LineSegment(Point(4.5, -1.5), Point(6.0, 3.0)))
+        return lst
+
+    def _create_grid_lines(self, n: int, seed: int) -> list[LineSegment]:
+        rnd: random.Random = random.Random(seed)
+        return [LineSegment(Point(rnd.randint(0, 100), rnd.randint(0, 100)), Point(rnd.randint(0, 100), rnd.randint(0, 100)))
+                for _ in range(n)]
+
+    def _exec(self, lst: list[LineSegment], **kwargs) -> list[Point]:
+        slm : SweepLineMethod = SweepLineMethod(lst, **kwargs)
+        slm.exec()
+        return slm.getCrossPoints()
+
+    def _assertSamePoints(self, expected: list[Point], actual: list[Point]):
+        self.assertEqual(len(expected), len(actual))
+        for p1, p2 in zip(expected, actual):
+            self.assertAlmostEqual(p1.x, p2.x)
+            self.assertAlmostEqual(p1.y, p2.y)
+
+    def test_sweepline_event_queue(self):
+        # イベントキューの種類によらず、同じ交点が同じ順序で求められること
+        for lst in [self._create_lines()] + [self._create_grid_lines(15, seed) for seed in range(5)]:
+            expected: list[Point] = self._exec(lst, eventQueueType=EventQueueType.TREE)
+            self._assertSamePoints(expected, self._exec(lst, eventQueueType=EventQueueType.HEAP))
+            self._assertSamePoints(expected, self._exec(lst, eventQueueType=EventQueueType.BUCKET))
+
+    def test_sweepline_sweep_status(self):
+        # 走査線上の線分の管理方法によらず、同じ交点が同じ順序で求められること
+        for lst in [self._create_lines()] + [self._create_grid_lines(15, seed) for seed in range(5)]:
+            expected: list[Point] = self._exec(lst, sweepStatusType=SweepStatusType.TREE)
+            self._assertSamePoints(expected, self._exec(lst, sweepStatusType=SweepStatusType.SKIPLIST))
+            self._assertSamePoints(expected, self._exec(lst, sweepStatusType=SweepStatusType.BLOCKS))
+
+    def test_sweepline_sweep_status_collinear(self):
+        # 同一直線上の線分・重なる線分を含む場合も、走査線上の線分の管理方法によらず同じ交点が求められること
+        collinear: list[LineSegment] = [LineSegment(Point(*p1), Point(*p2)) for p1, p2 in [
+            ((0, 2), (4, 3)), ((2, 3), (4, 0)), ((0, 6), (4, 0)), ((0, 5), (6, 3)),
+            ((0, 1), (4, 1)), ((4, 3), (0, 0)), ((2, 4), (3, 0)), ((0, 4), (2, 6))]]
+        overlap: list[LineSegment] = [LineSegment(Point(*p1), Point(*p2)) for p1, p2 in [
+            ((0, 1), (4, 1)), ((2, 1), (6, 1)), ((0, 0), (4, 4)), ((1, 1), (3, 3)),
+            ((0, 4), (4, 0)), ((1, 3), (5, -1)), ((2, 0), (2, 4)), ((3, 5), (5, 0))]]
+        dense: list[list[LineSegment]] = []
+        for seed in range(20):
+            rnd: random.Random = random.Random(seed)
+            dense.append([LineSegment(Point(rnd.randint(0, 6), rnd.randint(0, 6)), Point(rnd.randint(0, 6), rnd.randint(0, 6)))
+                          for _ in range(8)])
+        for lst in [collinear, overlap] + [[ls for ls in d if ls.pt1 != ls.pt2] for d in dense]:
+            skiplist: list[Point] = self._exec(lst, sweepStatusType=SweepStatusType.SKIPLIST)
+            self._assertSamePoints(skiplist, self._exec(lst, sweepStatusType=SweepStatusType.TREE))
+            self._assertSamePoints(skiplist, self._exec(lst, sweepStatusType=SweepStatusType.BLOCKS))
+        self.assertEqual(12, len(self._exec(collinear, sweepStatusType=SweepStatusType.TREE)))
+
+    def test_sweepline_checked_pairs(self):
+        # 同じ線分の組の交点の確認は一度だけ行われ、走査終了後は確認済みの組が残らないこと
+        calls: list[tuple[int, int]] = []
+
+        # FrozenLineSegment はそのまま走査に用いられる
+        class CountingLineSegment(FrozenLineSegment):
+            def getCrossPoint(self, other):
+                calls.append((id(self), id(other)))
+                return super().getCrossPoint(other)
+
+        # 線分 0, 1 の間に短い線分 2, 3 が出入りし、0 と 1 が繰り返し隣り合う
+        lst: list[FrozenLineSegment] = []
+        lst.append(CountingLineSegment(Point(0.0, 0.0), Point(10.0, 0.0)))
+        lst.append(CountingLineSegment(Point(0.0, 5.0), Point(10.0, 5.0)))
+        lst.append(CountingLineSegment(Point(1.0, 2.0), Point(2.0, 2.0)))
+        lst.append(CountingLineSegment(Point(3.0, 3.0), Point(4.0, 3.0)))
+
+        slm : SweepLineMethod = SweepLineMethod(lst)
+        slm.exec()
+
+        self.assertEqual(0, len(slm.getCrossPoints()))
+        pairs: set[frozenset[int]] = {frozenset(c) for c in calls}
+        self.assertGreater(len(calls), 0)
+        self.assertEqual(len(pairs), len(calls))
+        self.assertEqual(0, len(slm._checkedPairs))
+
+    def test_sweepline_checked_pairs_limit(self):
+        # 確認済みの組が保持数を超えても、線分 ID からの対応を含めて保持数以下に保たれ、交点も変わらないこと
+        sizes: list[tuple[int, int]] = []
+
+        class LimitedSweepLineMethod(SweepLineMethod):
+            _CHECKED_PAIRS_MAX: int = 4
+
+            def _rememberPair(self, key, crossed):
+                super()._rememberPair(key, crossed)
+                sizes.append((len(self._checkedPairs), sum(len(keys) for keys in self._pairsByLine.values())))
+
+        lst: list[LineSegment] = self._create_grid_lines(40, 1)
+        expected: list[Point] = self._exec(lst)
+        slm: SweepLineMethod = LimitedSweepLineMethod(lst)
+        slm.exec()
+
+        self._assertSamePoints(expected, slm.getCrossPoints())
+        self.assertGreater(len(sizes), LimitedSweepLineMethod._CHECKED_PAIRS_MAX)
+        for npairs, nkeys in sizes:
+            self.assertLessEqual(npairs, LimitedSweepLineMethod._CHECKED_PAIRS_MAX)
+            self.assertEqual(2 * npairs, nkeys)
+        self.assertEqual(0, len(slm._checkedPairs))
+        self.assertEqual(0, len(slm._pairsByLine))
+
+    def test_sweepline_exact(self):
+        # 厳密な交点計算は指定した場合のみ行われること（整数座標の入力でも既定では行わない）
+        self.assertFalse(SweepLineMethod(self._create_grid_lines(5, 0))._exact)
+        self.assertFalse(SweepLineMethod(self._create_lines())._exact)
+        self.assertTrue(SweepLineMethod(self._create_grid_lines(5, 0), exact=True)._exact)
+
+        with self.assertRaises(RuntimeError):
+            SweepLineMethod(self._create_lines()).getExactCrossPoints()
+
+        # 大きな座標で、浮動小数点数では区別できないほど近い 2 交点を区別すること
+        n: int = 10**9
+        lst: list[LineSegment] = []
+        lst.append(LineSegment(Point(0, 0), Point(2 * n, 2 * n + 2)))
+        lst.append(LineSegment(Point(0, 2 * n), Point(2 * n, 0)))
+        lst.append(LineSegment(Point(0, 2 * n + 1), Point(2 * n, -1)))
+
+        # 線分 0 と 1, 0 と 2 の交点の x 座標の差は約 1 / (4n) で、浮動小数点数では同じ値になる
+        x1: Fraction = Fraction(2 * n * n, 2 * n + 1)
+        x2: Fraction = Fraction(n * (2 * n + 1), 2 * n + 2)
+        self.assertEqual(float(x1), float(x2))
+        expected: set[tuple[Fraction, Fraction]] = {(x1, 2 * n - x1), (x2, x2 * (n + 1) / n), (Fraction(n), Fraction(n))}
+
+        for eqt in EventQueueType:
+            for sst in SweepStatusType:
+                slm: SweepLineMethod = SweepLineMethod(lst, eventQueueType=eqt, sweepStatusType=sst, exact=True)
+                slm.exec()
+                pts: list[Point] = slm.getExactCrossPoints()
+                self.assertEqual(expected, {(pt.x, pt.y) for pt in pts})
+                self.assertEqual(3, len(slm.getCrossPoints()))
+
+    def test_sweepline_decimal_grid(self):
+        # 0.1 刻みの座標で端点が他の線分に十進数では乗る場合、浮動小数点数の計算の走査は許容誤差により交点とすること
+        pts: list[tuple[Fraction, Fraction]] = [(Fraction(1, 10), Fraction(1, 10)), (Fraction(5, 10), Fraction(3, 10)),
+                                                (Fraction(3, 10), Fraction(2, 10)), (Fraction(4, 10), Fraction(5, 10))]
+        flt: list[LineSegment] = [LineSegment(Point(float(pts[i][0]), float(pts[i][1])), Point(float(pts[i + 1][0]), float(pts[i + 1][1])))
+                                  for i in (0, 2)]
+        dec: list[LineSegment] = [LineSegment(Point(*pts[i]), Point(*pts[i + 1])) for i in (0, 2)]
+
+        # ２進数の値では端点は線分に乗らない
+        self.assertIsNone(flt[0].getCrossPoint(flt[1]))
+        for eqt in EventQueueType:
+            for sst in SweepStatusType:
+                actual: list[Point] = self._exec(flt, eventQueueType=eqt, sweepStatusType=sst)
+                self._assertSamePoints([Point(0.3, 0.2)], actual)
+                # 厳密な計算では、２進数の値・十進数の値のとおりに判定する
+                self.assertEqual(0, len(self._exec(flt, eventQueueType=eqt, sweepStatusType=sst, exact=True)))
+                self._assertSamePoints([Point(0.3, 0.2)], self._exec(dec, eventQueueType=eqt, sweepStatusType=sst, exact=True))
+
+        # 十進数の値で求めた交点は、浮動小数点数の計算の走査でもすべて求められること
+        for seed in range(30):
+            rnd: random.Random = random.Random(seed)
+            raw: list[tuple[int, int, int, int]] = [(rnd.randint(0, 10), rnd.randint(0, 10), rnd.randint(0, 10), rnd.randint(0, 10))
+                                                    for _ in range(10)]
+            raw = [r for r in raw if r[:2] != r[2:]]
+            flt = [LineSegment(Point(x1 / 10, y1 / 10), Point(x2 / 10, y2 / 10)) for x1, y1, x2, y2 in raw]
+            dec = [LineSegment(Point(Fraction(x1, 10), Fraction(y1, 10)), Point(Fraction(x2, 10), Fraction(y2, 10)))
+                   for x1, y1, x2, y2 in raw]
+            actual = self._exec(flt)
+            for pt in self._exec(dec, exact=True):
+                self.assertTrue(any(math.isclose(pt.x, p.x, abs_tol=1e-9) and math.isclose(pt.y, p.y, abs_tol=1e-9) for p in actual))
+
+    def test_sweepline_shared_segments(self):
+        # 同じ線分のリストを複数のスレッドの走査で共有しても、結果が変わらず線分も変更されないこと
+        lst: list[LineSegment] = [LineSegment(Point(p.x + 0.5, p.y * 0.75), Point(q.x + 0.25, q.y * 0.5))
+                                  for p, q in ((ls.pt1, ls.pt2) for ls in self._create_grid_lines(40, 0))]
+        expected: list[Point] = self._exec(lst)
+
+        def job(i: int) -> list[Point]:
+            return self._exec(lst, eventQueueType=list(EventQueueType)[i % 3], sweepStatusType=list(SweepStatusType)[i % 3])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results: list[list[Point]] = list(executor.map(job, range(12)))
+
+        for actual in results:
+            self._assertSamePoints(expected, actual)
+        for ls in lst:
+            self.assertEqual(CrossPointStatus.NOT_CALCULATED, ls.status)
+
+    def test_sweepline_reset(self):
+        # reset により、同じインスタンスで別の線分のリストの交点を求められること
+        jobs: list[list[LineSegment]] = [self._create_lines(), self._create_grid_lines(20, 1), [], self._create_grid_lines(30, 2)]
+        for eqt, sst in zip(EventQueueType, SweepStatusType):
+            slm: SweepLineMethod = SweepLineMethod(jobs[0], eventQueueType=eqt, sweepStatusType=sst)
+            slm.exec()
+            first: list[Point] = slm.getCrossPoints()
+            self.assertEqual(5, len(first))
+
+            # 再度実行しても、交点が重複しないこと
+            slm.exec()
+            self._assertSamePoints(first, slm.getCrossPoints())
+
+            # 厳密な計算に切り替えた場合は、イベントキューのみ作り直す
+            A = slm._A
+            B = None
+            for lst in jobs[1:]:
+                slm.reset(lst, exact=True)
+                slm.exec()
+                self._assertSamePoints(self._exec(lst, eventQueueType=eqt, sweepStatusType=sst, exact=True), slm.getCrossPoints())
+                self.assertTrue(slm._exact)
+                self.assertIs(A, slm._A)
+                if B is not None:
+                    self.assertIs(B, slm._B)
+                B = slm._B
+
+            # 浮動小数点数による計算に戻す
+            slm.reset(jobs[0], exact=False)
+            slm.exec()
+            self.assertFalse(slm._exact)
+            self._assertSamePoints(first, slm.getCrossPoints())
+            # それまでに返した交点のリストは変更されないこと
+            self.assertEqual(5, len(first))
+
+    def test_sweepline_memory_report(self):
+        # メモリ使用量の見積もり
+        slm : SweepLineMethod = SweepLineMethod(self._create_lines())
+        slm.exec()
+
+        rep: SweepMemoryReport = slm.memory_report()
+
+        self.assertEqual(6, rep.segmentsCount)
+        self.assertEqual(5, rep.crossesCount)
+        self.assertGreater(rep.segmentsBytes, 0)
+        self.assertGreater(rep.crossesBytes, 0)
+        self.assertIsNotNone(rep.statusReport)
+        self.assertIsNotNone(rep.eventReport)
+        self.assertEqual(rep.segmentsBytes + rep.crossesBytes + rep.statusReport.totalBytes + rep.eventReport.totalBytes,
+                         rep.totalBytes)
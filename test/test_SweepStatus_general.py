@@ -0,0 +1,223 @@
+import random
+import unittest
+from Point import Point
+from LineSegment import CrossPointStatus, LineSegment
+from SweepStatus import ANode, compareANode, BlockListSweepStatus, SkipListSweepStatus, StatusHandle, Sweepline, SweepStatus, TreeSweepStatus
+
+class TestSweepStatus(unittest.TestCase):
+    """走査線上の線分の管理に関するテスト
+
+    各実装が 2-3木による実装と同じ結果となることを確認する
+    """
+
+    def setUp(self):
+        self.sweepline: Sweepline = Sweepline(0.0)
+        # ブロックの分割が起こるように、ブロックの大きさを小さくする
+        self.load: int = BlockListSweepStatus._LOAD
+        BlockListSweepStatus._LOAD = 4
+
+    def tearDown(self):
+        BlockListSweepStatus._LOAD = self.load
+
+    def _create_statuses(self) -> list[SweepStatus]:
+        return [
+            TreeSweepStatus(self.sweepline),
+            SkipListSweepStatus(self.sweepline, seed=1),
+            BlockListSweepStatus(self.sweepline)]
+
+    def _ys(self, st: SweepStatus, an_lo: ANode, an_hi: ANode) -> list[float]:
+        return [h.cargo.ls.pt1.y for h in st.range(an_lo, an_hi)]
+
+    def test_sweep_status_01(self):
+        # 追加・探索・削除・前後の線分・範囲
+        rnd: random.Random = random.Random(2)
+        ys: list[int] = rnd.sample(range(1000), 200)
+        ans: list[ANode] = [ANode(LineSegment(Point(-10, y), Point(10, y + 0.5))) for y in ys]
+        an_lo: ANode = ANode(LineSegment(Point(-10, -1), Point(10, -1)))
+        an_hi: ANode = ANode(LineSegment(Point(-10, 2000), Point(10, 2000)))
+
+        for st in self._create_statuses():
+            with self.subTest(status=type(st).__name__):
+                handles: dict[int, StatusHandle] = {}
+                for y, an in zip(ys, ans):
+                    handles[y] = st.insert(an)
+                # 同じ線分の追加は既存の要素を返す
+                self.assertIs(handles[ys[0]], st.insert(ANode(ans[0].ls)))
+                self.assertEqual(sorted(ys), self._ys(st, an_lo, an_hi))
+
+                for y in ys[:100]:
+                    st.delete(st.search(ANode(LineSegment(Point(-10, y), Point(10, y + 0.5)))))
+                remains: list[int] = sorted(ys[100:])
+                self.assertEqual(remains, self._ys(st, an_lo, an_hi))
+                self.assertIsNone(st.search(ans[0]))
+
+                for i, y in enumerate(remains):
+                    h: StatusHandle = handles[y]
+                    prev: StatusHandle | None = st.predecessor(h)
+                    succ: StatusHandle | None = st.successor(h)
+                    self.assertEqual(remains[i - 1] if i > 0 else None, None if prev is None else prev.cargo.ls.pt1.y)
+                    self.assertEqual(remains[i + 1] if i + 1 < len(remains) else None, None if succ is None else succ.cargo.ls.pt1.y)
+
+                an_mid_lo: ANode = ANode(LineSegment(Point(-10, remains[10]), Point(10, remains[10] + 0.5)))
+                an_mid_hi: ANode = ANode(LineSegment(Point(-10, remains[20] + 0.3), Point(10, remains[20] + 0.3)))
+                self.assertEqual(remains[10:21], self._ys(st, an_mid_lo, an_mid_hi))
+
+                st.removeAll()
+                self.assertEqual([], self._ys(st, an_lo, an_hi))
+
+    def test_sweep_status_02(self):
+        # 交点での入れ替え
+        #   x = 0 で交わる 2 線分と、その上下の線分
+        lower: ANode = ANode(LineSegment(Point(-10, -5), Point(10, -5)))
+        ls1: ANode = ANode(LineSegment(Point(-10, -1), Point(10, 1)))
+        ls2: ANode = ANode(LineSegment(Point(-10, 1), Point(10, -1)))
+        upper: ANode = ANode(LineSegment(Point(-10, 5), Point(10, 5)))
+
+        for st in self._create_statuses():
+            with self.subTest(status=type(st).__name__):
+                self.sweepline.x = -5
+                h_lower: StatusHandle = st.insert(lower)
+                h1: StatusHandle = st.insert(ls1)
+                h2: StatusHandle = st.insert(ls2)
+                h_upper: StatusHandle = st.insert(upper)
+                self.assertIs(h2, st.successor(h1))
+
+                # 交点通過後
+                self.sweepline.x = 5
+                self.assertGreater(st.compare(ls1, ls2), 0)
+                st.swap(h1, h2)
+                self.assertIs(h1, st.successor(h2))
+                self.assertIs(h_upper, st.successor(h1))
+                self.assertIs(h_lower, st.predecessor(h2))
+                self.assertIs(h1, st.search(ls1))
+
+                st.delete(h1)
+                self.assertIs(h_upper, st.successor(h2))
+                self.sweepline.x = -5
+
+    def test_sweep_status_04(self):
+        # 連続する並びの反転（ブロックをまたぐ場合を含む）
+        ans: list[ANode] = [ANode(LineSegment(Point(-10, y), Point(10, y))) for y in range(20)]
+        an_lo: ANode = ANode(LineSegment(Point(-10, -5), Point(10, -5)))
+        an_hi: ANode = ANode(LineSegment(Point(-10, 50), Point(10, 50)))
+
+        for st in self._create_statuses():
+            with self.subTest(status=type(st).__name__):
+                handles: list[StatusHandle] = [st.insert(an) for an in ans]
+                st.reverse(handles[3], handles[15])
+                self.assertEqual(list(range(3)) + list(range(15, 2, -1)) + list(range(16, 20)), self._ys(st, an_lo, an_hi))
+                self.assertIs(handles[14], st.successor(handles[15]))
+                self.assertIs(handles[16], st.successor(handles[3]))
+                self.assertIs(handles[2], st.predecessor(handles[15]))
+
+    def test_sweep_status_03(self):
+        # 位置を指定した追加と、条件による二分
+        ans: list[ANode] = [ANode(LineSegment(Point(-10, y), Point(10, y))) for y in range(40)]
+
+        for st in self._create_statuses():
+            with self.subTest(status=type(st).__name__):
+                self.assertEqual((None, None), st.bisect(lambda an: an.ls.pt1.y >= 0))
+
+                # 偶数を末尾に追加したのち、奇数をその直後に追加
+                prev: StatusHandle | None = None
+                evens: list[StatusHandle] = []
+                for an in ans[0::2]:
+                    prev = st.insertAfter(prev, an)
+                    evens.append(prev)
+                for h, an in zip(evens, ans[1::2]):
+                    st.insertAfter(h, an)
+                st.insertAfter(None, ANode(LineSegment(Point(-10, -1), Point(10, -1))))
+
+                an_lo: ANode = ANode(LineSegment(Point(-10, -5), Point(10, -5)))
+                an_hi: ANode = ANode(LineSegment(Point(-10, 50), Point(10, 50)))
+                self.assertEqual(list(range(-1, 40)), self._ys(st, an_lo, an_hi))
+
+                below, above = st.bisect(lambda an: an.ls.pt1.y >= 10.5)
+                self.assertEqual(10, below.cargo.ls.pt1.y)
+                self.assertEqual(11, above.cargo.ls.pt1.y)
+                below, above = st.bisect(lambda an: an.ls.pt1.y >= -3)
+                self.assertIsNone(below)
+                self.assertEqual(-1, above.cargo.ls.pt1.y)
+                below, above = st.bisect(lambda an: an.ls.pt1.y >= 100)
+                self.assertEqual(39, below.cargo.ls.pt1.y)
+                self.assertIsNone(above)
+
+    def test_sweep_status_05(self):
+        # 走査線上の y 座標のキャッシュ
+        calls: list[float] = []
+
+        class CountingLineSegment(LineSegment):
+            def calcYWithStatus(self, x: float) -> tuple[float | None, CrossPointStatus]:
+                calls.append(x)
+                return super().calcYWithStatus(x)
+
+        ls: LineSegment = CountingLineSegment(Point(0, 0), Point(10, 10))
+        sweepline: Sweepline = Sweepline(2.0)
+        self.assertEqual(2.0, sweepline.calcY(ls))
+        self.assertEqual(2.0, sweepline.calcY(ls))
+        self.assertEqual([2.0], calls)
+
+        # 同じ x 座標を設定した場合はキャッシュを保持する
+        sweepline.x = 2.0
+        self.assertEqual(2.0, sweepline.calcY(ls))
+        self.assertEqual([2.0], calls)
+
+        # x 座標を変更した場合は再計算する
+        sweepline.x = 3.0
+        self.assertEqual(3.0, sweepline.calcY(ls))
+        self.assertEqual(3.0, sweepline.lineY(ls))
+        self.assertEqual([2.0, 3.0], calls)
+
+        # 線分外の場合はエラーとし、キャッシュしない
+        sweepline.x = 11.0
+        with self.assertRaises(RuntimeError):
+            sweepline.calcY(ls)
+        self.assertEqual(11.0, sweepline.lineY(ls))
+
+    def test_sweep_status_06(self):
+        # 走査線上で y 座標が同じ線分の比較（傾きによる判定）
+        sweepline: Sweepline = Sweepline(0.0)
+        up: ANode = ANode(LineSegment(Point(-1, -1), Point(1, 1)))
+        down: ANode = ANode(LineSegment(Point(-1, 1), Point(1, -1)))
+        # 左端点が走査線上にある線分
+        start: ANode = ANode(LineSegment(Point(0, 0), Point(1, 2)))
+        # 同一直線上の線分
+        part: ANode = ANode(LineSegment(Point(0, 0), Point(1, 1)))
+
+        # 直前の順
+        self.assertEqual(-1, compareANode(up, down, sweepline))
+        self.assertEqual(1, compareANode(down, up, sweepline))
+        self.assertEqual(-1, compareANode(start, up, sweepline))
+        self.assertEqual(0, compareANode(up, part, sweepline))
+
+        # 直後の順
+        self.assertEqual(1, compareANode(up, down, sweepline, True))
+        self.assertEqual(-1, compareANode(down, up, sweepline, True))
+        self.assertEqual(1, compareANode(start, up, sweepline, True))
+        self.assertEqual(0, compareANode(up, part, sweepline, True))
+
+        # y 座標が異なる場合は傾きによらない
+        sweepline.x = 0.5
+        self.assertEqual(1, compareANode(up, down, sweepline))
+        self.assertEqual(1, compareANode(up, down, sweepline, True))
+
+    def test_sweep_status_07(self):
+        # 左端点が他の線分上にある線分の追加（走査線の直後の順）
+        base: ANode = ANode(LineSegment(Point(-1, -1), Point(1, 1)))
+        ans: list[ANode] = [ANode(LineSegment(Point(0, 0), Point(1, y))) for y in (2, -1, 0.5)]
+        part: ANode = ANode(LineSegment(Point(0, 0), Point(2, 2)))
+
+        for st in self._create_statuses():
+            with self.subTest(status=type(st).__name__):
+                h_base: StatusHandle = st.insert(base)
+                for an in ans:
+                    st.insert(an)
+                # 同一直線上で重なる線分は追加しない
+                self.assertIs(h_base, st.insert(part))
+
+                ys: list[float] = []
+                h: StatusHandle | None = st.bisect(lambda an: True)[1]
+                while h is not None:
+                    ys.append(h.cargo.ls.pt2.y)
+                    h = st.successor(h)
+                self.assertEqual([-1, 0.5, 1, 2], ys)
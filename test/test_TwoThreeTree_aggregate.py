@@ -0,0 +1,105 @@
+import random
+import unittest
+from TwoThreeTree import Aggregator, TwoThreeTree
+from test.TestClasses import MyLeaf, NodeForTest, myleaf_ctor
+
+class TestTwoThreeTree(unittest.TestCase):
+    """2-3 木に関する aggregate 操作のテスト
+    """
+
+    def setUp(self):
+        # 2-3木を作成してテスト
+        #   キーの合計を集約値とする
+        self.tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](
+            myleaf_ctor,
+            Aggregator[NodeForTest, float](0.0, lambda a, b: a + b, lambda v: v.key))
+
+        self.tht.insert(NodeForTest("01", 2.0))
+        self.tht.insert(NodeForTest("02", 5.0))
+        self.tht.insert(NodeForTest("03", 7.0))
+        self.tht.insert(NodeForTest("04", 9.0))
+
+        self.tht.insert(NodeForTest("05", 4.0))
+        self.tht.insert(NodeForTest("06", 1.0))
+        self.tht.insert(NodeForTest("07", 3.0))
+        self.tht.insert(NodeForTest("08", 10.0))
+        self.tht.insert(NodeForTest("09", 8.0))
+
+    def tearDown(self):
+        pass
+
+    def _brute(self, t1: float, t2: float) -> float:
+        return sum(float(lf.val) for lf in self.tht.range(NodeForTest("a", t1), NodeForTest("b", t2)))
+
+    def test_aggregate_tree_01(self):
+        """範囲の集約値
+
+        [min, max] 内の要素の合計
+        """
+        self.assertAlmostEqual(49.0, self.tht.root.agg_val)
+        self.assertAlmostEqual(24.0, self.tht.aggregate(NodeForTest("a", 6.0), NodeForTest("b", 9.5)))
+        self.assertAlmostEqual(24.0, self.tht.aggregate(NodeForTest("a", 4.0), NodeForTest("b", 8.0)))
+        self.assertAlmostEqual(49.0, self.tht.aggregate(NodeForTest("a", 0.0), NodeForTest("b", 11.0)))
+        self.assertAlmostEqual(0.0, self.tht.aggregate(NodeForTest("a", 5.5), NodeForTest("b", 6.5)))
+        self.assertAlmostEqual(0.0, self.tht.aggregate(NodeForTest("a", 11.0), NodeForTest("b", 12.0)))
+
+    def test_aggregate_tree_02(self):
+        """範囲の集約値
+
+        全ての範囲の組み合わせで range の結果と一致すること
+        """
+        for i in range(0, 23):
+            for j in range(i, 23):
+                self.assertAlmostEqual(self._brute(i * 0.5, j * 0.5),
+                                       self.tht.aggregate(NodeForTest("a", i * 0.5), NodeForTest("b", j * 0.5)))
+
+    def test_aggregate_tree_03(self):
+        """範囲の集約値
+
+        削除および入れ替え後も集約値が維持されること
+        """
+        self.tht.delete(NodeForTest("02", 5.0))
+        self.tht.delete(NodeForTest("06", 1.0))
+        self.assertAlmostEqual(43.0, self.tht.root.agg_val)
+        self.assertAlmostEqual(16.0, self.tht.aggregate(NodeForTest("a", 0.0), NodeForTest("b", 7.0)))
+
+        # 非可換な集約値（葉の並び）で入れ替えを確認
+        tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](
+            myleaf_ctor,
+            Aggregator[NodeForTest, str]("", lambda a, b: a + b, lambda v: v.id))
+        for i, k in enumerate([3.0, 1.0, 2.0, 5.0, 4.0]):
+            tht.insert(NodeForTest(str(i), k))
+        self.assertEqual("12043", tht.root.agg_val)
+
+        lf1 = tht.search(NodeForTest("x", 2.0))
+        lf2 = tht.search(NodeForTest("x", 3.0))
+        tht.swap(lf1, lf2)
+        self.assertEqual("10243", tht.root.agg_val)
+
+        tht.removeAll()
+        self.assertEqual("", tht.root.agg_val)
+
+    def test_aggregate_tree_04(self):
+        """範囲の集約値
+
+        ランダムな追加・削除を繰り返しても range の結果と一致すること
+        """
+        rnd: random.Random = random.Random(1)
+        tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](
+            myleaf_ctor,
+            Aggregator[NodeForTest, int](0, lambda a, b: a + b, lambda v: 1))
+        keys: set[int] = set()
+        for _ in range(300):
+            k: int = rnd.randrange(0, 100)
+            if k in keys and rnd.random() < 0.5:
+                tht.delete(NodeForTest("x", float(k)))
+                keys.discard(k)
+            else:
+                tht.insert(NodeForTest("x", float(k)))
+                keys.add(k)
+
+            t1: int = rnd.randrange(-5, 105)
+            t2: int = rnd.randrange(t1, 110)
+            expected: int = len([x for x in keys if t1 <= x <= t2])
+            self.assertEqual(expected, tht.aggregate(NodeForTest("a", t1 - 0.5), NodeForTest("b", t2 + 0.5)))
+            self.assertEqual(len(keys), tht.root.agg_val)
@@ -0,0 +1,94 @@
+import random
+import unittest
+from TwoThreeTree import Leaf, TwoThreeTree
+from test.TestClasses import MyLeaf, NodeForTest, myleaf_ctor
+
+class TestTwoThreeTree(unittest.TestCase):
+    """2-3 木に関する挿入操作のテスト
+
+    位置を指定した挿入 (insertAfter) と条件による探索 (searchFirst) のテスト
+    """
+
+    def setUp(self):
+        self.tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](myleaf_ctor)
+
+    def tearDown(self):
+        pass
+
+    def _keys(self) -> list[float]:
+        keys: list[float] = []
+        lf: Leaf | None = self.tht.minimum()
+        while lf is not None:
+            keys.append(lf.cargo.key)
+            lf = self.tht.successor(lf)
+        return keys
+
+    def test_insert_after_1(self):
+        """空の木, 先頭, 末尾, 途中への追加
+        """
+        lf1: Leaf = self.tht.insertAfter(None, NodeForTest("01", 1.0))
+        self.assertEqual([1.0], self._keys())
+
+        lf3: Leaf = self.tht.insertAfter(lf1, NodeForTest("03", 3.0))
+        self.tht.insertAfter(None, NodeForTest("00", 0.0))
+        self.tht.insertAfter(lf1, NodeForTest("02", 2.0))
+        self.tht.insertAfter(lf3, NodeForTest("04", 4.0))
+        self.assertEqual([0.0, 1.0, 2.0, 3.0, 4.0], self._keys())
+        self.assertEqual(5, self.tht.leafSize)
+
+        # 比較による探索と整合していること
+        for k in [0.0, 1.0, 2.0, 3.0, 4.0]:
+            self.assertIsNotNone(self.tht.search(NodeForTest("", k)))
+
+    def test_insert_after_2(self):
+        """ランダムな位置への追加で、順序と木の構造が保たれること
+        """
+        rnd: random.Random = random.Random(5)
+        keys: list[float] = []
+        leaves: list[Leaf] = []
+        for i in range(300):
+            # 隣り合う要素の間の値を、位置を指定して追加する
+            pos: int = rnd.randint(0, len(keys))
+            lo: float = keys[pos - 1] if pos > 0 else -1000.0
+            hi: float = keys[pos] if pos < len(keys) else 1000.0
+            k: float = (lo + hi) / 2
+            lf: Leaf = self.tht.insertAfter(leaves[pos - 1] if pos > 0 else None, NodeForTest(str(i), k))
+            keys.insert(pos, k)
+            leaves.insert(pos, lf)
+        self.assertEqual(keys, self._keys())
+        for k in keys:
+            self.assertIsNotNone(self.tht.search(NodeForTest("", k)))
+
+    def test_insert_after_3(self):
+        """値が一致する葉を含む位置への追加
+
+        値が一致する別の葉と取り違えずに、指定した葉の直後に追加されること
+        """
+        rnd: random.Random = random.Random(7)
+        ids: list[str] = []
+        leaves: list[Leaf] = []
+        for i in range(100):
+            pos: int = rnd.randint(0, len(ids))
+            lf: Leaf = self.tht.insertAfter(leaves[pos - 1] if pos > 0 else None, NodeForTest(f"{i:02d}", 1.0))
+            ids.insert(pos, lf.cargo.id)
+            leaves.insert(pos, lf)
+
+        actual: list[str] = []
+        lf: Leaf | None = self.tht.minimum()
+        while lf is not None:
+            actual.append(lf.cargo.id)
+            lf = self.tht.successor(lf)
+        self.assertEqual(ids, actual)
+
+    def test_search_first(self):
+        """条件を満たす最初の葉
+        """
+        for k in [5.0, 1.0, 9.0, 3.0, 7.0, 2.0]:
+            self.tht.insert(NodeForTest("", k))
+
+        self.assertEqual(1.0, self.tht.searchFirst(lambda v: v.key >= 0).cargo.key)
+        self.assertEqual(3.0, self.tht.searchFirst(lambda v: v.key >= 2.5).cargo.key)
+        self.assertEqual(5.0, self.tht.searchFirst(lambda v: v.key > 3).cargo.key)
+        self.assertEqual(9.0, self.tht.searchFirst(lambda v: v.key >= 9).cargo.key)
+        self.assertIsNone(self.tht.searchFirst(lambda v: v.key > 9))
+        self.assertIsNone(TwoThreeTree[MyLeaf, NodeForTest](myleaf_ctor).searchFirst(lambda v: True))
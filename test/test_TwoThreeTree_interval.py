@@ -0,0 +1,69 @@
+import random
+import unittest
+from Point import Point
+from LineSegment import LineSegment
+from TwoThreeTree import TwoThreeTree
+from test.TestClasses import SegmentForTest, SegmentLeaf, segment_interval, segmentleaf_ctor
+
+class TestTwoThreeTree(unittest.TestCase):
+    """2-3 木の区間木モードに関するテスト
+    """
+
+    def setUp(self):
+        # 線分の x 方向の範囲を区間とする 2-3木を作成してテスト
+        self.tht: TwoThreeTree = TwoThreeTree[SegmentLeaf, SegmentForTest](segmentleaf_ctor, func_interval=segment_interval)
+
+        self.tht.insert(SegmentForTest(0, LineSegment(Point(0.0, 0.0), Point(2.0, 1.0))))
+        self.tht.insert(SegmentForTest(1, LineSegment(Point(5.0, 1.0), Point(1.0, 3.0))))
+        self.tht.insert(SegmentForTest(2, LineSegment(Point(3.0, 0.0), Point(4.0, 2.0))))
+        self.tht.insert(SegmentForTest(3, LineSegment(Point(6.0, 0.0), Point(9.0, 0.0))))
+        self.tht.insert(SegmentForTest(4, LineSegment(Point(2.5, 1.0), Point(2.5, 3.0))))
+        self.tht.insert(SegmentForTest(5, LineSegment(Point(7.0, 2.0), Point(8.0, 4.0))))
+
+    def tearDown(self):
+        pass
+
+    def test_interval_tree_01(self):
+        """x を含む区間の抽出
+        """
+        self.assertAlmostEqual(9.0, self.tht.root.max_end)
+
+        self.assertEqual([0, 1], [lf.cargo.id for lf in self.tht.stab(1.5)])
+        self.assertEqual([0, 1], [lf.cargo.id for lf in self.tht.stab(2.0)])
+        self.assertEqual([1, 4], [lf.cargo.id for lf in self.tht.stab(2.5)])
+        self.assertEqual([1, 2], [lf.cargo.id for lf in self.tht.stab(3.5)])
+        self.assertEqual([3, 5], [lf.cargo.id for lf in self.tht.stab(7.5)])
+        self.assertEqual([], [lf.cargo.id for lf in self.tht.stab(5.5)])
+        self.assertEqual([], [lf.cargo.id for lf in self.tht.stab(-1.0)])
+
+    def test_interval_tree_02(self):
+        """[lo, hi] と重なる区間の抽出
+        """
+        self.assertEqual([1, 4, 2], [lf.cargo.id for lf in self.tht.overlapping(2.2, 3.0)])
+        self.assertEqual([1, 3], [lf.cargo.id for lf in self.tht.overlapping(4.5, 6.0)])
+        self.assertEqual([0, 1, 4, 2, 3, 5], [lf.cargo.id for lf in self.tht.overlapping(-1.0, 10.0)])
+
+    def test_interval_tree_03(self):
+        """追加・削除後の区間の抽出
+
+        ランダムな追加・削除を繰り返しても全件探索の結果と一致すること
+        """
+        rnd: random.Random = random.Random(2)
+        tht: TwoThreeTree = TwoThreeTree[SegmentLeaf, SegmentForTest](segmentleaf_ctor, func_interval=segment_interval)
+        segs: dict[int, SegmentForTest] = {}
+        for i in range(200):
+            if len(segs) > 0 and rnd.random() < 0.3:
+                sid: int = rnd.choice(list(segs.keys()))
+                tht.delete(segs.pop(sid))
+            else:
+                x: float = rnd.uniform(0, 100)
+                seg: SegmentForTest = SegmentForTest(i, LineSegment(Point(x, 0.0), Point(x + rnd.uniform(0, 20), 1.0)))
+                tht.insert(seg)
+                segs[i] = seg
+
+            lo: float = rnd.uniform(-10, 110)
+            hi: float = lo + rnd.uniform(0, 10)
+            expected: list[int] = sorted(
+                [s.id for s in segs.values() if s.ls.minx <= hi and lo <= s.ls.maxx],
+                key=lambda sid: (segs[sid].ls.minx, sid))
+            self.assertEqual(expected, [lf.cargo.id for lf in tht.overlapping(lo, hi)])
@@ -0,0 +1,63 @@
+import sys
+import unittest
+from TwoThreeTree import TwoThreeTree
+from MemoryReport import TreeMemoryReport, deepSizeOf
+from test.TestClasses import MyLeaf, NodeForTest, myleaf_ctor
+
+class TestTwoThreeTree(unittest.TestCase):
+    """2-3 木に関する memory_report のテスト
+    """
+
+    def setUp(self):
+        # 2-3木を作成してテスト
+        self.tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](myleaf_ctor)
+        for i in range(100):
+            self.tht.insert(NodeForTest(f"{i:03d}", float(i)))
+
+    def tearDown(self):
+        pass
+
+    def test_memory_report_01(self):
+        """全数でのメモリ使用量
+        """
+        rep: TreeMemoryReport = self.tht.memory_report()
+
+        self.assertEqual(self.tht.leafSize, rep.leafCount)
+        self.assertEqual(self.tht.size - self.tht.leafSize, rep.internalCount)
+        self.assertEqual(self.tht.height, rep.height)
+        self.assertGreater(rep.bytesPerLeaf, 0)
+        self.assertGreater(rep.bytesPerInternal, 0)
+
+        # cargo は参照先も含めて数える
+        self.assertAlmostEqual(deepSizeOf(NodeForTest("050", 50.0)), rep.bytesPerCargo, delta=16)
+        self.assertEqual(
+            round((rep.bytesPerLeaf + rep.bytesPerCargo) * rep.leafCount + rep.bytesPerInternal * rep.internalCount),
+            rep.totalBytes)
+        self.assertEqual(1.0, rep.sampleRate)
+
+    def test_memory_report_02(self):
+        """サンプリングによるメモリ使用量の見積もり
+        """
+        full: TreeMemoryReport = self.tht.memory_report()
+        rep: TreeMemoryReport = self.tht.memory_report(0.5, seed=1)
+
+        # 要素数は全数
+        self.assertEqual(full.leafCount, rep.leafCount)
+        self.assertEqual(full.internalCount, rep.internalCount)
+        # 1 要素あたりのバイト数は同程度
+        self.assertAlmostEqual(full.bytesPerLeaf, rep.bytesPerLeaf, delta=full.bytesPerLeaf * 0.2)
+        self.assertAlmostEqual(full.totalBytes, rep.totalBytes, delta=full.totalBytes * 0.2)
+
+        with self.assertRaises(ValueError):
+            self.tht.memory_report(0.0)
+
+    def test_memory_report_03(self):
+        """共有オブジェクトを二重に数えないこと
+        """
+        shared: list[int] = [1, 2, 3]
+        seen: set[int] = set()
+        first: int = deepSizeOf([shared], seen)
+        second: int = deepSizeOf([shared], seen)
+        self.assertGreater(first, second)
+        # 2 回目は外側のリストのみ数える
+        self.assertEqual(sys.getsizeof([shared]), second)
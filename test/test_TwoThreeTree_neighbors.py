@@ -0,0 +1,132 @@
+import unittest
+from TwoThreeTree import TwoThreeTree
+from test.TestClasses import MyLeaf, NodeForTest, myleaf_ctor
+
+class TestTwoThreeTree(unittest.TestCase):
+    """2-3 木に関する neighbors 操作のテスト
+    """
+
+    def setUp(self):
+        # 2-3木を作成してテスト
+        self.tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](myleaf_ctor)
+
+        self.tht.insert(NodeForTest("01", 2.0))
+        self.tht.insert(NodeForTest("02", 5.0))
+        self.tht.insert(NodeForTest("03", 7.0))
+        self.tht.insert(NodeForTest("04", 9.0))
+
+        self.tht.insert(NodeForTest("05", 4.0))
+        self.tht.insert(NodeForTest("06", 1.0))
+        self.tht.insert(NodeForTest("07", 3.0))
+        self.tht.insert(NodeForTest("08", 10.0))
+        self.tht.insert(NodeForTest("09", 8.0))
+
+    def tearDown(self):
+        pass
+
+    def test_neighbors_tree_01(self):
+        """前後の要素の取得
+
+        target と一致する要素がある場合
+        """
+        below, hit, above = self.tht.neighbors(NodeForTest("a", 5.0), 2, 3)
+
+        self.assertIsNotNone(hit)
+        self.assertAlmostEqual(5.0, float(hit.val))
+
+        self.assertEqual(2, len(below))
+        self.assertAlmostEqual(3.0, float(below[0].val))
+        self.assertAlmostEqual(4.0, float(below[1].val))
+
+        self.assertEqual(3, len(above))
+        self.assertAlmostEqual(7.0, float(above[0].val))
+        self.assertAlmostEqual(8.0, float(above[1].val))
+        self.assertAlmostEqual(9.0, float(above[2].val))
+
+    def test_neighbors_tree_02(self):
+        """前後の要素の取得
+
+        target と一致する要素がない場合
+        """
+        below, hit, above = self.tht.neighbors(NodeForTest("a", 6.0), 2, 2)
+
+        self.assertIsNone(hit)
+
+        self.assertEqual(2, len(below))
+        self.assertAlmostEqual(4.0, float(below[0].val))
+        self.assertAlmostEqual(5.0, float(below[1].val))
+
+        self.assertEqual(2, len(above))
+        self.assertAlmostEqual(7.0, float(above[0].val))
+        self.assertAlmostEqual(8.0, float(above[1].val))
+
+    def test_neighbors_tree_03(self):
+        """前後の要素の取得
+
+        target が最小要素より小さい、最大要素より大きい場合
+        """
+        below, hit, above = self.tht.neighbors(NodeForTest("a", 0.5), 3, 2)
+
+        self.assertIsNone(hit)
+        self.assertEqual(0, len(below))
+        self.assertEqual(2, len(above))
+        self.assertAlmostEqual(1.0, float(above[0].val))
+        self.assertAlmostEqual(2.0, float(above[1].val))
+
+        below, hit, above = self.tht.neighbors(NodeForTest("b", 11.0), 2, 3)
+
+        self.assertIsNone(hit)
+        self.assertEqual(2, len(below))
+        self.assertAlmostEqual(9.0, float(below[0].val))
+        self.assertAlmostEqual(10.0, float(below[1].val))
+        self.assertEqual(0, len(above))
+
+    def test_neighbors_tree_04(self):
+        """前後の要素の取得
+
+        要素数が取得数より少ない場合
+        """
+        below, hit, above = self.tht.neighbors(NodeForTest("a", 2.5), 5, 10)
+
+        self.assertIsNone(hit)
+        self.assertEqual([1.0, 2.0], [float(lf.val) for lf in below])
+        self.assertEqual([3.0, 4.0, 5.0, 7.0, 8.0, 9.0, 10.0], [float(lf.val) for lf in above])
+
+    def test_neighbors_tree_05(self):
+        """前後の要素の取得
+
+        全ての位置で、範囲の抽出結果と一致すること
+        """
+        keys: list[float] = [1.0, 2.0, 3.0, 4.0, 5.0, 7.0, 8.0, 9.0, 10.0]
+        for i in range(0, 23):
+            t: float = i * 0.5
+            below, hit, above = self.tht.neighbors(NodeForTest("a", t), 2, 2)
+
+            self.assertEqual([k for k in keys if k < t][-2:], [float(lf.val) for lf in below])
+            self.assertEqual([k for k in keys if k > t][:2], [float(lf.val) for lf in above])
+            if t in keys:
+                self.assertAlmostEqual(t, float(hit.val))
+            else:
+                self.assertIsNone(hit)
+
+    def test_neighbors_tree_06(self):
+        """前後の要素の取得
+
+        要素が空および 1 個の場合
+        """
+        tht: TwoThreeTree = TwoThreeTree[MyLeaf, NodeForTest](myleaf_ctor)
+        below, hit, above = tht.neighbors(NodeForTest("a", 1.0), 1, 1)
+        self.assertEqual(0, len(below))
+        self.assertIsNone(hit)
+        self.assertEqual(0, len(above))
+
+        tht.insert(NodeForTest("01", 2.0))
+        below, hit, above = tht.neighbors(NodeForTest("a", 1.0), 1, 1)
+        self.assertEqual(0, len(below))
+        self.assertIsNone(hit)
+        self.assertEqual([2.0], [float(lf.val) for lf in above])
+
+        below, hit, above = tht.neighbors(NodeForTest("a", 3.0), 1, 1)
+        self.assertEqual([2.0], [float(lf.val) for lf in below])
+        self.assertIsNone(hit)
+        self.assertEqual(0, len(above))
@@ -272,3 +272,18 @@ class TestTwoThreeTree(unittest.TestCase):
         self.assertEqual(1, self.tht.height)
 
         self.tht.visualizeGraph(True, "sample_left_only_root_" + datetime.datetime.now().isoformat())
+
+    def test_remove_tree_14(self):
+        """葉を指定して削除
+
+        探索を行わずに、search で得た葉を削除する
+        """
+        lf: Leaf | None = self.tht.search(NodeForTest("05", 4.0))
+        self.assertIsNotNone(lf)
+        self.tht.deleteLeaf(lf)
+
+        self.assertEqual(15, self.tht.size)
+        self.assertEqual(8, self.tht.leafSize)
+        self.assertIsNone(self.tht.search(NodeForTest("05", 4.0)))
+        self.assertEqual([1.0, 2.0, 3.0, 5.0, 7.0, 8.0, 9.0, 10.0],
+                         [l.cargo.key for l in self.tht.range(NodeForTest("", 0.0), NodeForTest("", 20.0))])
@@ -77,3 +77,50 @@ class TestTwoThreeTree(unittest.TestCase):
         self.assertEqual(4, self.tht.height)
 
         self.tht.visualizeGraph(True, "test_swap_tree_" + datetime.datetime.now().isoformat())
+
+    def test_reverse_tree_01(self):
+        """連続する要素の並びの反転
+
+        異なる親にまたがる並びを反転し、最大要素が更新されること
+        """
+        nd1 = self.tht.search(NodeForTest("07", 3.0))
+        nd2 = self.tht.search(NodeForTest("09", 8.0))
+        if nd1 is None or nd2 is None:
+            raise RuntimeError("invalid search")
+
+        self.tht.reverse(nd1, nd2)
+
+        keys: list[float] = []
+        lf: Leaf | None = self.tht.minimum()
+        while lf is not None:
+            keys.append(lf.cargo.key)
+            lf = self.tht.successor(lf)
+        self.assertEqual([1.0, 2.0, 8.0, 7.0, 5.0, 4.0, 3.0, 9.0, 10.0], keys)
+        self.assertEqual(9, self.tht.leafSize)
+
+        # 元に戻すと、探索できること
+        self.tht.reverse(nd2, nd1)
+        for k in [1.0, 2.0, 3.0, 4.0, 5.0, 7.0, 8.0, 9.0, 10.0]:
+            self.assertIsNotNone(self.tht.search(NodeForTest("", k)))
+
+    def test_reverse_tree_02(self):
+        """値が一致する葉を含む並びの反転
+
+        値が一致する別の葉と取り違えずに反転できること
+        """
+        nd1 = self.tht.search(NodeForTest("07", 3.0))
+        nd2 = self.tht.search(NodeForTest("05", 4.0))
+        if nd1 is None or nd2 is None:
+            raise RuntimeError("invalid search")
+        # 同じキーの葉を追加（3.0, 3.0, 4.0 の並び）
+        nd3 = self.tht.insertAfter(nd1, NodeForTest("10", 3.0))
+
+        self.tht.reverse(nd1, nd2)
+
+        ids: list[str] = []
+        lf: Leaf | None = self.tht.minimum()
+        while lf is not None:
+            ids.append(lf.cargo.id)
+            lf = self.tht.successor(lf)
+        self.assertEqual(["06", "01", "05", "10", "07", "02", "03", "09", "04", "08"], ids)
+        self.assertIs(nd1, self.tht.successor(nd3))
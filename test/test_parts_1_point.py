@@ -1,7 +1,9 @@
 
 import unittest
 
-from Point import Point
+from fractions import Fraction
+
+from Point import ExactPoint, Point
 
 
 class TestPoint(unittest.TestCase):
@@ -34,3 +36,18 @@ class TestPoint(unittest.TestCase):
 
         self.assertNotEqual(id(pt3), id(pt2))
 
+
+    def test_point_4(self):
+        # 厳密な座標の点は許容誤差なしで比較される
+        pt1: ExactPoint = ExactPoint(Fraction(1, 3), 2)
+        pt2: ExactPoint = ExactPoint(Fraction(2, 6), 2)
+        pt3: ExactPoint = ExactPoint(Fraction(1, 3) + Fraction(1, 10**20), 2)
+
+        self.assertEqual(pt1, pt2)
+        self.assertEqual(hash(pt1), hash(pt2))
+        self.assertNotEqual(pt1, pt3)
+
+        pt4: Point = pt1.toPoint()
+        self.assertNotIsInstance(pt4, ExactPoint)
+        self.assertAlmostEqual(1 / 3, pt4.x)
+        self.assertEqual(2.0, pt4.y)
@@ -1,8 +1,9 @@
 
 import unittest
+from fractions import Fraction
 
-from Point import Point
-from LineSegment import CrossPointStatus, LineSegment
+from Point import ExactPoint, Point
+from LineSegment import CrossPointStatus, ExactLineSegment, FrozenLineSegment, LineSegment
 
 
 class TestLineSegment(unittest.TestCase):
@@ -173,3 +174,139 @@ class TestLineSegment(unittest.TestCase):
         pt = self.ls.getCrossPoint(ls)
         self.assertEqual(CrossPointStatus.ON_LINE_INCLUDED, self.ls.status)
         self.assertIsNone(pt)
+
+    def test_linesegment_15(self):
+        """変更不可の線分が LineSegment と同じ値を持つこと
+        """
+        fls: FrozenLineSegment = FrozenLineSegment.fromLineSegment(self.ls)
+
+        self.assertEqual((self.ls.a, self.ls.b, self.ls.c), (fls.a, fls.b, fls.c))
+        self.assertEqual((self.ls.minx, self.ls.maxx, self.ls.miny, self.ls.maxy), (fls.minx, fls.maxx, fls.miny, fls.maxy))
+        self.assertIs(self.ls.minxPt, fls.minxPt)
+        self.assertIs(self.ls.maxyPt, fls.maxyPt)
+        self.assertEqual(1, fls.slope)
+        self.assertEqual(-2, fls.intercept)
+        self.assertEqual(self.ls.calcY(2), fls.calcY(2))
+        self.assertIsNone(fls.calcY(4))
+        self.assertEqual(self.ls.calcX(0.5), fls.calcX(0.5))
+
+        with self.assertRaises(AttributeError):
+            fls.a = 0
+        self.assertFalse(hasattr(fls, "__dict__"))
+
+    def test_linesegment_16(self):
+        """変更不可の線分の交点が LineSegment と同じであること
+        """
+        fls: FrozenLineSegment = FrozenLineSegment.fromLineSegment(self.ls)
+        for pt1, pt2 in [(Point(1, 1), Point(3, -1)), (Point(2, 2), Point(3, 3)), (Point(2, 0), Point(4, 2)), (Point(4, 0), Point(5, 3))]:
+            ls: LineSegment = LineSegment(pt1, pt2)
+            expected: Point | None = self.ls.getCrossPoint(ls)
+            for other in (ls, FrozenLineSegment.fromLineSegment(ls)):
+                actual: Point | None = fls.getCrossPoint(other)
+                if expected is None:
+                    self.assertIsNone(actual)
+                else:
+                    self.assertEqual((expected.x, expected.y), (actual.x, actual.y))
+
+        vls: FrozenLineSegment = FrozenLineSegment(Point(0, 0), Point(0, 1))
+        self.assertEqual(float("inf"), vls.slope)
+        self.assertIsNone(vls.calcY(0))
+        with self.assertRaises(RuntimeError):
+            vls.calcYIfExist(0)
+
+    def test_linesegment_17(self):
+        """厳密な座標の線分の交点が分数で求められること
+        """
+        els: ExactLineSegment = ExactLineSegment.fromLineSegment(LineSegment(Point(0, 0), Point(3, 1)))
+        other: ExactLineSegment = ExactLineSegment(ExactPoint(0, 1), ExactPoint(1, 0))
+        self.assertEqual(Fraction(1, 3), els.slope)
+        self.assertEqual(0, els.intercept)
+
+        pt: ExactPoint | None = els.getCrossPoint(other)
+        self.assertIsInstance(pt, ExactPoint)
+        self.assertEqual((Fraction(3, 4), Fraction(1, 4)), (pt.x, pt.y))
+        self.assertTrue(els.isOnLineByLineSegment(pt))
+        self.assertTrue(other.isOnLineByLineSegment(pt))
+        self.assertEqual(Fraction(1, 3), els.calcY(1))
+        self.assertEqual(Fraction(3, 2), els.calcX(Fraction(1, 2)))
+        self.assertIsNone(els.calcY(4))
+
+        # 平行な線分, 線分の範囲外で交わる線分
+        self.assertIsNone(els.getCrossPoint(ExactLineSegment(ExactPoint(0, 1), ExactPoint(3, 2))))
+        self.assertIsNone(els.getCrossPoint(ExactLineSegment(ExactPoint(4, 0), ExactPoint(5, 3))))
+
+        # 浮動小数点数の座標は値を正確に表す分数に変換される
+        fls: ExactLineSegment = ExactLineSegment.fromLineSegment(LineSegment(Point(0.1, 0), Point(1, 1)))
+        self.assertEqual(Fraction(0.1), fls.pt1.x)
+
+    def test_linesegment_18(self):
+        """端点の座標で求めた値が、丸め誤差により線分外とされないこと
+        """
+        ls: LineSegment = LineSegment(Point(0.4, 0.1), Point(0.2, 1.7))
+        fls: FrozenLineSegment = FrozenLineSegment.fromLineSegment(ls)
+        for seg in (ls, fls):
+            self.assertEqual(1.7, seg.calcY(0.2))
+            self.assertEqual(0.1, seg.calcY(0.4))
+            self.assertEqual(0.2, seg.calcX(1.7))
+            self.assertIsNone(seg.calcY(0.41))
+            self.assertTrue(seg.isOnLineByLineSegment(Point(0.4, 0.1)))
+            self.assertTrue(seg.isOnLineByLineSegment(Point(0.2, 1.7)))
+            self.assertFalse(seg.isOnLineByLineSegment(Point(0.2, 1.7 + 2.0 ** -52)))
+
+    def test_linesegment_19(self):
+        """外接矩形と向きによる事前判定で、交点の状態が変わらないこと
+        """
+        cases: list[tuple[LineSegment, CrossPointStatus]] = [
+            (LineSegment(Point(4, 0), Point(5, 3)), CrossPointStatus.OUT_OF_LINESEGMENT),   # 外接矩形が重ならない
+            (LineSegment(Point(2, 1), Point(3, 3)), CrossPointStatus.OUT_OF_LINESEGMENT),   # 両端点が同じ側にある
+            (LineSegment(Point(0, 2), Point(2, -1)), CrossPointStatus.EXIST),
+            (LineSegment(Point(2, 0), Point(4, 3)), CrossPointStatus.EXIST),                # 端点で接する
+            (LineSegment(Point(0, 0), Point(2, 2)), CrossPointStatus.PARALLEL),
+            (LineSegment(Point(4, 2), Point(5, 3)), CrossPointStatus.ON_LINE),
+        ]
+        for ls, status in cases:
+            fls: FrozenLineSegment = FrozenLineSegment.fromLineSegment(self.ls)
+            self.assertEqual(status == CrossPointStatus.EXIST, self.ls.getCrossPoint(ls) is not None)
+            self.assertEqual(status, self.ls.status)
+            self.assertEqual(status == CrossPointStatus.EXIST, fls.getCrossPoint(ls) is not None)
+
+    def test_linesegment_20(self):
+        """交点が丸め誤差で線分外とされないこと
+        """
+        for pt1, pt2, pt3, pt4, expected in [
+                (Point(1.1, 0.2), Point(1.1, 1.7), Point(1.1, 1.5), Point(1.6, 1.2), (1.1, 1.5)),
+                (Point(1.6, 0.4), Point(0.9, 0.4), Point(0.5, 0.1), Point(1.9, 0.8), (1.1, 0.4))]:
+            ls1: LineSegment = LineSegment(pt1, pt2)
+            ls2: LineSegment = LineSegment(pt3, pt4)
+            for seg1, seg2 in ((ls1, ls2), (FrozenLineSegment.fromLineSegment(ls1), FrozenLineSegment.fromLineSegment(ls2))):
+                pt: Point | None = seg1.getCrossPoint(seg2)
+                self.assertIsNotNone(pt)
+                self.assertEqual(pt.x, expected[0])
+                self.assertAlmostEqual(pt.y, expected[1])
+
+    def test_linesegment_21(self):
+        """交点の状態を変更しない計算が、状態を変更する計算と同じ結果を返すこと
+        """
+        for pt1, pt2 in [(Point(1, 1), Point(3, -1)), (Point(0, 0), Point(2, 2)), (Point(4, 2), Point(5, 3)),
+                         (Point(2, 0), Point(5, 3)), (Point(4, 0), Point(5, 3)), (Point(1.5, -0.5), Point(2, 0))]:
+            ls: LineSegment = LineSegment(pt1, pt2)
+            pt, status = self.ls.crossPointWithStatus(ls)
+            self.assertEqual(CrossPointStatus.NOT_CALCULATED, self.ls.status)
+            self.assertEqual(FrozenLineSegment.fromLineSegment(self.ls).crossPointWithStatus(ls)[1], status)
+
+            expected: Point | None = self.ls.getCrossPoint(ls)
+            self.assertEqual(self.ls.status, status)
+            self.assertEqual(expected is None, pt is None)
+            if pt is not None:
+                self.assertEqual((expected.x, expected.y), (pt.x, pt.y))
+            self.ls.resetStatus()
+
+        fls: FrozenLineSegment = FrozenLineSegment.fromLineSegment(self.ls)
+        hls: LineSegment = LineSegment(Point(0, 1), Point(2, 1))
+        for seg in (self.ls, fls):
+            self.assertEqual((0.0, CrossPointStatus.EXIST), seg.calcYWithStatus(2))
+            self.assertEqual((None, CrossPointStatus.OUT_OF_LINESEGMENT), seg.calcYWithStatus(4))
+            self.assertEqual((2.5, CrossPointStatus.EXIST), seg.calcXWithStatus(0.5))
+        self.assertEqual(CrossPointStatus.NOT_CALCULATED, self.ls.status)
+        self.assertEqual((None, CrossPointStatus.PARALLEL), hls.calcXWithStatus(1))
+        self.assertEqual(CrossPointStatus.NOT_CALCULATED, hls.status)
@@ -0,0 +1,59 @@
+
+import random
+import unittest
+
+from Point import Point
+from PointIndex import PointIndex
+
+
+class TestPointIndex(unittest.TestCase):
+    """点の索引クラスに関するテスト
+    """
+
+    def test_pointindex_1(self):
+        idx: PointIndex = PointIndex()
+        pt: Point = Point(0.5, 0.5)
+        idx.add(pt)
+
+        self.assertEqual(1, len(idx))
+        self.assertIs(pt, idx.find(Point(0.5, 0.5)))
+        self.assertIn(Point(0.5 + 1e-12, 0.5 - 1e-12), idx)
+        self.assertNotIn(Point(0.5 + 1e-6, 0.5), idx)
+
+        idx.remove(pt)
+        self.assertEqual(0, len(idx))
+        self.assertNotIn(Point(0.5, 0.5), idx)
+
+    def test_pointindex_2(self):
+        # 0 および負の座標
+        idx: PointIndex = PointIndex()
+        idx.add(Point(0.0, -1.0))
+
+        self.assertIn(Point(0.0, -1.0 - 1e-12), idx)
+        self.assertNotIn(Point(1e-300, -1.0), idx)
+        self.assertNotIn(Point(0.0, 1.0), idx)
+
+    def test_pointindex_3(self):
+        # 2 のべき乗の境界をまたぐ場合
+        idx: PointIndex = PointIndex()
+        idx.add(Point(1.0, 4.0))
+
+        self.assertIn(Point(1.0 - 1e-12, 4.0 - 1e-12), idx)
+        self.assertIn(Point(1.0 + 1e-12, 4.0 + 1e-12), idx)
+
+    def test_pointindex_4(self):
+        # ランダムな点で Point.__eq__ による線形探索と一致すること
+        rnd: random.Random = random.Random(4)
+        idx: PointIndex = PointIndex()
+        pts: list[Point] = []
+        for _ in range(300):
+            pt: Point = Point(rnd.uniform(-10, 10), rnd.uniform(-10, 10))
+            pts.append(pt)
+            idx.add(pt)
+
+        for _ in range(300):
+            base: Point = rnd.choice(pts)
+            scale: float = rnd.choice([0.0, 1e-13, 1e-10, 5e-9, 1e-8, 1e-3])
+            q: Point = Point(base.x * (1 + rnd.uniform(-1, 1) * scale), base.y * (1 + rnd.uniform(-1, 1) * scale))
+            expected: bool = next((p for p in pts if p == q), None) is not None
+            self.assertEqual(expected, q in idx)
@@ -0,0 +1,73 @@
+import random
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from Point import Point
+from Predicates import crossSign, orientation
+
+
+class TestPredicates(unittest.TestCase):
+    """幾何述語に関するテスト
+    """
+
+    def _exactOrientation(self, p: Point, q: Point, r: Point) -> int:
+        det: Fraction = ((Fraction(q.x) - Fraction(p.x)) * (Fraction(r.y) - Fraction(p.y))
+                         - (Fraction(q.y) - Fraction(p.y)) * (Fraction(r.x) - Fraction(p.x)))
+        return (det > 0) - (det < 0)
+
+    def test_orientation_1(self):
+        self.assertEqual(1, orientation(Point(0, 0), Point(1, 0), Point(0, 1)))
+        self.assertEqual(-1, orientation(Point(0, 0), Point(0, 1), Point(1, 0)))
+        self.assertEqual(0, orientation(Point(0, 0), Point(1, 1), Point(3, 3)))
+        self.assertEqual(0, orientation(Point(0.1, 0.1), Point(0.3, 0.3), Point(0.7, 0.7)))
+        self.assertEqual(0, orientation(Point(1.0, 2.0), Point(1.0, 2.0), Point(5.0, -3.0)))
+        self.assertEqual(1, orientation(Point(Fraction(1, 3), 0), Point(1, 0), Point(0, Fraction(1, 10**30))))
+
+    def test_orientation_2(self):
+        # 直線にほぼ乗る点でも、浮動小数点演算の丸めによらず厳密な向きが求められること
+        rnd: random.Random = random.Random(0)
+        for _ in range(2000):
+            p: Point = Point(rnd.uniform(-1, 1), rnd.uniform(-1, 1))
+            q: Point = Point(rnd.uniform(-1, 1), rnd.uniform(-1, 1))
+            t: float = rnd.uniform(-2, 2)
+            r: Point = Point(p.x + t * (q.x - p.x), p.y + t * (q.y - p.y))
+            self.assertEqual(self._exactOrientation(p, q, r), orientation(p, q, r))
+
+        # 仮数部の最下位ビットだけ直線からずれた点
+        p = Point(0.5, 0.5)
+        q = Point(12.0, 12.0)
+        for i in range(64):
+            r = Point(24.0, 24.0 + i * 2.0 ** -48)
+            self.assertEqual(self._exactOrientation(p, q, r), orientation(p, q, r))
+            r = Point(0.5 + i * 2.0 ** -53, 0.5)
+            self.assertEqual(self._exactOrientation(p, q, r), orientation(p, q, r))
+
+    def test_orientation_3(self):
+        # numpy のスカラーの座標でも、誤差限界による判定と分数による計算が行われること
+        p: Point = Point(np.float64(0.5), np.float64(0.5))
+        q: Point = Point(np.float64(12.0), np.float64(12.0))
+        for i in range(64):
+            r: Point = Point(np.float64(24.0), np.float64(24.0 + i * 2.0 ** -48))
+            self.assertEqual(self._exactOrientation(p, q, r), orientation(p, q, r))
+            r = Point(np.float64(0.5 + i * 2.0 ** -53), np.float64(0.5))
+            self.assertEqual(self._exactOrientation(p, q, r), orientation(p, q, r))
+
+        self.assertEqual(0, orientation(Point(np.int64(0), np.int64(0)), Point(np.int64(1), np.int64(1)), Point(np.int64(3), np.int64(3))))
+        self.assertEqual(1, orientation(Point(np.int64(0), np.int64(0)), Point(np.int64(1), np.int64(0)), Point(np.int64(0), np.int64(1))))
+        # int64 の演算では外積 2 ** 64 が桁あふれして 0 となる
+        with np.errstate(over="ignore"):
+            self.assertEqual(1, orientation(Point(np.int64(0), np.int64(0)), Point(np.int64(2 ** 62), np.int64(0)), Point(np.int64(0), np.int64(4))))
+
+    def test_crossSign_1(self):
+        self.assertEqual(0, crossSign(Point(0, 0), Point(2, 1), Point(5, 5), Point(9, 7)))
+        self.assertEqual(0, crossSign(Point(0.25, 0.5), Point(0.75, 1.5), Point(1.0, 1.0), Point(0.5, 0.0)))
+        # 0.1, 0.3 等は２進数で正確に表せないため、浮動小数点数の座標としては平行でない
+        self.assertEqual(-1, crossSign(Point(0.1, 0.2), Point(0.3, 0.6), Point(1.0, 1.0), Point(0.5, -0.5)))
+        self.assertEqual(1, crossSign(Point(0, 0), Point(1, 0), Point(5, 5), Point(5, 6)))
+        self.assertEqual(-1, crossSign(Point(0, 0), Point(1, 0), Point(5, 6), Point(5, 5)))
+
+        # ほぼ平行な線分
+        self.assertEqual(1, crossSign(Point(0.0, 0.0), Point(1e8, 1e8), Point(0.0, 0.0), Point(1e8, 1e8 + 2.0 ** -26)))
+        self.assertEqual(-1, crossSign(Point(0.0, 0.0), Point(1e8, 1e8), Point(0.0, 0.0), Point(1e8 + 2.0 ** -26, 1e8)))